@@ -43,6 +43,9 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'professionals.instrumentation.QueryMetricsMiddleware',
+    'professionals.compression.CompressionMiddleware',
+    'professionals.replica.ReadReplicaMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -80,10 +83,43 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # A file rather than memory, so processes spawned by a test (the
+        # import command's workers) can open it. Deleted after the run.
+        'TEST': {'NAME': BASE_DIR / 'db-test.sqlite3'},
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# List responses are keyed by a version counter that every write bumps, so
+# entries never need a TTL; the local-memory backend culls old versions.
+# LocMemCache is per process: with several workers, point this at a shared
+# backend (Redis, Memcached or DatabaseCache) so a bump reaches all of them.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 1000},
+    }
+}
+
+
+# Django REST framework
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        # JSONRenderer that reports its time to the request instrumentation.
+        'professionals.instrumentation.TimedJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# A query shape repeated this many times in one request is logged and
+# counted as a likely N+1 pattern (professionals.instrumentation).
+QUERY_REPEAT_THRESHOLD = 10
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -123,3 +159,20 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 CORS_ALLOW_ALL_ORIGINS = True
+
+# Threads in each process's local pool for ?async=true bulk imports
+# (professionals.jobs). Job state lives in the database; no broker is needed.
+BULK_IMPORT_WORKERS = 2
+# When a pool starts, pending jobs older than this are requeued and running
+# jobs without progress for this long are marked failed.
+BULK_IMPORT_STALE_SECONDS = 300
+
+# Bulk ingestion limits (professionals.limits); None disables a limit.
+BULK_MAX_ITEMS = 10_000
+BULK_MAX_BYTES = 10 * 1024 * 1024
+# Django refuses to read larger bodies (2.5 MB by default) with its own 400,
+# before the views can check BULK_MAX_BYTES, so the two must agree.
+DATA_UPLOAD_MAX_MEMORY_SIZE = BULK_MAX_BYTES
+# Token bucket of rows per client, kept in the 'default' cache.
+BULK_ROWS_PER_MINUTE = 60_000
+BULK_ROW_BURST = 20_000
@@ -0,0 +1,47 @@
+"""
+Lean profile for API-only workers: no admin, sessions, auth, templates or
+browsable API, JSON in and out.
+
+    DJANGO_SETTINGS_MODULE=backend.settings_api gunicorn backend.wsgi
+
+Serves everything under ``/api/`` exactly as the full profile does, to
+anonymous clients; the admin stays on workers running ``backend.settings``.
+It layers over any profile by swapping the first import, e.g. for
+``backend.settings_production``. Migrations still run from the full profile,
+which owns the contrib tables.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [
+    'corsheaders',
+    'professionals',
+]
+
+MIDDLEWARE = [
+    'professionals.instrumentation.QueryMetricsMiddleware',
+    'professionals.compression.CompressionMiddleware',
+    'professionals.replica.ReadReplicaMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'backend.urls_api'
+
+TEMPLATES = []
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': ['professionals.instrumentation.TimedJSONRenderer'],
+    'DEFAULT_PARSER_CLASSES': ['rest_framework.parsers.JSONParser'],
+    # No django.contrib.auth: every request is anonymous, and request.user
+    # is None rather than AnonymousUser.
+    'DEFAULT_AUTHENTICATION_CLASSES': [],
+    'DEFAULT_PERMISSION_CLASSES': ['rest_framework.permissions.AllowAny'],
+    'UNAUTHENTICATED_USER': None,
+}
+
+AUTH_PASSWORD_VALIDATORS = []
+
+# Messages are English only; skips loading translation catalogs.
+USE_I18N = False
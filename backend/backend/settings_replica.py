@@ -0,0 +1,32 @@
+"""
+Production profile plus a read replica for list, search and export GETs.
+
+    DJANGO_SETTINGS_MODULE=backend.settings_replica python manage.py refresh_read_replica --interval 5
+    DJANGO_SETTINGS_MODULE=backend.settings_replica gunicorn backend.wsgi
+
+The replica is a second SQLite file, ``db-replica.sqlite3``, holding a
+snapshot of ``db.sqlite3`` that ``refresh_read_replica`` retakes every
+``--interval`` seconds. Take the first snapshot before serving traffic.
+"""
+
+from .settings_production import *  # noqa: F401,F403
+from .settings_production import BASE_DIR, DATABASES, SQLITE_PRAGMAS
+
+DATABASES = {
+    **DATABASES,
+    'replica': {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / 'db-replica.sqlite3',
+        # Reads only: no IMMEDIATE transactions, and SQLite refuses writes.
+        'OPTIONS': {'timeout': 20},
+        'SQLITE_PRAGMAS': {**SQLITE_PRAGMAS, 'query_only': 1},
+        # Tests run against the default database alone.
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+DATABASE_ROUTERS = ['professionals.replica.ReadReplicaRouter']
+PROFESSIONALS_READ_DATABASE = 'replica'
+# How long a client that wrote keeps reading from default. Keep it above the
+# refresh interval so it never sees a snapshot older than its own write.
+PROFESSIONALS_REPLICA_PIN_SECONDS = 15
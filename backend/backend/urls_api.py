@@ -0,0 +1,6 @@
+"""URL configuration for the API-only profile (``backend.settings_api``)."""
+from django.urls import include, path
+
+urlpatterns = [
+    path('api/', include('professionals.urls')),
+]
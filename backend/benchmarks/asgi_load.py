@@ -0,0 +1,140 @@
+"""
+In-process ASGI load test: list-endpoint latency under concurrent bulk imports.
+
+Drives ``backend.asgi.application`` directly (no server, no sockets) with a
+set of reader tasks hitting the list endpoint and importer tasks posting
+bulk batches, once against the sync DRF views and once against the async
+variants, and reports list latency percentiles for each.
+
+    cd backend
+    python -m benchmarks.asgi_load --rows 5000 --readers 8 --importers 2 --duration 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from itertools import count
+
+from .common import make_payload, percentile, seed, setup_django, temporary_database
+
+ENDPOINTS = {
+    "sync": ("/api/professionals/", "/api/professionals/bulk/"),
+    "async": ("/api/async/professionals/", "/api/async/professionals/bulk/"),
+}
+
+
+async def call(app, method, path, query="", body=b""):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    pending = [{"type": "http.request", "body": body, "more_body": False}]
+    response = {"status": None}
+
+    async def receive():
+        if pending:
+            return pending.pop()
+        # Never disconnect; Django cancels this wait once the response is sent.
+        await asyncio.Future()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+
+    await app(scope, receive, send)
+    return response["status"]
+
+
+async def run_mode(app, mode, args, keys):
+    list_url, bulk_url = ENDPOINTS[mode]
+    deadline = time.perf_counter() + args.duration
+    latencies, imported, failures = [], [0], [0]
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status = await call(app, "GET", list_url, query=args.query)
+            latencies.append(time.perf_counter() - start)
+            failures[0] += status != 200
+
+    async def importer():
+        while time.perf_counter() < deadline:
+            payload = make_payload(args.batch, next(keys) * args.batch)
+            status = await call(app, "POST", bulk_url, body=json.dumps(payload).encode())
+            if status == 200:
+                imported[0] += args.batch
+            else:
+                failures[0] += 1
+
+    tasks = [reader() for _ in range(args.readers)]
+    tasks += [importer() for _ in range(args.importers)]
+    started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    ms = [value * 1000 for value in latencies]
+    return {
+        "mode": mode,
+        "list_requests": len(ms),
+        "list_p50_ms": round(percentile(ms, 50), 2),
+        "list_p95_ms": round(percentile(ms, 95), 2),
+        "list_p99_ms": round(percentile(ms, 99), 2),
+        "list_max_ms": round(max(ms, default=0), 2),
+        "imported_rows_per_s": round(imported[0] / elapsed, 1),
+        "failures": failures[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=5000, help="rows seeded before the run")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--importers", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=500, help="rows per bulk request")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per mode")
+    parser.add_argument("--query", default="source=partner", help="list query string")
+    parser.add_argument("--modes", nargs="+", choices=sorted(ENDPOINTS), default=["sync", "async"])
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings
+
+    from backend.asgi import application
+
+    # Measure the database path, not cache hits between imports.
+    dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    results = []
+    with override_settings(CACHES=dummy_cache), temporary_database():
+        seed(args.rows)
+        # Importer keys start past the seeded rows and never repeat across modes.
+        keys = count(args.rows // args.batch + 1)
+        for mode in args.modes:
+            results.append(asyncio.run(run_mode(application, mode, args, keys)))
+
+    columns = list(results[0])
+    print("  ".join(f"{c:>20}" for c in columns))
+    for row in results:
+        print("  ".join(f"{row[c]!s:>20}" for c in columns))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Bulk import throughput by transaction chunk size.
+
+Posts the same batch to ``/api/professionals/bulk/`` once per
+``?chunk_size=`` (each chunk is one transaction, so one commit and, on
+SQLite, one fsync), then once with ``?atomic=all``. Every run starts from an
+empty scratch database and inserts, then posts the batch again to update.
+
+    cd backend
+    python -m benchmarks.chunking --rows 10000 --chunk-sizes 1 10 100 1000 5000
+    python -m benchmarks.chunking --settings backend.settings_production
+"""
+
+import argparse
+import logging
+import time
+
+from .common import make_payload, setup_django, temporary_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1, 10, 100, 1000, 5000])
+    parser.add_argument("--settings", default="backend.settings", help="settings module to run under")
+    args = parser.parse_args()
+
+    setup_django(args.settings)
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment
+
+    setup_test_environment()
+    # Single-row chunks trip the N+1 warning on every request.
+    logging.getLogger("professionals.instrumentation").setLevel(logging.ERROR)
+    payload = make_payload(args.rows)
+    runs = [(f"chunk_size={size}", f"?chunk_size={size}") for size in args.chunk_sizes]
+    runs.append(("atomic=all", "?atomic=all&chunk_size=1000"))
+
+    print(f"{args.settings}, {args.rows} rows")
+    print(f"{'mode':18} {'insert rows/s':>14} {'update rows/s':>14}")
+    for label, query in runs:
+        rates = []
+        # Measure the database, not the per-client row throttle.
+        with override_settings(BULK_ROWS_PER_MINUTE=None), temporary_database():
+            client = Client()
+            for _ in ("insert", "update"):
+                start = time.perf_counter()
+                res = client.post(
+                    f"/api/professionals/bulk/{query}&results=summary", payload,
+                    content_type="application/json",
+                )
+                assert res.status_code == 200, res.content
+                rates.append(args.rows / (time.perf_counter() - start))
+        print(f"{label:18} {rates[0]:>14,.0f} {rates[1]:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
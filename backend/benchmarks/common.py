@@ -0,0 +1,61 @@
+"""
+Shared setup for the scripts in this package.
+
+Every benchmark runs against a throwaway SQLite file, never ``db.sqlite3``.
+Run them from ``backend/`` as modules, e.g. ``python -m benchmarks.asgi_load``.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def setup_django(settings_module="backend.settings"):
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def temporary_database():
+    """Creates and migrates a scratch SQLite file for the duration of the block."""
+    from django.db import connection
+
+    with tempfile.TemporaryDirectory() as tmp:
+        connection.settings_dict["TEST"]["NAME"] = os.path.join(tmp, "bench.sqlite3")
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def make_payload(count, offset=0, sources=("direct", "partner", "internal")):
+    return [
+        {
+            "full_name": f"Bench Person {i}",
+            "email": f"bench{i}@example.com",
+            "phone": f"+1-555-{i:07d}",
+            "company_name": f"Company {i % 997}",
+            "job_title": "Engineer",
+            "source": sources[i % len(sources)],
+        }
+        for i in range(offset, offset + count)
+    ]
+
+
+def seed(count, batch_size=5000):
+    from professionals.models import Professional
+
+    for offset in range(0, count, batch_size):
+        rows = make_payload(min(batch_size, count - offset), offset)
+        Professional.objects.bulk_create(Professional(**row) for row in rows)
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
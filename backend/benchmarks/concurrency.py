@@ -0,0 +1,151 @@
+"""
+Concurrency stress test: list reads while bulk imports are writing.
+
+Runs reader threads against a keyset page of the list endpoint and writer
+threads posting bulk batches, all through the sync WSGI views with one
+database connection per thread, once per settings module. Reports reader
+latency percentiles, reads and rows written, and "database is locked"
+failures for each profile.
+
+    cd backend
+    python -m benchmarks.concurrency --rows 20000 --readers 8 --writers 2 --duration 10
+
+Each profile runs in its own interpreter, since settings are per process.
+Under ``backend.settings_replica`` the list reads go to a snapshot file that
+a background thread refreshes every ``--refresh`` seconds.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from itertools import count
+
+from .common import make_payload, percentile, seed, setup_django, temporary_database
+
+PROFILES = ["backend.settings", "backend.settings_production", "backend.settings_replica"]
+
+
+def run_profile(args):
+    setup_django(args.run)
+    from django.db import OperationalError, connections
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment
+
+    from professionals.replica import read_alias, refresh_replica
+
+    setup_test_environment()
+    stop = threading.Event()
+    offsets = count(args.rows, args.batch)
+    latencies, locked, written = [], [], []
+    refreshes = []
+    lock = threading.Lock()
+
+    def reader():
+        client = Client()
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    res = client.get("/api/professionals/", {"page_size": 50})
+                    assert res.status_code == 200
+                except OperationalError:
+                    with lock:
+                        locked.append("read")
+                    continue
+                with lock:
+                    latencies.append(time.perf_counter() - start)
+        finally:
+            connections.close_all()
+
+    def writer():
+        client = Client()
+        try:
+            while not stop.is_set():
+                with lock:
+                    offset = next(offsets)
+                try:
+                    res = client.post(
+                        "/api/professionals/bulk/",
+                        make_payload(args.batch, offset),
+                        content_type="application/json",
+                    )
+                    assert res.status_code == 200
+                except OperationalError:
+                    with lock:
+                        locked.append("write")
+                    continue
+                with lock:
+                    written.append(args.batch)
+        finally:
+            connections.close_all()
+
+    def refresher():
+        try:
+            while not stop.wait(args.refresh):
+                refreshes.append(refresh_replica())
+        finally:
+            connections.close_all()
+
+    # Measure the database, not response-cache hits.
+    dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    with override_settings(CACHES=dummy_cache), temporary_database():
+        seed(args.rows)
+        alias = read_alias()
+        if alias:
+            bench = connections["default"].settings_dict["NAME"]
+            connections[alias].settings_dict["NAME"] = os.path.join(os.path.dirname(bench), "replica.sqlite3")
+            refresh_replica()
+        connections.close_all()  # start every thread on a fresh, configured connection
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+        if alias:
+            threads.append(threading.Thread(target=refresher))
+        for thread in threads:
+            thread.start()
+        time.sleep(args.duration)
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    ms = [value * 1000 for value in latencies]
+    return {
+        "reads": len(ms),
+        "read_p50_ms": round(percentile(ms, 50), 1),
+        "read_p99_ms": round(percentile(ms, 99), 1),
+        "read_max_ms": round(max(ms, default=0), 1),
+        "rows_written": sum(written),
+        "locked_reads": locked.count("read"),
+        "locked_writes": locked.count("write"),
+        "replica_refreshes": len(refreshes),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=20_000, help="rows seeded before the run")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--batch", type=int, default=500, help="rows per bulk request")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per profile")
+    parser.add_argument("--refresh", type=float, default=2.0, help="replica snapshot interval, in seconds")
+    parser.add_argument("--settings", nargs="+", default=PROFILES, help="settings modules to compare")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_profile(args)))
+        return
+
+    for module in args.settings:
+        cmd = [sys.executable, "-m", "benchmarks.concurrency", *sys.argv[1:], "--run", module]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        print(f"{module:30} " + ", ".join(f"{k}={v}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Response sizes for bulk imports and the list, by result mode and encoding.
+
+Posts the same batch under each ``?results=`` mode (the first call creates
+the rows, later calls update them, which echoes the same amount) and reads
+the list, each uncompressed, gzip and, when the ``brotli`` package is
+installed, brotli. Prints wire bytes and time per case.
+
+    cd backend
+    python -m benchmarks.payloads --batch 10000 --rows 100000
+"""
+
+import argparse
+import logging
+import time
+
+from .common import make_payload, seed, setup_django, temporary_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--batch", type=int, default=10_000, help="rows per bulk request")
+    parser.add_argument("--rows", type=int, default=100_000, help="rows seeded for the list")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment
+
+    from professionals.compression import brotli
+
+    setup_test_environment()
+    # A 10k-row bulk update trips the N+1 warning; keep the table readable.
+    logging.getLogger("professionals.instrumentation").setLevel(logging.ERROR)
+    encodings = {"identity": "", "gzip": "gzip"}
+    if brotli is not None:
+        encodings["br"] = "br"
+
+    dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    with override_settings(CACHES=dummy_cache), temporary_database():
+        client = Client()
+        payload = make_payload(args.batch)
+        print(f"{'case':34} {'encoding':>8} {'bytes':>12} {'ms':>9}")
+        for mode in ("full", "summary", "errors_only"):
+            for name, accept in encodings.items():
+                start = time.perf_counter()
+                res = client.post(
+                    f"/api/professionals/bulk/?results={mode}", payload,
+                    content_type="application/json", HTTP_ACCEPT_ENCODING=accept,
+                )
+                ms = (time.perf_counter() - start) * 1000
+                print(f"{f'bulk {args.batch} results={mode}':34} {name:>8} {len(res.content):>12,} {ms:>9.0f}")
+
+        seed(args.rows)
+        for name, accept in encodings.items():
+            start = time.perf_counter()
+            res = client.get("/api/professionals/", HTTP_ACCEPT_ENCODING=accept)
+            ms = (time.perf_counter() - start) * 1000
+            print(f"{f'list {args.rows + args.batch} rows':34} {name:>8} {len(res.content):>12,} {ms:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
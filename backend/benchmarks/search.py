@@ -0,0 +1,135 @@
+"""
+Search benchmark: the FTS5 index versus the admin's icontains scan.
+
+Seeds a synthetic table with varied names, companies and titles, then times
+``ranked_search`` on the FTS5 index and on the token index (the fallback for
+databases without FTS5) against ``icontains`` over the same four fields, both
+in table order (which can stop at the first page of hits) and in the list
+endpoint's newest-first order (which has to scan every row).
+
+    cd backend
+    python -m benchmarks.search --rows 1000000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from unittest import mock
+
+from .common import setup_django, temporary_database
+
+FIRST = ["Jane", "John", "Maria", "Wei", "Aisha", "Carlos", "Olga", "Kenji", "Priya", "Liam",
+         "Fatima", "Noah", "Elena", "Omar", "Sofia", "Lucas", "Hana", "Mateo", "Zoe", "Ivan"]
+LAST = ["Smith", "Garcia", "Chen", "Khan", "Novak", "Silva", "Tanaka", "Patel", "Murphy",
+        "Rossi", "Kowalski", "Haddad", "Nguyen", "Jensen", "Okafor", "Lopez", "Berg", "Ali"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Tyrell",
+             "Cyberdyne", "Soylent", "Wonka", "Aperture", "Gringotts", "Oscorp", "Vandelay"]
+TITLES = ["Engineer", "Designer", "Manager", "Analyst", "Recruiter", "Director", "Consultant",
+          "Architect", "Scientist", "Accountant", "Marketer", "Developer"]
+# Common single words, multi-word prefixes, and selective lookups (one email,
+# no match at all), which are the worst case for a scan.
+QUERIES = ["jane", "globex", "architect", "kenji tanaka", "wonka director", "pri pat",
+           "kenji.tanaka.4242", "nobody"]
+
+
+def seed(count, batch_size=5000):
+    from professionals.models import Professional
+
+    rng = random.Random(42)
+    for offset in range(0, count, batch_size):
+        rows = []
+        for i in range(offset, min(offset + batch_size, count)):
+            first, last = rng.choice(FIRST), rng.choice(LAST)
+            rows.append(Professional(
+                full_name=f"{first} {last}",
+                email=f"{first}.{last}.{i}@example.com".lower(),
+                company_name=f"{rng.choice(COMPANIES)} {rng.choice(['Inc', 'Labs', 'Group'])}",
+                job_title=f"{rng.choice(['Senior', 'Lead', 'Junior', ''])} {rng.choice(TITLES)}".strip(),
+                source=rng.choice(["direct", "partner", "internal"]),
+            ))
+        Professional.objects.bulk_create(rows)
+
+
+def icontains_search(query, limit, ordered):
+    from django.db.models import Q
+
+    from professionals.models import Professional
+    from professionals.search import SEARCH_FIELDS, search_terms
+
+    condition = Q()
+    for term in search_terms(query):
+        term_condition = Q()
+        for field in SEARCH_FIELDS:
+            term_condition |= Q(**{f"{field}__icontains": term})
+        condition &= term_condition
+    qs = Professional.objects.filter(condition)
+    if ordered:
+        qs = qs.order_by("-created_at", "-id")
+    return list(qs.values_list("id", flat=True)[:limit])
+
+
+def without_fts(search, *args, **kwargs):
+    """Runs ``search`` on the token index, as on a database without FTS5."""
+    with mock.patch("professionals.search.has_fts_index", return_value=False):
+        return search(*args, **kwargs)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20, help="results per query (one page)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    from professionals.search import has_fts_index, ranked_search, rebuild_search_tokens
+
+    results = []
+    with temporary_database():
+        seed_start = time.perf_counter()
+        seed(args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - seed_start:.1f}s "
+              f"(fts index: {has_fts_index()})")
+        # Seeding bypasses the write paths, which skip tokens while FTS5 exists.
+        tokens_start = time.perf_counter()
+        tokens = rebuild_search_tokens()
+        print(f"built {tokens} search tokens in {time.perf_counter() - tokens_start:.1f}s")
+        for query in QUERIES:
+            results.append({
+                "query": query,
+                "fts_ms": round(timed(lambda: ranked_search(query, limit=args.limit), args.repeat), 2),
+                "tokens_ms": round(
+                    timed(lambda: without_fts(ranked_search, query, limit=args.limit), args.repeat), 2
+                ),
+                "icontains_ms": round(
+                    timed(lambda: icontains_search(query, args.limit, False), args.repeat), 2
+                ),
+                "icontains_newest_ms": round(
+                    timed(lambda: icontains_search(query, args.limit, True), args.repeat), 2
+                ),
+            })
+
+    columns = ["query", "fts_ms", "tokens_ms", "icontains_ms", "icontains_newest_ms"]
+    print("".join(f"{c:>22}" for c in columns) + f"{'speedup_vs_newest':>20}")
+    for row in results:
+        speedup = row["icontains_newest_ms"] / max(row["fts_ms"], 0.01)
+        print("".join(f"{row[c]!s:>22}" for c in columns) + f"{speedup:>19.1f}x")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Worker cold start and per-request overhead, per settings profile.
+
+Each run is a fresh interpreter that boots Django as a WSGI worker does
+(``django.setup()``, the WSGI handler and its middleware, the URLconf), then
+serves one list request and ``--requests`` more through the full handler.
+Reports, as medians over ``--repeat`` runs: boot time and modules loaded,
+the first request, warm GET and POST latency, and peak RSS.
+
+    cd backend
+    python -m benchmarks.startup --repeat 5 --requests 500
+
+The database is a throwaway file seeded with ``--rows`` rows, and the list
+cache is disabled, so every request runs the view.
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from itertools import count
+
+PROFILES = ["backend.settings", "backend.settings_api"]
+
+
+def run_profile(args):
+    from .common import seed, setup_django, temporary_database
+
+    start = time.perf_counter()
+    setup_django(args.run)
+    from django.conf import settings
+    from django.core.wsgi import get_wsgi_application
+    from django.urls import get_resolver
+
+    get_wsgi_application()
+    get_resolver().url_patterns  # import the URLconf and every view module
+    boot = time.perf_counter() - start
+    modules = len(sys.modules)
+
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment
+
+    setup_test_environment()
+    client = Client()
+    emails = count()
+
+    def post():
+        i = next(emails)
+        return client.post(
+            "/api/professionals/",
+            {"full_name": f"Warm {i}", "email": f"warm{i}@example.com", "source": "direct"},
+            content_type="application/json",
+        )
+
+    def timed(request, n):
+        times = []
+        for _ in range(n):
+            begin = time.perf_counter()
+            res = request()
+            times.append(time.perf_counter() - begin)
+            assert res.status_code < 300, res.status_code
+        return times
+
+    dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    with override_settings(CACHES=dummy_cache), temporary_database():
+        seed(args.rows)
+        page = lambda: client.get("/api/professionals/", {"page_size": 20})
+        first = timed(page, 1)[0]
+        gets = timed(page, args.requests)
+        posts = timed(post, args.requests)
+
+    return {
+        "installed_apps": len(settings.INSTALLED_APPS),
+        "middleware": len(settings.MIDDLEWARE),
+        "boot_ms": boot * 1000,
+        "modules": modules,
+        "first_request_ms": first * 1000,
+        "get_us": statistics.median(gets) * 1e6,
+        "post_us": statistics.median(posts) * 1e6,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000, help="rows seeded before the requests")
+    parser.add_argument("--requests", type=int, default=500, help="warm requests per method")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh processes per profile")
+    parser.add_argument("--settings", nargs="+", default=PROFILES, help="settings modules to compare")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_profile(args)))
+        return
+
+    for module in args.settings:
+        runs = []
+        for _ in range(args.repeat):
+            cmd = [sys.executable, "-m", "benchmarks.startup", *sys.argv[1:], "--run", module]
+            out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            runs.append(json.loads(out.strip().splitlines()[-1]))
+        result = {key: round(statistics.median(run[key] for run in runs), 1) for key in runs[0]}
+        print(f"{module:30} " + ", ".join(f"{k}={v:g}" for k, v in result.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark suite for the professionals API hot paths.
+
+For each dataset size, seeds a scratch database and measures bulk-import
+throughput and list latency (full list, ``?source=`` filter, a keyset page
+and a ``?fields=`` sparse page), each with its query count and peak Python
+memory. Results are written as JSON; pass an earlier file as
+``--baseline`` to flag regressions.
+
+    cd backend
+    python -m benchmarks.suite --sizes 1000 100000 1000000 --json bench.json
+    python -m benchmarks.suite --sizes 1000 100000 --baseline bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from .common import make_payload, seed, setup_django, temporary_database
+
+# Metric suffix -> True when a larger value is worse.
+HIGHER_IS_WORSE = {"_ms": True, "_queries": True, "_peak_kb": True, "_rows_per_s": False}
+
+
+def measure(fn, repeat):
+    """Median wall time over ``repeat`` calls, then one traced call for queries and memory."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    samples = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn(i)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as queries:
+            fn(repeat)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return statistics.median(samples), len(queries), peak // 1024
+
+
+def run_size(size, args):
+    from django.test import Client
+
+    client = Client()
+    results = {}
+    seed(size)
+
+    list_cases = {
+        "list_page": {"page_size": 50},
+        "list_source_page": {"source": "partner", "page_size": 50},
+        "list_sparse_page": {"page_size": 50, "fields": "id,full_name,source"},
+    }
+    if size <= args.max_full_list:
+        list_cases.update({"list_full": {}, "list_source": {"source": "partner"}})
+    for name, params in list_cases.items():
+        seconds, queries, peak_kb = measure(
+            lambda i: client.get("/api/professionals/", params), args.repeat
+        )
+        results[f"{name}_ms"] = round(seconds * 1000, 2)
+        results[f"{name}_queries"] = queries
+        results[f"{name}_peak_kb"] = peak_kb
+
+    half = args.batch // 2
+
+    def bulk_import(i):
+        # Half the batch updates rows written by the previous call, half is new.
+        payload = make_payload(args.batch, size - half + i * half)
+        res = client.post("/api/professionals/bulk/", payload, content_type="application/json")
+        assert res.status_code == 200, res.content[:200]
+
+    seconds, queries, peak_kb = measure(bulk_import, args.repeat)
+    results["bulk_rows_per_s"] = round(args.batch / seconds, 1)
+    results["bulk_ms"] = round(seconds * 1000, 2)
+    results["bulk_queries"] = queries
+    results["bulk_peak_kb"] = peak_kb
+    return results
+
+
+def compare(current, baseline, threshold):
+    """Returns human-readable regressions of ``current`` against ``baseline``."""
+    regressions = []
+    for size, metrics in current.items():
+        for metric, value in metrics.items():
+            old = baseline.get(size, {}).get(metric)
+            suffix = next((s for s in HIGHER_IS_WORSE if metric.endswith(s)), None)
+            if old in (None, 0) or value is None or suffix is None:
+                continue
+            change = (value - old) / old
+            worse = change > threshold if HIGHER_IS_WORSE[suffix] else change < -threshold
+            if worse:
+                regressions.append(f"{size} rows {metric}: {old} -> {value} ({change:+.0%})")
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 1_000_000])
+    parser.add_argument("--batch", type=int, default=1000, help="rows per bulk request")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--max-full-list", type=int, default=100_000,
+        help="skip the unpaginated list above this many rows",
+    )
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="earlier --json output to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test.utils import override_settings, setup_test_environment
+
+    setup_test_environment()
+    # Measure the database and serializer path, not response-cache hits.
+    dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+    results = {}
+    with override_settings(CACHES=dummy_cache):
+        for size in args.sizes:
+            with temporary_database():
+                results[str(size)] = run_size(size, args)
+            print(f"{size:>9} rows: " + ", ".join(f"{k}={v}" for k, v in results[str(size)].items()))
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
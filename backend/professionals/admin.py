@@ -1,10 +1,27 @@
 from django.contrib import admin
 
-from .models import Professional
+from .models import BulkImportJob, Professional
+from .search import search_filter
 
 
 @admin.register(Professional)
 class ProfessionalAdmin(admin.ModelAdmin):
-    list_display = ("full_name", "email", "phone", "source", "created_at")
+    list_display = ("full_name", "email", "phone", "source", "created_at", "updated_at")
     list_filter = ("source",)
     search_fields = ("full_name", "email", "phone")
+
+    def get_search_results(self, request, queryset, search_term):
+        # Served by the search index instead of icontains scans over every
+        # search field; phone keeps a plain prefix match.
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        matches = search_filter(queryset, search_term)
+        matches |= queryset.filter(phone__startswith=search_term.strip())
+        return matches, False
+
+
+@admin.register(BulkImportJob)
+class BulkImportJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "status", "total", "processed", "created", "updated", "failed", "created_at")
+    list_filter = ("status",)
+    exclude = ("payload",)
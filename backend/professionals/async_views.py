@@ -0,0 +1,209 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from .ingest import ATOMIC_MODES, MAX_CHUNK_SIZE, chunked_upsert, parse_chunk_size
+from .limits import check_body_size, check_item_count, throttle_rows
+from .list_cache import etag_matches, list_cache_entry
+from .models import Professional
+from .pagination import KeysetPagination
+from .replica import replica_reads
+from .serializers import (
+    LIST_FIELDS,
+    ProfessionalSerializer,
+    parse_list_fields,
+    serialize_professional_rows,
+)
+from .upsert import RESULT_MODES, shape_results
+from .views import ProfessionalListCreateView
+
+LIST_CHUNK_SIZE = 2000
+PAGE_PARAMS = (KeysetPagination.cursor_query_param, KeysetPagination.page_size_query_param)
+
+_sync_list = ProfessionalListCreateView.as_view()
+
+
+def _json_response(data, code=status.HTTP_200_OK):
+    # Same renderer as the DRF views, so bodies are byte-for-byte identical.
+    return HttpResponse(
+        JSONRenderer().render(data), status=code, content_type="application/json"
+    )
+
+
+def _rejection_response(rejection):
+    response = _json_response(rejection.body, code=rejection.status)
+    for header, value in rejection.headers.items():
+        response[header] = value
+    return response
+
+
+def _parse_json(request):
+    try:
+        return json.loads(request.body), None
+    except ValueError as e:
+        return None, _json_response(
+            {"detail": f"JSON parse error - {e}"}, code=status.HTTP_400_BAD_REQUEST
+        )
+
+
+def _create(data):
+    serializer = ProfessionalSerializer(data=data)
+    if not serializer.is_valid():
+        return serializer.errors, status.HTTP_400_BAD_REQUEST
+    serializer.save()
+    return serializer.data, status.HTTP_201_CREATED
+
+
+def _list_page(request):
+    return _sync_list(request).render()
+
+
+def _list_validator(request):
+    using, etag, _ = list_cache_entry(request)
+    return using, etag
+
+
+async def _stream_json_list(rows, fields):
+    # Each chunk is rendered on its own and spliced into one array, which
+    # gives the same bytes as rendering the whole list at once.
+    renderer = JSONRenderer()
+    yield b"["
+    separator = b""
+    batch = []
+    async for row in rows.aiterator(chunk_size=LIST_CHUNK_SIZE):
+        batch.append(row)
+        if len(batch) == LIST_CHUNK_SIZE:
+            yield separator + renderer.render(serialize_professional_rows(batch, fields))[1:-1]
+            separator, batch = b",", []
+    if batch:
+        yield separator + renderer.render(serialize_professional_rows(batch, fields))[1:-1]
+    yield b"]"
+
+
+def _bulk_upsert_in_worker(items, chunk_size, echo, atomic):
+    # Runs outside the shared sync thread so a long import never queues the
+    # async ORM calls of other requests behind it. Connections are per
+    # thread, so close this worker's before returning it to the pool.
+    try:
+        return chunked_upsert(items, chunk_size, echo=echo, atomic=atomic)
+    finally:
+        connections.close_all()
+
+
+class AsyncAPIView(View):
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+
+class AsyncProfessionalListCreateView(AsyncAPIView):
+    """
+    ASGI-native variant of ProfessionalListCreateView.
+
+    The unpaginated list streams out of the database in ``aiterator`` chunks,
+    so the event loop is free between chunks and the whole list is never held
+    in memory. It is not stored in the list cache, but carries the same ETag
+    as the sync list and answers a matching ``If-None-Match`` with ``304``.
+    Paginated requests (``cursor`` or ``page_size``) are small, and run the
+    sync view in a thread for its keyset pagination and list cache. Every
+    response is the same as the sync list's.
+    """
+
+    async def get(self, request):
+        if any(param in request.GET for param in PAGE_PARAMS):
+            return await sync_to_async(_list_page)(request)
+        fields, unknown = parse_list_fields(request.GET.get("fields"))
+        if unknown:
+            return _json_response(
+                {"error": f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(LIST_FIELDS)}."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        # The rows are read after the view returns, outside replica_reads, so
+        # pin them to the database the ETag was computed for.
+        with replica_reads(request):
+            using, etag = await sync_to_async(_list_validator)(request)
+        if etag_matches(request, etag):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            qs = Professional.objects.using(using)
+            source = request.GET.get("source")
+            if source:
+                qs = qs.filter(source=source)
+            # Plain values_list() runs its query eagerly when the iterator is
+            # created, i.e. on the event loop; the named variant defers it.
+            rows = qs.values_list(*fields, named=True)
+            response = StreamingHttpResponse(
+                _stream_json_list(rows, fields), content_type="application/json"
+            )
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    async def post(self, request):
+        data, error = _parse_json(request)
+        if error:
+            return error
+        body, code = await sync_to_async(_create)(data)
+        return _json_response(body, code)
+
+
+class AsyncBulkCreateView(AsyncAPIView):
+    """
+    ASGI-native variant of BulkCreateView with the same request and
+    per-item result contract.
+
+    The upsert needs a transaction, which the async ORM does not offer, so
+    the whole batch runs in a pool thread instead of the shared sync thread.
+    """
+
+    async def post(self, request):
+        mode = request.GET.get("results", "full")
+        if mode not in RESULT_MODES:
+            return _json_response(
+                {"error": f"results must be one of: {', '.join(RESULT_MODES)}."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        chunk_size = parse_chunk_size(request.GET.get("chunk_size"))
+        if chunk_size is None:
+            return _json_response(
+                {"error": f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        atomic = request.GET.get("atomic", "chunk")
+        if atomic not in ATOMIC_MODES:
+            return _json_response(
+                {"error": f"atomic must be one of: {', '.join(ATOMIC_MODES)}."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        rejection = check_body_size(request)
+        if rejection:
+            return _rejection_response(rejection)
+        items, error = _parse_json(request)
+        if error:
+            return error
+        if not isinstance(items, list):
+            return _json_response(
+                {"error": "Expected a JSON list of professional profiles."},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        rejection = check_item_count(request, len(items)) or throttle_rows(request, len(items))
+        if rejection:
+            return _rejection_response(rejection)
+
+        results, committed = await sync_to_async(_bulk_upsert_in_worker, thread_sensitive=False)(
+            items, chunk_size, mode == "full", atomic
+        )
+        if not committed:
+            failed = [result for result in results if result["status"] == "error"]
+            return _json_response(
+                {"error": f"Nothing was written: {len(failed)} of {len(results)} items failed.", "results": failed},
+                code=status.HTTP_400_BAD_REQUEST,
+            )
+        return _json_response(shape_results(results, mode))
@@ -0,0 +1,49 @@
+from rest_framework import serializers
+
+from .models import Professional, ProfessionalChange
+from .serializers import LIST_FIELDS, serialize_professional_rows
+
+DEFAULT_CHANGES_LIMIT = 500
+MAX_CHANGES_LIMIT = 5000
+
+_changed_at_field = serializers.DateTimeField()
+
+
+def changes_since(since, limit=DEFAULT_CHANGES_LIMIT):
+    """
+    Reads up to ``limit`` change log entries after cursor ``since`` and
+    returns ``(results, cursor, has_more)``.
+
+    Each professional appears once per page, at its latest change, with
+    its current row (None once deleted). ``cursor`` is the id of the last
+    log entry read; pass it back as ``since`` to continue. Log ids are
+    assigned in write order, and SQLite serializes writers, so a cursor never
+    skips an entry that commits later.
+    """
+    entries = list(
+        ProfessionalChange.objects.filter(id__gt=since)
+        .order_by("id")
+        .values_list("id", "professional_id", "action", "changed_at")[: limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+    if not entries:
+        return [], since, False
+
+    latest = {}
+    for entry in entries:
+        latest.pop(entry[1], None)  # re-insert so dict order follows the latest change
+        latest[entry[1]] = entry
+
+    rows = Professional.objects.filter(pk__in=list(latest)).values_list(*LIST_FIELDS)
+    current = {item["id"]: item for item in serialize_professional_rows(rows)}
+    results = [
+        {
+            "id": pk,
+            "action": action,
+            "changed_at": _changed_at_field.to_representation(changed_at),
+            "professional": current.get(pk),
+        }
+        for _, pk, action, changed_at in latest.values()
+    ]
+    return results, entries[-1][0], has_more
@@ -0,0 +1,16 @@
+from django.conf import settings
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    ``connection_created`` receiver: runs ``settings.SQLITE_PRAGMAS``, or the
+    alias's own ``SQLITE_PRAGMAS`` entry in ``DATABASES``, on every new SQLite
+    connection. With ``CONN_MAX_AGE`` a connection lives across requests, so
+    this runs once per connection, not once per request.
+    """
+    pragmas = connection.settings_dict.get("SQLITE_PRAGMAS", getattr(settings, "SQLITE_PRAGMAS", None))
+    if connection.vendor != "sqlite" or not pragmas:
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
@@ -0,0 +1,151 @@
+import csv
+import importlib.util
+import io
+import json
+from datetime import datetime, time
+
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .ingest import iter_chunks
+from .models import Professional, ProfessionalChange
+from .serializers import LIST_FIELDS, serialize_professional_rows
+
+# Arrow export is optional. pyarrow alone adds ~60 ms to a worker's boot, so
+# it is imported by the first Arrow export rather than with the views.
+ARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_ORDERING = ("created_at", "id")
+
+
+def parse_timestamp(value):
+    """
+    Parses an ISO 8601 datetime or date (midnight) query parameter; naive
+    values are taken in the current time zone. Returns None when invalid.
+    """
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            parsed = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def export_queryset(source=None, created_after=None, created_before=None, since=None):
+    """
+    Returns ``(queryset, watermark)`` for an export, oldest first.
+
+    ``created_after`` is inclusive, ``created_before`` exclusive. The
+    watermark is the newest change-log id when the export starts, and rows
+    whose ``created`` entry is newer are left for the next pull, which
+    passes the watermark back as ``since`` to get only rows created after
+    it. Change ids, unlike ``created_at`` (stamped before commit), only grow
+    in commit order under SQLite's single writer, so a transaction that
+    commits late is still picked up by the next pull.
+    """
+    qs = Professional.objects.all()
+    # Pin the routed database: the rows are read after the view returns, and
+    # must come from the same database as the watermark.
+    qs = qs.using(qs.db)
+    changes = ProfessionalChange.objects.using(qs.db)
+    watermark = changes.aggregate(watermark=Max("pk"))["watermark"] or 0
+    created = changes.filter(action="created")
+    if since is not None:
+        qs = qs.filter(
+            pk__in=created.filter(pk__gt=since, pk__lte=watermark).values("professional_id")
+        )
+    else:
+        qs = qs.exclude(pk__in=created.filter(pk__gt=watermark).values("professional_id"))
+    if source:
+        qs = qs.filter(source=source)
+    if created_after is not None:
+        qs = qs.filter(created_at__gte=created_after)
+    if created_before is not None:
+        qs = qs.filter(created_at__lt=created_before)
+    return qs.order_by(*EXPORT_ORDERING), max(watermark, since or 0)
+
+
+def iter_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yields lists of at most ``chunk_size`` value tuples in ``LIST_FIELDS`` order."""
+    rows = queryset.values_list(*LIST_FIELDS).iterator(chunk_size=chunk_size)
+    return iter_chunks(rows, chunk_size)
+
+
+def write_csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(LIST_FIELDS)
+    for chunk in chunks:
+        for item in serialize_professional_rows(chunk):
+            writer.writerow(["" if v is None else v for v in item.values()])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def write_ndjson(chunks):
+    for chunk in chunks:
+        lines = [json.dumps(item) for item in serialize_professional_rows(chunk)]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+class _ByteSink:
+    """Minimal writable file for pyarrow that hands back what was written."""
+
+    closed = False
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self.parts)
+        self.parts.clear()
+        return data
+
+
+def _arrow_schema():
+    import pyarrow
+
+    string = pyarrow.string()
+    types = {"id": pyarrow.int64(), "created_at": pyarrow.timestamp("us", tz="UTC")}
+    return pyarrow.schema([(field, types.get(field, string)) for field in LIST_FIELDS])
+
+
+def write_arrow(chunks):
+    """Arrow IPC stream: the schema, then one record batch per chunk."""
+    import pyarrow.ipc
+
+    schema = _arrow_schema()
+    sink = _ByteSink()
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        for chunk in chunks:
+            columns = list(zip(*chunk))
+            writer.write_batch(pyarrow.record_batch(
+                [pyarrow.array(column, type=type_) for column, type_ in zip(columns, schema.types)],
+                schema=schema,
+            ))
+            yield sink.drain()
+    yield sink.drain()
+
+
+FORMATS = {
+    "csv": ("text/csv", write_csv),
+    "ndjson": ("application/x-ndjson", write_ndjson),
+}
+if ARROW_AVAILABLE:
+    FORMATS["arrow"] = ("application/vnd.apache.arrow.stream", write_arrow)
@@ -0,0 +1,35 @@
+"""
+Entry points for ``importer``'s worker processes.
+
+Spawned workers unpickle these before Django is set up, so this module must
+not import models (or anything that does) at import time.
+"""
+
+
+def init_worker(database_names):
+    import django
+
+    django.setup()
+    from django.db import connections
+
+    for connection in connections.all():
+        # The parent's database, which settings may not name: under the
+        # test runner the parent works on the test database.
+        connection.settings_dict["NAME"] = database_names[connection.alias]
+        if connection.vendor == "sqlite":
+            # Shards write in parallel: queue for the write lock rather than
+            # failing when a read-then-write transaction finds it taken.
+            options = connection.settings_dict.setdefault("OPTIONS", {})
+            options.setdefault("timeout", 60)
+            options.setdefault("transaction_mode", "IMMEDIATE")
+
+
+def run_shard_in_worker(sources, assignment, shard, chunk_size):
+    from django.db import connections
+
+    from .importer import iter_sources, run_shard
+
+    try:
+        return run_shard(iter_sources(sources), assignment, shard, chunk_size)
+    finally:
+        connections.close_all()
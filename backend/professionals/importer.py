@@ -0,0 +1,178 @@
+import multiprocessing
+import time
+import zlib
+from array import array
+from collections import Counter, defaultdict
+
+from .import_worker import init_worker, run_shard_in_worker
+from .ingest import iter_chunks, iter_records
+from .models import Professional
+from .normalization import email_key, phone_key
+from .upsert import LOOKUP_BATCH_SIZE, bulk_upsert
+
+IMPORT_CHUNK_SIZE = 1000
+
+
+def _raw_keys(item):
+    """Normalized keys of a raw payload, without validating it."""
+    if not isinstance(item, dict):
+        return []
+    keys = []
+    for prefix, field, normalize in (("e", "email", email_key), ("p", "phone", phone_key)):
+        value = item.get(field)
+        key = normalize(value) if isinstance(value, str) else None
+        if key:
+            keys.append(f"{prefix}:{key}")
+    return keys
+
+
+class _KeyGroups:
+    """Union-find over prefixed keys, numbered in the order they are first seen."""
+
+    def __init__(self):
+        self.ids = {}
+        self.parent = array("q")
+
+    def id(self, key):
+        key_id = self.ids.get(key)
+        if key_id is None:
+            key_id = self.ids[key] = len(self.parent)
+            self.parent.append(key_id)
+        return key_id
+
+    def find(self, key_id):
+        root = key_id
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[key_id] != root:
+            self.parent[key_id], key_id = root, self.parent[key_id]
+        return root
+
+    def union(self, key_ids):
+        roots = sorted({self.find(key_id) for key_id in key_ids})
+        for root in roots[1:]:
+            self.parent[root] = roots[0]
+
+
+def iter_sources(sources):
+    """Yields the records of ``(path, format)`` files, in order."""
+    for path, fmt in sources:
+        with open(path, "rb") as f:
+            yield from iter_records(f, fmt)
+
+
+def plan_shards(records, workers):
+    """
+    Assigns each of ``records`` to one of ``workers`` shards such that no two
+    shards can touch the same professional, and returns the shard numbers as
+    an array indexed like the records.
+
+    Rows are grouped by their normalized email and phone keys together with
+    the keys of the existing rows those match, so any two rows that could
+    resolve to the same professional, or collide on a key, share a group.
+    Only keys are kept: memory grows with the number of distinct keys plus
+    a few bytes per row, never with the rows themselves.
+    """
+    groups = _KeyGroups()
+    row_keys = array("q")
+    for record in records:
+        key_ids = [groups.id(key) for key in _raw_keys(record)]
+        groups.union(key_ids)
+        row_keys.append(key_ids[0] if key_ids else -1)
+
+    emails = [key[2:] for key in groups.ids if key.startswith("e:")]
+    phones = [key[2:] for key in groups.ids if key.startswith("p:")]
+    for field, values in (("email_key", emails), ("phone_key", phones)):
+        for i in range(0, len(values), LOOKUP_BATCH_SIZE):
+            chunk = values[i : i + LOOKUP_BATCH_SIZE]
+            existing = Professional.objects.filter(**{f"{field}__in": chunk})
+            for e_key, p_key in existing.values_list("email_key", "phone_key"):
+                if e_key and p_key:
+                    groups.union([groups.id(f"e:{e_key}"), groups.id(f"p:{p_key}")])
+
+    # Each group goes to the shard picked by a hash of its root key (ids
+    # follow the dict's insertion order). Rows without a usable key cannot
+    # match anything; spread them by index.
+    keys = list(groups.ids)
+    return array("H", (
+        zlib.crc32(keys[groups.find(key_id)].encode()) % workers if key_id >= 0 else index % workers
+        for index, key_id in enumerate(row_keys)
+    ))
+
+
+def run_shard(records, assignment=None, shard=0, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Upserts the records ``assignment`` puts in ``shard`` (every record
+    without one), in input order and in chunks, and returns ``(counts,
+    errors)``: a Counter of statuses and the error results, indexed by
+    position in ``records``. Saved rows are not echoed: the command only
+    reports counts and errors, and they travel back from the workers by
+    pickle.
+    """
+    rows = (
+        (index, record) for index, record in enumerate(records)
+        if assignment is None or assignment[index] == shard
+    )
+    counts, errors = Counter(), []
+    for chunk in iter_chunks(rows, chunk_size):
+        indexes = [index for index, _ in chunk]
+        for index, result in zip(indexes, bulk_upsert([record for _, record in chunk], echo=False)):
+            counts[result["status"]] += 1
+            if result["status"] == "error":
+                result["index"] = index
+                errors.append(result)
+    return counts, errors
+
+
+def import_files(sources, workers=1, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Upserts the records of ``(path, format)`` files across ``workers``
+    processes (in this process when ``workers`` is 1) and returns
+    ``(errors, summary)``, with errors in input order.
+
+    Rows are streamed, a chunk at a time, in every process. With several
+    workers the files are read once to plan the shards and then once per
+    worker, which upserts only the rows of its own shard.
+    """
+    start = time.perf_counter()
+    if workers == 1:
+        counts, errors = run_shard(iter_sources(sources), chunk_size=chunk_size)
+        shard_sizes = [counts.total()]
+    else:
+        from django.db import connections
+
+        assignment = plan_shards(iter_sources(sources), workers)
+        sizes = Counter(assignment)
+        shard_sizes = [sizes[shard] for shard in range(workers)]
+        database_names = {conn.alias: conn.settings_dict["NAME"] for conn in connections.all()}
+        connections.close_all()
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(workers, initializer=init_worker, initargs=(database_names,)) as pool:
+            shard_results = pool.starmap(
+                run_shard_in_worker,
+                [(sources, assignment, shard, chunk_size) for shard in range(workers)],
+            )
+        counts = sum((shard_counts for shard_counts, _ in shard_results), Counter())
+        errors = sorted((e for _, shard_errors in shard_results for e in shard_errors), key=lambda e: e["index"])
+
+    total = counts.total()
+    seconds = time.perf_counter() - start
+    summary = {
+        "total": total,
+        "created": counts["created"],
+        "updated": counts["updated"],
+        "error": counts["error"],
+        "workers": workers,
+        "shard_sizes": shard_sizes,
+        "seconds": round(seconds, 2),
+        "rows_per_second": round(total / seconds, 1) if seconds else None,
+    }
+    return errors, summary
+
+
+def group_errors(errors):
+    """Error results grouped by message, for the report."""
+    by_message = defaultdict(list)
+    for result in errors:
+        by_message[str(result["errors"])].append(result["index"])
+    return by_message
@@ -0,0 +1,109 @@
+import codecs
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+
+from .upsert import bulk_upsert
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_CHUNK_SIZE = 5000
+# "chunk" commits each chunk on its own; "all" commits the batch or nothing.
+ATOMIC_MODES = ("chunk", "all")
+
+
+def parse_chunk_size(value):
+    """
+    Parses ``?chunk_size=``, defaulting to ``DEFAULT_CHUNK_SIZE``. Returns
+    None unless the value is an integer from 1 to ``MAX_CHUNK_SIZE``.
+    """
+    try:
+        chunk_size = int(DEFAULT_CHUNK_SIZE if value is None else value)
+    except ValueError:
+        return None
+    return chunk_size if 1 <= chunk_size <= MAX_CHUNK_SIZE else None
+
+
+def iter_records(lines, fmt):
+    """
+    Yields one payload per NDJSON line or CSV row from an iterable of bytes.
+
+    Lines that are not valid JSON are yielded as the raw string, so the bulk
+    serializer reports them at their index like any other non-object item.
+    """
+    text = codecs.iterdecode(lines, "utf-8-sig")
+    if fmt == "csv":
+        yield from csv.DictReader(text)
+        return
+    for line in text:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield line
+
+
+def iter_chunks(records, chunk_size=DEFAULT_CHUNK_SIZE):
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def chunked_upsert(items, chunk_size=DEFAULT_CHUNK_SIZE, echo=True, atomic="chunk"):
+    """
+    Runs ``bulk_upsert`` over ``chunk_size`` slices of ``items`` and returns
+    ``(results, committed)``.
+
+    With ``atomic="chunk"`` every chunk is its own transaction, so a crash
+    leaves whole chunks committed and one commit (one fsync on SQLite) covers
+    ``chunk_size`` rows. With ``atomic="all"`` one transaction spans every
+    chunk and is rolled back if any item fails; ``committed`` is then False
+    and the results still report every item.
+    """
+    if atomic == "chunk":
+        results = []
+        for chunk in iter_chunks(items, chunk_size):
+            results.extend(bulk_upsert(chunk, start=len(results), echo=echo))
+        return results, True
+
+    with transaction.atomic():
+        results = []
+        for chunk in iter_chunks(items, chunk_size):
+            results.extend(bulk_upsert(chunk, start=len(results), echo=echo))
+        committed = all(result["status"] != "error" for result in results)
+        if not committed:
+            transaction.set_rollback(True)
+    return results, committed
+
+
+def stream_upsert(records, chunk_size=DEFAULT_CHUNK_SIZE, on_chunk=None):
+    """
+    Runs ``bulk_upsert`` over fixed-size chunks of ``records`` and yields one
+    NDJSON line of results per chunk, followed by a summary line.
+    ``on_chunk`` is called with the size of each chunk before it is written.
+    """
+    summary = {"total": 0, "created": 0, "updated": 0, "error": 0}
+    for chunk in iter_chunks(records, chunk_size):
+        if on_chunk is not None:
+            on_chunk(len(chunk))
+        results = bulk_upsert(chunk, start=summary["total"])
+        summary["total"] += len(chunk)
+        for result in results:
+            summary[result["status"]] += 1
+        yield json.dumps({"results": results}) + "\n"
+    yield json.dumps({"summary": summary}) + "\n"
+
+
+def detect_format(content_type):
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in NDJSON_CONTENT_TYPES:
+        return "ndjson"
+    if media_type in CSV_CONTENT_TYPES:
+        return "csv"
+    return None
@@ -0,0 +1,185 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("professionals_request_metrics", default=None)
+_IN_LIST = re.compile(r"\(\s*%s(?:\s*,\s*%s)*\s*\)")
+
+
+class RequestMetrics:
+    """Query and timing totals for one request."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.shapes = Counter()
+
+    def repeated_shapes(self, threshold):
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper; a no-op outside an instrumented request."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_seconds += time.perf_counter() - start
+        metrics.queries += 1
+        # Collapse IN (%s, %s, ...) so batched lookups of any size share a shape.
+        metrics.shapes[_IN_LIST.sub("(...)", sql)] += 1
+
+
+def install_query_recorder(connection, **kwargs):
+    """``connection_created`` receiver: wraps every new connection once."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def timed_serialization():
+    metrics = _current.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            metrics.serialize_seconds += time.perf_counter() - start
+
+
+class TimedJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        with timed_serialization():
+            return super().render(data, accepted_media_type, renderer_context)
+
+
+class MetricsRegistry:
+    """Process-local counters rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help = {}
+        self._values = defaultdict(float)
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def inc(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] += value
+
+    def get(self, name, **labels):
+        return self._values.get((name, tuple(sorted(labels.items()))), 0)
+
+    def render(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = []
+        for name, help_text in sorted(self._help.items()):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (metric, labels), value in values:
+                if metric != name:
+                    continue
+                label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+                value_text = repr(value) if value % 1 else str(int(value))
+                lines.append(f"{name}{{{label_text}}} {value_text}" if labels else f"{name} {value_text}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+registry.describe("professionals_requests_total", "Requests handled, by view.")
+registry.describe("professionals_request_seconds_total", "Wall time spent in views, by view.")
+registry.describe("professionals_db_queries_total", "SQL queries executed, by view.")
+registry.describe("professionals_db_seconds_total", "Time spent in SQL queries, by view.")
+registry.describe("professionals_serialize_seconds_total", "Time spent serializing and rendering, by view.")
+registry.describe(
+    "professionals_repeated_queries_total",
+    "Requests that ran one query shape at least QUERY_REPEAT_THRESHOLD times (likely N+1), by view.",
+)
+
+
+class QueryMetricsMiddleware:
+    """
+    Records query count, DB time, serialization time and total time for each
+    request. The numbers go out as a ``Server-Timing`` header and into the
+    counters served by ``metrics_view``. Repeated identical query shapes are
+    logged as likely N+1 patterns.
+
+    Streaming responses are measured up to the point the stream starts.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = getattr(settings, "QUERY_REPEAT_THRESHOLD", 10)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    def finish(self, request, response, metrics, total_seconds):
+        match = getattr(request, "resolver_match", None)
+        view = (match.url_name or match.view_name) if match else "unmatched"
+
+        registry.inc("professionals_requests_total", view=view)
+        registry.inc("professionals_request_seconds_total", total_seconds, view=view)
+        registry.inc("professionals_db_queries_total", metrics.queries, view=view)
+        registry.inc("professionals_db_seconds_total", metrics.db_seconds, view=view)
+        registry.inc("professionals_serialize_seconds_total", metrics.serialize_seconds, view=view)
+
+        repeated = metrics.repeated_shapes(self.threshold)
+        if repeated:
+            registry.inc("professionals_repeated_queries_total", view=view)
+            shape, count = repeated[0]
+            logger.warning("Possible N+1 in %s: %d x %s", view, count, shape)
+
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.queries} queries"',
+            f"serialize;dur={metrics.serialize_seconds * 1000:.2f}",
+            f"total;dur={total_seconds * 1000:.2f}",
+        ])
+        return response
+
+
+def metrics_view(request):
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4")
@@ -0,0 +1,133 @@
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .ingest import iter_chunks
+from .models import BulkImportJob
+from .upsert import bulk_upsert
+
+logger = logging.getLogger(__name__)
+
+JOB_CHUNK_SIZE = 1000
+# A running job whose heartbeat is older than this is taken to have died
+# with its process, and a pending one to have lost its queue entry.
+DEFAULT_STALE_SECONDS = 300
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """The process's worker pool. Starting it recovers jobs stranded by a previous process."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "BULK_IMPORT_WORKERS", 2),
+                thread_name_prefix="bulk-import",
+            )
+            try:
+                recover_bulk_imports(_executor)
+            except Exception:
+                # Never let recovery block new jobs; the next process retries.
+                logger.exception("Bulk import recovery failed")
+    return _executor
+
+
+def recover_bulk_imports(executor):
+    """
+    Requeues pending jobs and fails running ones that have gone stale, as
+    left by a restart or a recycled worker. Rows of chunks a failed job
+    already committed stay written, and its counts say how far it got.
+    Returns ``(requeued, failed)`` job ids.
+
+    Every process's pool runs this when it starts; a job requeued by two of
+    them still runs once, because a run starts by claiming the job.
+    """
+    stale = getattr(settings, "BULK_IMPORT_STALE_SECONDS", DEFAULT_STALE_SECONDS)
+    cutoff = timezone.now() - timedelta(seconds=stale)
+    orphaned = BulkImportJob.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, created_at__lt=cutoff),
+        status="running",
+    )
+    failed = list(orphaned.values_list("pk", flat=True))
+    orphaned.filter(pk__in=failed).update(
+        status="failed",
+        error="Interrupted: the process running this job stopped.",
+        finished_at=timezone.now(),
+    )
+    requeued = list(
+        BulkImportJob.objects.filter(status="pending", created_at__lt=cutoff)
+        .order_by("created_at")
+        .values_list("pk", flat=True)
+    )
+    for job_id in requeued:
+        executor.submit(run_bulk_import, job_id)
+    if failed or requeued:
+        logger.warning("Bulk import recovery: requeued jobs %s, failed jobs %s", requeued, failed)
+    return requeued, failed
+
+
+def enqueue_bulk_import(items, chunk_size=JOB_CHUNK_SIZE, results_mode="full"):
+    """
+    Stores the payload as a pending job and hands it to the local worker
+    pool once the job row is committed. No broker is involved: the database
+    holds the job state and the pool lives in this process, and a job
+    stranded by a restart is picked up when a pool next starts (see
+    ``recover_bulk_imports``). Each chunk of ``chunk_size`` items commits on
+    its own. ``results_mode`` is a bulk ``?results=`` mode: the finished job
+    keeps every result (``full``), only the failed items (``errors_only``),
+    or none (``summary``; the counts are on the job either way).
+    """
+    job = BulkImportJob.objects.create(
+        payload=items, total=len(items), chunk_size=chunk_size, results_mode=results_mode
+    )
+    transaction.on_commit(lambda: get_executor().submit(run_bulk_import, job.pk))
+    return job
+
+
+def run_bulk_import(job_id):
+    jobs = BulkImportJob.objects.filter(pk=job_id)
+    results = []
+    mode = "full"
+    try:
+        # Claim the job; it may have been requeued by more than one pool.
+        if not jobs.filter(status="pending").update(status="running", heartbeat_at=timezone.now()):
+            return
+        payload, chunk_size, mode = jobs.values_list("payload", "chunk_size", "results_mode").get()
+        start = 0
+        for chunk in iter_chunks(payload, chunk_size):
+            chunk_results = bulk_upsert(chunk, start=start, echo=mode == "full")
+            start += len(chunk)
+            if mode == "full":
+                results.extend(chunk_results)
+            elif mode == "errors_only":
+                results.extend(result for result in chunk_results if result["status"] == "error")
+            counts = Counter(result["status"] for result in chunk_results)
+            jobs.update(
+                processed=F("processed") + len(chunk),
+                created=F("created") + counts["created"],
+                updated=F("updated") + counts["updated"],
+                failed=F("failed") + counts["error"],
+                heartbeat_at=timezone.now(),
+            )
+        # Drop the payload so finished jobs do not hold the batch twice; with
+        # results=full the per-index results carry everything written.
+        jobs.update(status="succeeded", payload=[], results=_kept(results, mode), finished_at=timezone.now())
+    except Exception as e:
+        logger.exception("Bulk import job %s failed", job_id)
+        jobs.update(status="failed", error=str(e), results=_kept(results, mode), finished_at=timezone.now())
+    finally:
+        connections.close_all()
+
+
+def _kept(results, mode):
+    # A summary job keeps only its counts.
+    return None if mode == "summary" else results
@@ -0,0 +1,163 @@
+import math
+import threading
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.throttling import BaseThrottle
+
+from .instrumentation import registry
+
+BUCKET_KEY = "professionals:bulk-rows:{ident}"
+
+registry.describe(
+    "professionals_bulk_rejections_total",
+    "Bulk requests rejected by a payload cap or the row throttle, by view and reason.",
+)
+registry.describe(
+    "professionals_bulk_rejected_rows_total",
+    "Rows in rejected bulk requests, by view and reason (0 for bodies rejected unread).",
+)
+
+# An HTTP rejection for the views to render: status, JSON body and headers.
+Rejection = namedtuple("Rejection", ["status", "body", "headers"])
+
+_lock = threading.Lock()
+
+
+def _view_name(request):
+    match = getattr(request, "resolver_match", None)
+    return (match.url_name or match.view_name) if match else "unmatched"
+
+
+def _reject(request, reason, rows, code, message, headers=None):
+    labels = {"view": _view_name(request), "reason": reason}
+    registry.inc("professionals_bulk_rejections_total", **labels)
+    registry.inc("professionals_bulk_rejected_rows_total", rows, **labels)
+    return Rejection(code, {"error": message}, headers or {})
+
+
+def check_body_size(request):
+    """413 when the declared body is larger than ``BULK_MAX_BYTES``, before it is read."""
+    limit = getattr(settings, "BULK_MAX_BYTES", None)
+    try:
+        length = int(request.META.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        length = 0
+    if limit is not None and length > limit:
+        return _reject(
+            request, "bytes", 0, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            f"Request body is {length} bytes; the limit is {limit}.",
+        )
+    return None
+
+
+def check_item_count(request, count):
+    """413 when a batch has more than ``BULK_MAX_ITEMS`` items."""
+    limit = getattr(settings, "BULK_MAX_ITEMS", None)
+    if limit is not None and count > limit:
+        return _reject(
+            request, "items", count, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            f"Batch has {count} items; the limit is {limit}. Split it into smaller requests.",
+        )
+    return None
+
+
+def client_ident(request):
+    """
+    The authenticated user, else the client address as DRF's throttles see
+    it. Plain Django requests (the async views) always go by address:
+    resolving their lazy user would query the database from the event loop.
+    Without an unauthenticated user class (the API-only profile),
+    ``request.user`` is None.
+    """
+    user = request.user if isinstance(request, Request) else None
+    if getattr(user, "is_authenticated", False):
+        return f"user:{user.pk}"
+    return f"addr:{BaseThrottle().get_ident(request)}"
+
+
+class RowBucket:
+    """
+    Token bucket of rows per client, kept in a Django cache.
+
+    A client holds up to ``burst`` tokens and regains ``per_minute`` of them
+    a minute. A request costs one token per row and is admitted only when the
+    bucket holds that many, capped at ``burst`` so a batch under the item
+    limit can always go through eventually. The bucket lives in the cache of
+    one process (the local-memory cache by default), so each worker process
+    enforces its own limit.
+    """
+
+    def __init__(self, per_minute, burst, cache_alias="default"):
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.cache = caches[cache_alias]
+
+    def take(self, ident, rows, allow_debt=False):
+        """
+        Takes ``rows`` tokens and returns 0, or returns the seconds until
+        they will be available and takes nothing. With ``allow_debt`` the
+        rows are always taken, and the balance may go negative.
+        """
+        key = BUCKET_KEY.format(ident=ident)
+        cost = min(rows, self.burst)
+        with _lock:
+            now = time.time()
+            tokens, stamp = self.cache.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - stamp) * self.rate)
+            if tokens < cost and not allow_debt:
+                self.cache.set(key, (tokens, now), timeout=self.timeout(tokens))
+                return (cost - tokens) / self.rate
+            tokens -= rows if allow_debt else cost
+            self.cache.set(key, (tokens, now), timeout=self.timeout(tokens))
+        return 0
+
+    def timeout(self, tokens):
+        # Past this the bucket is full again and the entry can expire.
+        return math.ceil((self.burst - tokens) / self.rate) + 1
+
+
+def get_row_bucket():
+    """The configured bucket, or None when ``BULK_ROWS_PER_MINUTE`` is None."""
+    per_minute = getattr(settings, "BULK_ROWS_PER_MINUTE", None)
+    if per_minute is None:
+        return None
+    return RowBucket(
+        per_minute,
+        getattr(settings, "BULK_ROW_BURST", per_minute),
+        getattr(settings, "BULK_THROTTLE_CACHE", "default"),
+    )
+
+
+def throttle_rows(request, rows):
+    """
+    429 with ``Retry-After`` when the client's row bucket cannot cover
+    ``rows``. ``rows=0`` admits any client that is not in debt.
+    """
+    bucket = get_row_bucket()
+    if bucket is None:
+        return None
+    wait = bucket.take(client_ident(request), rows)
+    if not wait:
+        return None
+    retry_after = math.ceil(wait)
+    return _reject(
+        request, "rate", rows, status.HTTP_429_TOO_MANY_REQUESTS,
+        f"Row rate limit exceeded; retry in {retry_after} s.",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def charge_rows(request, rows):
+    """
+    Takes ``rows`` from the client's bucket unconditionally, for streams
+    whose size is only known as they are read. Any debt makes the client's
+    next requests wait.
+    """
+    bucket = get_row_bucket()
+    if bucket is not None:
+        bucket.take(client_ident(request), rows, allow_debt=True)
@@ -0,0 +1,86 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, router
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import Professional
+from .replica import snapshot_version
+
+VERSION_KEY = "professionals:list-version"
+ENTRY_KEY = "professionals:list:{version}:{digest}"
+
+
+def get_list_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a lost counter never reuses an old version.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_list_version():
+    """Invalidates every cached list response. Call after any write to Professional."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def list_cache_entry(request):
+    """
+    Returns ``(using, etag, key)`` for a list GET: the database the list
+    reads from, and the ETag and cache key of its response. Both derive from
+    the query parameters, that database and the current table version.
+    Keying by database keeps a stale replica page from being served to a
+    client pinned to default. Replica pages are also keyed by the replica's
+    snapshot: it is refreshed by another process, whose version bumps never
+    reach this process's cache.
+    """
+    using = router.db_for_read(Professional)
+    version = get_list_version()
+    if using != DEFAULT_DB_ALIAS:
+        version = f"{version}.{snapshot_version(using)}"
+    params = sorted(
+        (key, sorted(values)) for key, values in request.GET.lists()
+    )
+    digest = hashlib.md5(
+        repr((request.get_host(), using, params)).encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return using, f'"{version}-{digest}"', ENTRY_KEY.format(version=version, digest=digest)
+
+
+def etag_matches(request, etag):
+    # Weak comparison: compressed responses carry W/ versions of the tag.
+    client_etags = {tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))}
+    return etag in client_etags
+
+
+def cached_list_response(request, build_response):
+    """
+    Serves a list GET from the cache under ``list_cache_entry``'s key, with
+    its ETag.
+
+    ``build_response`` is only called on a miss; its data is stored without a
+    timeout because any write bumps the version and orphans the old entries.
+    """
+    _, etag, key = list_cache_entry(request)
+    if etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        data = cache.get(key)
+        if data is None:
+            response = build_response()
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(key, response.data, timeout=None)
+        else:
+            response = Response(data)
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
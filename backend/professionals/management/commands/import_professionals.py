@@ -0,0 +1,69 @@
+import json
+import os
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from professionals.importer import IMPORT_CHUNK_SIZE, group_errors, import_files
+
+EXTENSION_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Upserts professionals from CSV or NDJSON files with the bulk endpoint's "
+        "rules, sharded across a process pool by normalized email/phone key."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("files", nargs="+", help="CSV or NDJSON files, imported in order")
+        parser.add_argument(
+            "--format", choices=["csv", "ndjson"],
+            help="file format; by default taken from each file's extension",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1,
+            help="worker processes (1 runs in this process)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+        parser.add_argument("--report", help="write the summary and every error to this JSON file")
+
+    def handle(self, *args, **options):
+        if options["workers"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--workers and --chunk-size must be at least 1.")
+
+        sources = []
+        for name in options["files"]:
+            path = Path(name)
+            fmt = options["format"] or EXTENSION_FORMATS.get(path.suffix.lower())
+            if fmt is None:
+                raise CommandError(f"Cannot tell the format of {name}; pass --format.")
+            try:
+                path.open("rb").close()
+            except OSError as e:
+                raise CommandError(f"Cannot read {name}: {e}")
+            sources.append((str(path.resolve()), fmt))
+
+        # Rows are streamed from the files, never all held in memory.
+        errors, summary = import_files(
+            sources, workers=options["workers"], chunk_size=options["chunk_size"]
+        )
+
+        self.stdout.write(
+            f"{summary['total']} rows: {summary['created']} created, "
+            f"{summary['updated']} updated, {summary['error']} errors "
+            f"in {summary['seconds']}s ({summary['rows_per_second']} rows/s, "
+            f"{summary['workers']} workers, shards {summary['shard_sizes']})"
+        )
+        for message, indexes in sorted(group_errors(errors).items(), key=lambda e: -len(e[1]))[:5]:
+            self.stdout.write(f"  {len(indexes)} x {message} (first at row {indexes[0]})")
+
+        if options["report"]:
+            report = {"summary": summary, "errors": errors}
+            with open(options["report"], "w") as f:
+                json.dump(report, f, indent=2)
+
+        if summary["error"]:
+            self.stdout.write(self.style.WARNING("Finished with errors."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Import complete."))
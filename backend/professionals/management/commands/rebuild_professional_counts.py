@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from professionals.stats import rebuild_counts
+
+
+class Command(BaseCommand):
+    help = "Recomputes the per-source daily counters behind the stats endpoint."
+
+    def handle(self, *args, **options):
+        rows = rebuild_counts()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily counter rows."))
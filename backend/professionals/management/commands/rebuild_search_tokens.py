@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from professionals.search import rebuild_search_tokens
+
+
+class Command(BaseCommand):
+    help = "Recomputes the token table behind search on databases without the FTS5 index."
+
+    def handle(self, *args, **options):
+        tokens = rebuild_search_tokens()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {tokens} search tokens."))
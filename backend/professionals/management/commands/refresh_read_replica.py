@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from professionals.replica import read_alias, refresh_replica
+
+
+class Command(BaseCommand):
+    help = "Copies the default SQLite database into the read replica (PROFESSIONALS_READ_DATABASE)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Keep running and take a new snapshot every INTERVAL seconds.",
+        )
+
+    def handle(self, *args, **options):
+        alias = read_alias()
+        if alias is None:
+            raise CommandError("No read database is configured; see backend/settings_replica.py.")
+        try:
+            while True:
+                seconds = refresh_replica(alias)
+                self.stdout.write(f"Refreshed {alias} in {seconds:.2f}s.")
+                if not options["interval"]:
+                    break
+                time.sleep(options["interval"])
+        except ValueError as e:
+            raise CommandError(str(e))
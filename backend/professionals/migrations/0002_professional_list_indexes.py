@@ -0,0 +1,21 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='professional',
+            index=models.Index(fields=['-created_at', '-id'], name='prof_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='professional',
+            index=models.Index(fields=['source', '-created_at', '-id'], name='prof_source_created_idx'),
+        ),
+    ]
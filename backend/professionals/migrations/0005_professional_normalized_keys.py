@@ -0,0 +1,124 @@
+# Generated by Django 6.0.2 on 2026-10-18 12:10
+
+import re
+
+from django.db import migrations, models
+
+NON_DIGITS = re.compile(r"\D+")
+
+FTS_TABLE = "professionals_professional_fts"
+COLUMNS = "full_name, company_name, job_title, email"
+OLD_VALUES = "old.full_name, old.company_name, old.job_title, old.email"
+NEW_VALUES = "new.full_name, new.company_name, new.job_title, new.email"
+
+# The AlterFields below make SQLite rebuild the professionals table,
+# which drops the triggers that keep the search index (0004) in sync.
+TRIGGERS_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {COLUMNS} ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+]
+
+
+def restore_search_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        if FTS_TABLE not in connection.introspection.table_names(cursor):
+            return
+    for sql in TRIGGERS_SQL:
+        schema_editor.execute(sql)
+
+
+def email_key(email):
+    return (email.strip().lower() or None) if email else None
+
+
+def phone_key(phone):
+    return (NON_DIGITS.sub("", phone) or phone.strip().lower() or None) if phone else None
+
+
+def backfill_keys(apps, schema_editor):
+    """
+    Fills email_key/phone_key for existing rows, oldest first. When two rows
+    normalize to the same key, only the oldest keeps it; the others are left
+    without that key, so upserts will not match them. Find them for a manual
+    merge with ``Professional.objects.filter(email__isnull=False,
+    email_key__isnull=True)``, and likewise for phone.
+    """
+    Professional = apps.get_model("professionals", "Professional")
+    seen_emails, seen_phones, batch = set(), set(), []
+    rows = Professional.objects.order_by("id").only("id", "email", "phone")
+    for prof in rows.iterator(chunk_size=2000):
+        prof.email_key, prof.phone_key = email_key(prof.email), phone_key(prof.phone)
+        for field, seen in (("email_key", seen_emails), ("phone_key", seen_phones)):
+            value = getattr(prof, field)
+            if value is None:
+                continue
+            if value in seen:
+                setattr(prof, field, None)
+            else:
+                seen.add(value)
+        batch.append(prof)
+        if len(batch) >= 2000:
+            Professional.objects.bulk_update(batch, ["email_key", "phone_key"])
+            batch = []
+    Professional.objects.bulk_update(batch, ["email_key", "phone_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0004_professional_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='professional',
+            name='email_key',
+            field=models.CharField(blank=True, editable=False, max_length=254, null=True),
+        ),
+        migrations.AddField(
+            model_name='professional',
+            name='phone_key',
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True),
+        ),
+        migrations.RunPython(backfill_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='professional',
+            name='email_key',
+            field=models.CharField(blank=True, editable=False, max_length=254, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='professional',
+            name='phone_key',
+            field=models.CharField(blank=True, editable=False, max_length=20, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='professional',
+            name='email',
+            field=models.EmailField(blank=True, max_length=254, null=True),
+        ),
+        migrations.AlterField(
+            model_name='professional',
+            name='phone',
+            field=models.CharField(blank=True, max_length=20, null=True),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+FTS_TABLE = "professionals_professional_fts"
+COLUMNS = "full_name, company_name, job_title, email"
+OLD_VALUES = "old.full_name, old.company_name, old.job_title, old.email"
+NEW_VALUES = "new.full_name, new.company_name, new.job_title, new.email"
+
+# The AddField below makes SQLite rebuild the professionals table,
+# which drops the triggers that keep the search index (0004) in sync.
+TRIGGERS_SQL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {COLUMNS} ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, {OLD_VALUES});
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS}) VALUES (new.id, {NEW_VALUES});
+    END
+    """,
+]
+
+
+def restore_search_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        if FTS_TABLE not in connection.introspection.table_names(cursor):
+            return
+    for sql in TRIGGERS_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0005_professional_normalized_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfessionalChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('professional_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted')], max_length=10)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='professional',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        # Existing rows: last known change is their creation, and the feed
+        # starts with one "created" entry per row so a sync from cursor 0 is
+        # a full snapshot.
+        migrations.RunSQL(
+            "UPDATE professionals_professional SET updated_at = created_at",
+            migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO professionals_professionalchange (professional_id, action, changed_at)
+            SELECT id, 'created', created_at FROM professionals_professional
+            ORDER BY created_at, id
+            """,
+            "DELETE FROM professionals_professionalchange",
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
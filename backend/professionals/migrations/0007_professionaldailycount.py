@@ -0,0 +1,43 @@
+# Generated by Django 6.0.2 on 2026-10-18 13:40
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def populate_counts(apps, schema_editor):
+    Professional = apps.get_model("professionals", "Professional")
+    ProfessionalDailyCount = apps.get_model("professionals", "ProfessionalDailyCount")
+    rows = (
+        Professional.objects.annotate(day=TruncDate("created_at"))
+        .values_list("source", "day")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    ProfessionalDailyCount.objects.bulk_create(
+        [ProfessionalDailyCount(source=s, day=d, count=n) for s, d, n in rows], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0006_professional_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfessionalDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('direct', 'Direct'), ('partner', 'Partner'), ('internal', 'Internal')], max_length=10)),
+                ('day', models.DateField()),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['day', 'source'],
+                'constraints': [models.UniqueConstraint(fields=('source', 'day'), name='prof_daily_count_source_day')],
+            },
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0007_professionaldailycount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bulkimportjob',
+            name='chunk_size',
+            field=models.PositiveIntegerField(default=1000),
+        ),
+        migrations.AddField(
+            model_name='bulkimportjob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
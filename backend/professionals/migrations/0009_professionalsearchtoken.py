@@ -0,0 +1,56 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:28
+
+import re
+
+from django.db import migrations, models
+
+FTS_TABLE = "professionals_professional_fts"
+SEARCH_FIELDS = ("full_name", "company_name", "job_title", "email")
+TOKEN_LENGTH = 100
+
+
+def backfill_tokens(apps, schema_editor):
+    """Fills the token table for existing rows, unless the FTS5 index serves search."""
+    connection = schema_editor.connection
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            if FTS_TABLE in connection.introspection.table_names(cursor):
+                return
+    Professional = apps.get_model("professionals", "Professional")
+    ProfessionalSearchToken = apps.get_model("professionals", "ProfessionalSearchToken")
+    batch = []
+    rows = Professional.objects.order_by("id").values_list("id", *SEARCH_FIELDS)
+    for pk, *values in rows.iterator(chunk_size=2000):
+        words = {
+            word[:TOKEN_LENGTH]
+            for value in values
+            for word in re.findall(r"\w+", (value or "").lower())
+        }
+        batch.extend(ProfessionalSearchToken(professional_id=pk, token=word) for word in words)
+        if len(batch) >= 5000:
+            ProfessionalSearchToken.objects.bulk_create(batch)
+            batch = []
+    ProfessionalSearchToken.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0008_bulkimportjob_recovery'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProfessionalSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('professional_id', models.BigIntegerField()),
+                ('token', models.CharField(max_length=100)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['token', 'professional_id'], name='prof_token_idx')],
+                'constraints': [models.UniqueConstraint(fields=('professional_id', 'token'), name='prof_token_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0009_professionalsearchtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bulkimportjob',
+            name='results_mode',
+            field=models.CharField(default='full', max_length=12),
+        ),
+    ]
@@ -1,5 +1,10 @@
+from collections import Counter
+
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from .normalization import email_key, phone_key
 
 
 class Professional(models.Model):
@@ -10,15 +15,28 @@ class Professional(models.Model):
     ]
 
     full_name = models.CharField(max_length=255)
-    email = models.EmailField(unique=True, blank=True, null=True)
+    email = models.EmailField(blank=True, null=True)
     company_name = models.CharField(max_length=255, blank=True, default="")
     job_title = models.CharField(max_length=255, blank=True, default="")
-    phone = models.CharField(max_length=20, unique=True, blank=True, null=True)
+    phone = models.CharField(max_length=20, blank=True, null=True)
     source = models.CharField(max_length=10, choices=SOURCE_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Uniqueness and upsert matching use these normalized forms, so
+    # "A@x.com"/"a@x.com" and "555-0002"/"(555) 0002" are the same person.
+    email_key = models.CharField(max_length=254, unique=True, blank=True, null=True, editable=False)
+    phone_key = models.CharField(max_length=20, unique=True, blank=True, null=True, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Trailing -id matches the keyset pagination tiebreak, so neither
+            # the plain list nor the ?source= filter needs a sort step.
+            models.Index(fields=["-created_at", "-id"], name="prof_created_id_idx"),
+            models.Index(
+                fields=["source", "-created_at", "-id"], name="prof_source_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.source})"
@@ -26,3 +44,176 @@ class Professional(models.Model):
     def clean(self):
         if not self.email and not self.phone:
             raise ValidationError("At least one of email or phone must be provided.")
+
+    def validate_unique(self, exclude=None):
+        # Report key collisions against the user-facing fields, with the
+        # messages the old unique email/phone columns produced.
+        exclude = set(exclude or ())
+        super().validate_unique(exclude=exclude | {"email_key", "phone_key"})
+        errors = {}
+        for field, key in (("email", email_key(self.email)), ("phone", phone_key(self.phone))):
+            if key is None or field in exclude:
+                continue
+            others = Professional._default_manager.filter(**{f"{field}_key": key})
+            if not self._state.adding:
+                others = others.exclude(pk=self.pk)
+            if others.exists():
+                errors[field] = [self.unique_error_message(Professional, (field,))]
+        if errors:
+            raise ValidationError(errors)
+
+    def save(self, *args, **kwargs):
+        self.email_key = email_key(self.email)
+        self.phone_key = phone_key(self.phone)
+        adding = self._state.adding
+        update_fields = kwargs.get("update_fields")
+        with transaction.atomic():
+            old_source = None
+            if not adding and (update_fields is None or "source" in update_fields):
+                old_source = (
+                    Professional._default_manager.filter(pk=self.pk)
+                    .values_list("source", flat=True)
+                    .first()
+                )
+            super().save(*args, **kwargs)
+            ProfessionalChange.objects.create(
+                professional_id=self.pk,
+                action="created" if adding else "updated",
+                changed_at=self.updated_at,
+            )
+            deltas = Counter()
+            if adding:
+                deltas[(self.source, self.created_at)] += 1
+            elif old_source is not None and old_source != self.source:
+                deltas[(old_source, self.created_at)] -= 1
+                deltas[(self.source, self.created_at)] += 1
+            ProfessionalDailyCount.objects.apply_deltas(deltas)
+
+
+class ProfessionalChange(models.Model):
+    """
+    Append-only log of writes to Professional, read by the changes feed.
+    The auto-increment id is the feed cursor. ``professional_id`` is a plain
+    column rather than a foreign key so deletions stay in the log.
+    """
+
+    ACTION_CHOICES = [
+        ("created", "Created"),
+        ("updated", "Updated"),
+        ("deleted", "Deleted"),
+    ]
+
+    professional_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"#{self.pk} {self.action} professional {self.professional_id}"
+
+
+class ProfessionalSearchToken(models.Model):
+    """
+    The words of each professional's search fields, for indexed prefix search
+    on databases without the FTS5 index. ``professionals.search`` keeps it in
+    step with every write, and leaves it empty where the FTS5 index exists.
+    """
+
+    professional_id = models.BigIntegerField()
+    token = models.CharField(max_length=100)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["professional_id", "token"], name="prof_token_unique"),
+        ]
+        indexes = [models.Index(fields=["token", "professional_id"], name="prof_token_idx")]
+
+    def __str__(self):
+        return f"{self.token!r} of professional {self.professional_id}"
+
+
+class DailyCountManager(models.Manager):
+    def apply_deltas(self, deltas):
+        """
+        Adds ``{(source, created_at): delta}`` to the matching day counters
+        in one upsert statement. Call inside the transaction that made the
+        change, so the counters commit or roll back with it.
+        """
+        totals = Counter()
+        for (source, created_at), delta in deltas.items():
+            totals[(source, timezone.localdate(created_at))] += delta
+        rows = [(source, day, delta) for (source, day), delta in totals.items() if delta]
+        if not rows:
+            return
+        connection = connections[router.db_for_write(self.model)]
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        values = ", ".join(["(%s, %s, %s)"] * len(rows))
+        params = [
+            value
+            for source, day, delta in rows
+            for value in (source, connection.ops.adapt_datefield_value(day), delta)
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (source, day, count) VALUES {values} "
+                f"ON CONFLICT (source, day) DO UPDATE SET count = {table}.count + excluded.count",
+                params,
+            )
+
+
+class ProfessionalDailyCount(models.Model):
+    """
+    Professionals created per source and day (in the current time zone),
+    kept in step with every write so stats never scan the main table.
+    ``manage.py rebuild_professional_counts`` recomputes it from scratch.
+    """
+
+    source = models.CharField(max_length=10, choices=Professional.SOURCE_CHOICES)
+    day = models.DateField()
+    count = models.IntegerField(default=0)
+
+    objects = DailyCountManager()
+
+    class Meta:
+        ordering = ["day", "source"]
+        constraints = [
+            models.UniqueConstraint(fields=["source", "day"], name="prof_daily_count_source_day"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.source}: {self.count}"
+
+
+class BulkImportJob(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    payload = models.JSONField()
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    results = models.JSONField(blank=True, null=True)
+    error = models.TextField(blank=True, default="")
+    chunk_size = models.PositiveIntegerField(default=1000)
+    # The ?results= mode it was queued with: what ``results`` keeps.
+    results_mode = models.CharField(max_length=12, default="full")
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when a worker claims the job and after every chunk; a running job
+    # whose heartbeat stops was lost with its process.
+    heartbeat_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Bulk import #{self.pk} ({self.status})"
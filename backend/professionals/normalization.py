@@ -0,0 +1,37 @@
+import re
+
+_NON_DIGITS = re.compile(r"\D+")
+
+
+def email_key(email):
+    """Canonical match key for an email: trimmed and case-folded."""
+    if not email:
+        return None
+    return email.strip().lower() or None
+
+
+def phone_key(phone):
+    """
+    Canonical match key for a phone number: its digits, so ``555-0002`` and
+    ``(555) 0002`` collide. Values with no digits fall back to their trimmed,
+    case-folded text.
+    """
+    if not phone:
+        return None
+    return _NON_DIGITS.sub("", phone) or phone.strip().lower() or None
+
+
+def normalize_keys(rows):
+    """
+    Computes ``(email_key, phone_key)`` for a batch of cleaned payloads in one
+    pass, binding the per-row work to locals so a 10k-row import stays a
+    couple of tight comprehensions.
+    """
+    strip_digits = _NON_DIGITS.sub
+    emails = [row["email"] for row in rows]
+    phones = [row["phone"] for row in rows]
+    email_keys = [e.strip().lower() or None if e else None for e in emails]
+    phone_keys = [
+        (strip_digits("", p) or p.strip().lower() or None) if p else None for p in phones
+    ]
+    return list(zip(email_keys, phone_keys))
@@ -0,0 +1,154 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .instrumentation import registry
+
+_replica_reads = ContextVar("professionals_replica_reads", default=False)
+
+# Set on a client after it writes; while present its reads stay on default.
+PIN_COOKIE = "professionals_read_primary"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+registry.describe(
+    "professionals_replica_refreshes_total",
+    "Read replica snapshots taken by refresh_replica.",
+)
+
+
+def read_alias():
+    """The configured read database, or None when reads all go to default."""
+    alias = getattr(settings, "PROFESSIONALS_READ_DATABASE", None)
+    return alias if alias and alias in connections.settings else None
+
+
+@contextmanager
+def replica_reads(request):
+    """
+    Routes reads of this app inside the block to the read alias, unless the
+    request is not a GET/HEAD or its client is pinned to default after a
+    recent write.
+    """
+    enabled = (
+        request.method in ("GET", "HEAD")
+        and PIN_COOKIE not in request.COOKIES
+        and read_alias() is not None
+    )
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class ReadReplicaRouter:
+    """
+    Sends reads of ``professionals`` models made inside ``replica_reads`` to
+    ``PROFESSIONALS_READ_DATABASE``; every other read and every write goes to
+    default. A write also ends replica reads for the rest of the block, so a
+    request reads its own writes.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get() and model._meta.app_label == "professionals":
+            return read_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        _replica_reads.set(False)
+        # Explicit, or an instance loaded from the replica would be saved there.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        same_data = {DEFAULT_DB_ALIAS, read_alias()}
+        if obj1._state.db in same_data and obj2._state.db in same_data:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica is a copy of default, schema included.
+        if db == read_alias():
+            return False
+        return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Pins a client's reads to default for ``PROFESSIONALS_REPLICA_PIN_SECONDS``
+    after any successful write, with a cookie, so it sees its own writes
+    however stale the replica is. Does nothing without a read alias.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400 and read_alias():
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=getattr(settings, "PROFESSIONALS_REPLICA_PIN_SECONDS", 15),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+def snapshot_version(alias):
+    """
+    Identifies the snapshot held by the read database ``alias``. SQLite's
+    backup API increments the destination's schema cookie on every copy, so
+    each ``refresh_replica`` yields a new value, visible to every process
+    that reads the file.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute("PRAGMA schema_version")
+        return cursor.fetchone()[0]
+
+
+def refresh_replica(alias=None):
+    """
+    Copies the default SQLite database into the read alias's file with
+    SQLite's online backup API. The list cache needs no invalidation here:
+    its keys include ``snapshot_version``, which the copy changes. The copy is one
+    transaction on the replica: open readers keep the old snapshot (WAL) or
+    wait for the new one, and never see a partial copy. Returns the seconds
+    taken.
+    """
+    alias = alias or read_alias()
+    if alias is None:
+        raise ValueError("No read database is configured (PROFESSIONALS_READ_DATABASE).")
+    source = connections[DEFAULT_DB_ALIAS]
+    replica = connections[alias]
+    if source.vendor != "sqlite" or replica.vendor != "sqlite":
+        raise ValueError("Snapshots are only supported between SQLite databases.")
+
+    start = time.perf_counter()
+    source.ensure_connection()
+    timeout = replica.settings_dict["OPTIONS"].get("timeout", 5)
+    target = sqlite3.connect(replica.settings_dict["NAME"], timeout=timeout)
+    try:
+        source.connection.backup(target)
+    finally:
+        target.close()
+    registry.inc("professionals_replica_refreshes_total")
+    return time.perf_counter() - start
@@ -0,0 +1,193 @@
+import re
+from functools import lru_cache
+
+from django.db import connections, router, transaction
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, Value, When
+from django.db.models.expressions import RawSQL
+
+from .models import Professional, ProfessionalSearchToken
+
+FTS_TABLE = "professionals_professional_fts"
+SEARCH_FIELDS = ("full_name", "company_name", "job_title", "email")
+MAX_TERMS = 8
+TOKEN_LENGTH = ProfessionalSearchToken._meta.get_field("token").max_length
+TOKEN_BATCH_SIZE = 500
+# Multi-word fallback searches count up to this many tokens per term; a term
+# under the limit drives the query.
+TOKEN_PROBE_LIMIT = 1000
+
+# The index and its sync triggers are created by migration 0004. SQLite
+# drops the triggers whenever a migration rebuilds the professionals table,
+# so such a migration must recreate them with its own copy of the SQL, as
+# 0005 and 0006 do.
+
+
+def words(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def search_terms(query):
+    return words(query)[:MAX_TERMS]
+
+
+@lru_cache(maxsize=None)
+def has_fts_index(using="default"):
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        return FTS_TABLE in connection.introspection.table_names(cursor)
+
+
+def _match_expression(terms):
+    # Every term must match, each as a prefix: "jan do" finds "Jane Doe".
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def professional_tokens(professional):
+    """The distinct words of ``professional``'s search fields, split as search terms are."""
+    return {
+        word[:TOKEN_LENGTH]
+        for field in SEARCH_FIELDS
+        for word in words(getattr(professional, field) or "")
+    }
+
+
+def index_search_tokens(professionals):
+    """
+    Replaces the fallback tokens of the saved ``professionals``. Call inside
+    the write's transaction. Does nothing where the FTS5 index serves
+    search, since its triggers already keep it in sync.
+    """
+    using = router.db_for_write(ProfessionalSearchToken)
+    if has_fts_index(using):
+        return
+    professionals = list(professionals)
+    for i in range(0, len(professionals), TOKEN_BATCH_SIZE):
+        batch = professionals[i : i + TOKEN_BATCH_SIZE]
+        ProfessionalSearchToken.objects.filter(
+            professional_id__in=[p.pk for p in batch]
+        ).delete()
+        ProfessionalSearchToken.objects.bulk_create(
+            [
+                ProfessionalSearchToken(professional_id=p.pk, token=token)
+                for p in batch
+                for token in professional_tokens(p)
+            ],
+            batch_size=TOKEN_BATCH_SIZE,
+        )
+
+
+def forget_search_tokens(ids):
+    """Drops the fallback tokens of deleted professionals."""
+    if not has_fts_index(router.db_for_write(ProfessionalSearchToken)):
+        ProfessionalSearchToken.objects.filter(professional_id__in=ids).delete()
+
+
+def rebuild_search_tokens():
+    """
+    Rebuilds the whole token table from the professionals table, whether or
+    not the FTS5 index exists. Returns the number of tokens.
+    """
+    count = 0
+    batch = []
+    with transaction.atomic():
+        ProfessionalSearchToken.objects.all().delete()
+        rows = Professional.objects.order_by("id").only("id", *SEARCH_FIELDS)
+        for professional in rows.iterator(chunk_size=2000):
+            batch.extend(
+                ProfessionalSearchToken(professional_id=professional.pk, token=token)
+                for token in professional_tokens(professional)
+            )
+            if len(batch) >= 5000:
+                ProfessionalSearchToken.objects.bulk_create(batch, batch_size=TOKEN_BATCH_SIZE)
+                count += len(batch)
+                batch = []
+        ProfessionalSearchToken.objects.bulk_create(batch, batch_size=TOKEN_BATCH_SIZE)
+    return count + len(batch)
+
+
+def _token_filter(terms):
+    """
+    Fallback without FTS5: every term must start a word of some search
+    field. Each term is a range scan of the token index, where the words
+    starting with it sort together. When one term is rare, rows come from
+    its scan alone and every other term is one probe of the
+    ``(professional_id, token)`` index per row.
+    """
+    ranges = [
+        ProfessionalSearchToken.objects.filter(token__gte=term, token__lt=term + "\uffff")
+        for term in dict.fromkeys(term[:TOKEN_LENGTH] for term in terms)
+    ]
+    if len(ranges) > 1:
+        counts = [tokens[:TOKEN_PROBE_LIMIT].count() for tokens in ranges]
+        rarest = counts.index(min(counts))
+        if counts[rarest] < TOKEN_PROBE_LIMIT:
+            ranges.insert(0, ranges.pop(rarest))
+            condition = Q(pk__in=ranges[0].values("professional_id"))
+            for tokens in ranges[1:]:
+                condition &= Exists(tokens.filter(professional_id=OuterRef("pk")))
+            return condition
+    # All terms common: intersecting their id lists beats probing per row.
+    condition = Q()
+    for tokens in ranges:
+        condition &= Q(pk__in=tokens.values("professional_id"))
+    return condition
+
+
+def search_filter(queryset, query):
+    """Narrows ``queryset`` to rows matching ``query``, without ranking."""
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+    if has_fts_index(queryset.db):
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+                [_match_expression(terms)],
+            )
+        )
+    return queryset.filter(_token_filter(terms))
+
+
+def ranked_search(query, source=None, limit=50, offset=0):
+    """
+    Returns the ids of professionals matching ``query``, best match first.
+
+    Uses the FTS5 index (every match ranked by bm25, with the page's LIMIT
+    and OFFSET applied inside the FTS query) when the database has one, and
+    otherwise the token index, ranked by the number of fields that start
+    with a query term.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    using = router.db_for_read(Professional)
+    if has_fts_index(using):
+        sql = f"SELECT f.rowid FROM {FTS_TABLE} f"
+        params = [_match_expression(terms)]
+        if source:
+            sql += f" JOIN {Professional._meta.db_table} p ON p.id = f.rowid"
+        sql += f" WHERE {FTS_TABLE} MATCH %s"
+        if source:
+            sql += " AND p.source = %s"
+            params.append(source)
+        sql += " ORDER BY f.rank LIMIT %s OFFSET %s"
+        with connections[using].cursor() as cursor:
+            cursor.execute(sql, params + [limit, offset])
+            return [row[0] for row in cursor.fetchall()]
+
+    qs = Professional.objects.filter(_token_filter(terms))
+    if source:
+        qs = qs.filter(source=source)
+    score = Value(0)
+    for term in terms:
+        for field in SEARCH_FIELDS:
+            score += Case(
+                When(**{f"{field}__istartswith": term}, then=1),
+                default=0,
+                output_field=IntegerField(),
+            )
+    qs = qs.annotate(score=score).order_by("-score", "-created_at", "-id")
+    return list(qs.values_list("id", flat=True)[offset : offset + limit])
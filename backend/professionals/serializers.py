@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
-from .models import Professional
+from .models import BulkImportJob, Professional
+from .normalization import email_key, phone_key
 
 
 class ProfessionalSerializer(serializers.ModelSerializer):
@@ -18,6 +19,25 @@ class ProfessionalSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at"]
 
+    def validate_email(self, value):
+        return self._validate_unique_key("email", email_key(value), value)
+
+    def validate_phone(self, value):
+        return self._validate_unique_key("phone", phone_key(value), value)
+
+    def _validate_unique_key(self, field, key, value):
+        # Uniqueness lives on the normalized key columns, so the model
+        # fields no longer carry DRF's UniqueValidator.
+        if key is not None:
+            others = Professional.objects.filter(**{f"{field}_key": key})
+            if self.instance is not None:
+                others = others.exclude(pk=self.instance.pk)
+            if others.exists():
+                raise serializers.ValidationError(
+                    f"professional with this {field} already exists."
+                )
+        return value
+
     def validate(self, attrs):
         attrs["email"] = attrs.get("email") or None
         attrs["phone"] = attrs.get("phone") or None
@@ -28,6 +48,46 @@ class ProfessionalSerializer(serializers.ModelSerializer):
         return attrs
 
 
+LIST_FIELDS = ProfessionalSerializer.Meta.fields
+_created_at_field = serializers.DateTimeField()
+
+
+def parse_list_fields(value):
+    """
+    Parses a ``?fields=`` value into a tuple of list fields, in
+    ``LIST_FIELDS`` order. Returns ``(fields, unknown)``; ``fields`` is all of
+    ``LIST_FIELDS`` when ``value`` is empty.
+    """
+    requested = {name.strip() for name in (value or "").split(",") if name.strip()}
+    if not requested:
+        return tuple(LIST_FIELDS), []
+    unknown = sorted(requested.difference(LIST_FIELDS))
+    return tuple(name for name in LIST_FIELDS if name in requested), unknown
+
+
+def serialize_professional_rows(rows, fields=LIST_FIELDS):
+    """
+    Read-only fast path for list responses.
+
+    Takes value tuples in ``fields`` order (e.g. from
+    ``values_list(*fields)``) and builds the same dicts
+    ``ProfessionalSerializer`` would, restricted to those fields, without
+    per-row field binding. Every other field is a plain string, integer or
+    None, so only ``created_at`` needs DRF's formatting.
+    """
+    fields = list(fields)
+    created_at_index = fields.index("created_at") if "created_at" in fields else None
+    out = []
+    for row in rows:
+        item = dict(zip(fields, row))
+        if created_at_index is not None:
+            created_at = row[created_at_index]
+            if created_at is not None:
+                item["created_at"] = _created_at_field.to_representation(created_at)
+        out.append(item)
+    return out
+
+
 class BulkProfessionalItemSerializer(serializers.Serializer):
     full_name = serializers.CharField(max_length=255)
     email = serializers.EmailField(required=False, allow_blank=True, default=None)
@@ -52,3 +112,23 @@ class BulkProfessionalItemSerializer(serializers.Serializer):
                 "At least one of email or phone must be provided."
             )
         return attrs
+
+
+class BulkImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = BulkImportJob
+        fields = [
+            "id",
+            "status",
+            "total",
+            "processed",
+            "created",
+            "updated",
+            "failed",
+            "results_mode",
+            "results",
+            "error",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .db import apply_sqlite_pragmas
+from .instrumentation import install_query_recorder
+from .list_cache import bump_list_version
+from .models import Professional, ProfessionalChange, ProfessionalDailyCount
+from .search import forget_search_tokens, index_search_tokens
+
+
+@receiver(post_save, sender=Professional)
+@receiver(post_delete, sender=Professional)
+def invalidate_list_cache(sender, using, **kwargs):
+    # After the commit: a read between the write and the commit would
+    # otherwise cache the old rows under the new version.
+    transaction.on_commit(bump_list_version, using=using)
+
+
+@receiver(post_delete, sender=Professional)
+def record_deletion(sender, instance, **kwargs):
+    # Sent inside the deletion's transaction, for queryset deletes too.
+    ProfessionalChange.objects.create(professional_id=instance.pk, action="deleted")
+    ProfessionalDailyCount.objects.apply_deltas({(instance.source, instance.created_at): -1})
+    forget_search_tokens([instance.pk])
+
+
+@receiver(post_save, sender=Professional)
+def index_saved_professional(sender, instance, **kwargs):
+    # Inside Professional.save()'s transaction, like the change log entry.
+    index_search_tokens([instance])
+
+
+connection_created.connect(install_query_recorder, dispatch_uid="professionals.query_recorder")
+connection_created.connect(apply_sqlite_pragmas, dispatch_uid="professionals.sqlite_pragmas")
@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Professional, ProfessionalDailyCount
+
+SOURCES = [source for source, _ in Professional.SOURCE_CHOICES]
+DEFAULT_STATS_DAYS = 30
+MAX_STATS_DAYS = 366
+
+
+def get_stats(days=DEFAULT_STATS_DAYS):
+    """
+    Totals per source and a created-per-day histogram for the last ``days``
+    days (today included, zero days filled in), read from the counter table.
+    """
+    by_source = dict.fromkeys(SOURCES, 0)
+    totals = ProfessionalDailyCount.objects.values_list("source").annotate(n=Sum("count"))
+    for source, n in totals.order_by():
+        by_source[source] = n
+
+    today = timezone.localdate()
+    first = today - timedelta(days=days - 1)
+    histogram = {
+        first + timedelta(days=i): dict.fromkeys(SOURCES, 0) for i in range(days)
+    }
+    recent = ProfessionalDailyCount.objects.filter(day__gte=first, day__lte=today)
+    for source, day, n in recent.values_list("source", "day", "count"):
+        histogram[day][source] = n
+
+    return {
+        "total": sum(by_source.values()),
+        "by_source": by_source,
+        "created_per_day": [
+            {"date": day.isoformat(), "total": sum(counts.values()), **counts}
+            for day, counts in histogram.items()
+        ],
+    }
+
+
+def rebuild_counts():
+    """Recomputes every counter with one aggregate over the professionals table."""
+    with transaction.atomic():
+        rows = (
+            Professional.objects.annotate(day=TruncDate("created_at"))
+            .values_list("source", "day")
+            .annotate(n=Count("id"))
+            .order_by()
+        )
+        counts = [ProfessionalDailyCount(source=s, day=d, count=n) for s, d, n in rows]
+        ProfessionalDailyCount.objects.all().delete()
+        ProfessionalDailyCount.objects.bulk_create(counts, batch_size=500)
+    return len(counts)
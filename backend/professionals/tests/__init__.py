@@ -2,3 +2,19 @@ from .test_models import *
 from .test_create import *
 from .test_list import *
 from .test_bulk import *
+from .test_bulk_stream import *
+from .test_query_plans import *
+from .test_validation import *
+from .test_async import *
+from .test_bulk_jobs import *
+from .test_search import *
+from .test_instrumentation import *
+from .test_export import *
+from .test_changes import *
+from .test_stats import *
+from .test_database_profile import *
+from .test_import_command import *
+from .test_compression import *
+from .test_replica import *
+from .test_limits import *
+from .test_api_profile import *
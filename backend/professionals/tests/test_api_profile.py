@@ -0,0 +1,60 @@
+import importlib
+
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from professionals.limits import client_ident
+from professionals.models import Professional
+
+api = importlib.import_module("backend.settings_api")
+# Views read their renderer, parser and authentication classes when they are
+# defined, so only the URLconf, middleware and anonymous user can be swapped
+# in a test; the class lists are checked on the settings module.
+API_PROFILE = override_settings(
+    ROOT_URLCONF=api.ROOT_URLCONF,
+    MIDDLEWARE=api.MIDDLEWARE,
+    REST_FRAMEWORK=api.REST_FRAMEWORK,
+)
+
+
+class APIProfileSettingsTest(SimpleTestCase):
+    def test_profile_is_json_only_without_contrib_apps(self):
+        self.assertEqual(api.INSTALLED_APPS, ["corsheaders", "professionals"])
+        self.assertFalse([name for name in api.MIDDLEWARE if "sessions" in name or "auth" in name])
+        self.assertEqual(api.TEMPLATES, [])
+        framework = api.REST_FRAMEWORK
+        self.assertEqual(framework["DEFAULT_RENDERER_CLASSES"], ["professionals.instrumentation.TimedJSONRenderer"])
+        self.assertEqual(framework["DEFAULT_PARSER_CLASSES"], ["rest_framework.parsers.JSONParser"])
+        self.assertEqual(framework["DEFAULT_AUTHENTICATION_CLASSES"], [])
+
+    @API_PROFILE
+    def test_anonymous_clients_are_identified_by_address(self):
+        request = Request(RequestFactory().post("/", REMOTE_ADDR="10.0.0.7"))
+        self.assertIsNone(request.user)
+        self.assertEqual(client_ident(request), "addr:10.0.0.7")
+
+
+@API_PROFILE
+class APIProfileEndpointsTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_api_is_served_and_admin_is_not(self):
+        res = self.client.post(
+            "/api/professionals/",
+            {"full_name": "Lean", "email": "lean@test.com", "source": "direct"},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Set-Cookie", res)
+        res = self.client.get("/api/professionals/")
+        self.assertEqual([p["full_name"] for p in res.json()], ["Lean"])
+        self.assertEqual(self.client.get("/admin/").status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_bulk_throttle_without_users(self):
+        rows = [{"full_name": "B", "email": "b@test.com", "source": "direct"}]
+        res = self.client.post("/api/professionals/bulk/", rows, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(Professional.objects.count(), 1)
@@ -0,0 +1,132 @@
+import json
+from unittest import mock
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TransactionTestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.models import Professional
+
+
+class AsyncEndpointTest(TransactionTestCase):
+    """The bulk upsert runs on a pool thread with its own connection, so use real commits."""
+
+    def setUp(self):
+        self.client = AsyncClient()
+        self.url = "/api/async/professionals/"
+        self.bulk_url = "/api/async/professionals/bulk/"
+
+    async def post_json(self, url, payload):
+        return await self.client.post(url, json.dumps(payload), content_type="application/json")
+
+    async def streamed_body(self, res):
+        self.assertTrue(res.streaming)
+        return b"".join([chunk async for chunk in res.streaming_content])
+
+    async def test_list_matches_sync_endpoint(self):
+        await Professional.objects.acreate(full_name="A", email="a@test.com", source="direct")
+        await Professional.objects.acreate(full_name="B", phone="555-0001", source="partner")
+        res = await self.client.get(self.url, {"source": "partner"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        body = json.loads(await self.streamed_body(res))
+        self.assertEqual([p["full_name"] for p in body], ["B"])
+
+        res = await self.client.get(self.url)
+        sync_res = await sync_to_async(APIClient().get)("/api/professionals/")
+        self.assertEqual(await self.streamed_body(res), sync_res.content)
+        self.assertEqual(res["ETag"], sync_res["ETag"])
+
+    async def test_list_streams_in_chunks(self):
+        await Professional.objects.abulk_create(
+            [Professional(full_name=f"P{i}", phone=f"555-{i:04d}", source="direct") for i in range(5)]
+        )
+        with mock.patch("professionals.async_views.LIST_CHUNK_SIZE", 2):
+            res = await self.client.get(self.url)
+            chunks = [chunk async for chunk in res.streaming_content]
+        self.assertEqual(len(chunks), 5)  # "[", three chunks of rows, "]"
+        sync_res = await sync_to_async(APIClient().get)("/api/professionals/")
+        self.assertEqual(b"".join(chunks), sync_res.content)
+
+    async def test_list_answers_matching_etag_with_304(self):
+        await Professional.objects.acreate(full_name="A", email="a@test.com", source="direct")
+        etag = (await self.client.get(self.url))["ETag"]
+        res = await self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        await sync_to_async(APIClient().post)(
+            "/api/professionals/", {"full_name": "B", "phone": "555-0001", "source": "direct"}, format="json"
+        )
+        res = await self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+
+    async def test_page_size_matches_sync_endpoint(self):
+        for name in ("A", "B", "C"):
+            await Professional.objects.acreate(full_name=name, email=f"{name}@test.com", source="direct")
+        sync_client = APIClient()
+        params = {"page_size": 2, "fields": "id,full_name"}
+        res = await self.client.get(self.url, params)
+        sync_res = await sync_to_async(sync_client.get)("/api/professionals/", params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json()["results"], sync_res.json()["results"])
+        self.assertEqual(len(res.json()["results"]), 2)
+        self.assertEqual(res["ETag"], sync_res["ETag"])
+
+        next_url = urlsplit(res.json()["next"])
+        self.assertEqual(next_url.path, self.url)
+        self.assertEqual(next_url.query, urlsplit(sync_res.json()["next"]).query)
+        res = await self.client.get(f"{self.url}?{next_url.query}")
+        sync_res = await sync_to_async(sync_client.get)(f"/api/professionals/?{next_url.query}")
+        self.assertEqual(res.json(), sync_res.json())
+        self.assertEqual([p["full_name"] for p in res.json()["results"]], ["A"])
+
+    async def test_list_sparse_fields(self):
+        await Professional.objects.acreate(full_name="A", email="a@test.com", source="direct")
+        res = await self.client.get(self.url, {"fields": "id,full_name"})
+        self.assertEqual(list(json.loads(await self.streamed_body(res))[0]), ["id", "full_name"])
+        res = await self.client.get(self.url, {"fields": "nope"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_create(self):
+        res = await self.post_json(
+            self.url, {"full_name": "New", "email": "new@test.com", "source": "direct"}
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(await Professional.objects.acount(), 1)
+
+    async def test_create_validation_error(self):
+        res = await self.post_json(self.url, {"full_name": "No Contact", "source": "direct"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_bulk_upsert(self):
+        await Professional.objects.acreate(full_name="Old", email="up@test.com", source="direct")
+        payload = [
+            {"full_name": "Updated", "email": "up@test.com", "source": "partner"},
+            {"full_name": "New", "phone": "555-0002", "source": "internal"},
+            {"full_name": "Bad", "source": "invalid"},
+        ]
+        res = await self.post_json(self.bulk_url, payload)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        statuses = [r["status"] for r in res.json()["results"]]
+        self.assertEqual(statuses, ["updated", "created", "error"])
+        self.assertEqual(await Professional.objects.acount(), 2)
+
+    async def test_bulk_rejects_non_list(self):
+        res = await self.post_json(self.bulk_url, {"not": "a list"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_bulk_rejects_malformed_json(self):
+        res = await self.client.post(self.bulk_url, "[{", content_type="application/json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_bulk_atomic_all(self):
+        payload = [
+            {"full_name": "New", "phone": "555-0002", "source": "internal"},
+            {"full_name": "Bad", "source": "invalid"},
+        ]
+        res = await self.post_json(self.bulk_url + "?atomic=all", payload)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([r["index"] for r in res.json()["results"]], [1])
+        self.assertEqual(await Professional.objects.acount(), 0)
@@ -1,8 +1,12 @@
+from unittest import mock
+
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from professionals.models import Professional
+from professionals.models import Professional, ProfessionalChange
 
 
 class BulkEndpointTest(TestCase):
@@ -99,3 +103,206 @@ class BulkEndpointTest(TestCase):
         self.assertEqual(updated["email"], "match@test.com")
         self.assertEqual(updated["full_name"], "Should Update Email Match")
         self.assertEqual(Professional.objects.count(), 2)
+
+    def test_bulk_duplicate_key_in_payload_updates_earlier_item(self):
+        payload = [
+            {"full_name": "First", "email": "dup@test.com", "source": "direct"},
+            {"full_name": "Second", "email": "dup@test.com", "source": "partner"},
+        ]
+        res = self.client.post(self.url, payload, format="json")
+        results = res.data["results"]
+        self.assertEqual(results[0]["status"], "created")
+        self.assertEqual(results[1]["status"], "updated")
+        self.assertEqual(results[0]["professional"]["full_name"], "First")
+        self.assertEqual(results[0]["professional"]["id"], results[1]["professional"]["id"])
+        self.assertEqual(Professional.objects.get().full_name, "Second")
+
+    def test_bulk_repeated_key_collapses_to_one_write(self):
+        existing = Professional.objects.create(
+            full_name="Original", email="rep@test.com", source="direct"
+        )
+        payload = [
+            {"full_name": f"Take {i}", "email": "REP@test.com", "source": "partner"}
+            for i in range(3)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(self.url, payload, format="json")
+        updates = [q for q in queries if 'UPDATE "professionals_professional"' in q["sql"]]
+        self.assertEqual(len(updates), 1)
+        results = res.data["results"]
+        self.assertEqual([r["status"] for r in results], ["updated"] * 3)
+        self.assertEqual([r["professional"]["full_name"] for r in results], ["Take 0", "Take 1", "Take 2"])
+        existing.refresh_from_db()
+        self.assertEqual((existing.full_name, existing.source), ("Take 2", "partner"))
+        # The search index follows the raw update.
+        res = self.client.get("/api/professionals/search/", {"q": "take"})
+        self.assertEqual([p["id"] for p in res.data["results"]], [existing.pk])
+
+    def test_bulk_unique_conflict_reports_model_error(self):
+        Professional.objects.create(
+            full_name="Email Owner", email="owner@test.com", source="direct"
+        )
+        Professional.objects.create(
+            full_name="Phone Owner", phone="555-0040", source="direct"
+        )
+        payload = [
+            {
+                "full_name": "Clash",
+                "email": "owner@test.com",
+                "phone": "555-0040",
+                "source": "partner",
+            },
+        ]
+        res = self.client.post(self.url, payload, format="json")
+        result = res.data["results"][0]
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(
+            result["errors"],
+            "{'phone': ['Professional with this Phone already exists.']}",
+        )
+        self.assertEqual(
+            Professional.objects.get(email="owner@test.com").full_name, "Email Owner"
+        )
+
+    def test_bulk_matches_on_normalized_keys(self):
+        by_email = Professional.objects.create(
+            full_name="Email", email="case@test.com", source="direct"
+        )
+        by_phone = Professional.objects.create(
+            full_name="Phone", phone="555-0100", source="direct"
+        )
+        payload = [
+            {"full_name": "Email 2", "email": "CASE@Test.com", "source": "partner"},
+            {"full_name": "Phone 2", "phone": "(555) 0100", "source": "partner"},
+            {"full_name": "Phone 3", "phone": "555 0100", "source": "internal"},
+        ]
+        res = self.client.post(self.url, payload, format="json")
+        self.assertEqual(
+            [r["status"] for r in res.data["results"]], ["updated", "updated", "updated"]
+        )
+        self.assertEqual(res.data["results"][0]["professional"]["id"], by_email.pk)
+        self.assertEqual(res.data["results"][2]["professional"]["id"], by_phone.pk)
+        self.assertEqual(Professional.objects.count(), 2)
+        by_phone.refresh_from_db()
+        self.assertEqual((by_phone.phone, by_phone.phone_key), ("555 0100", "5550100"))
+
+    def test_bulk_results_modes(self):
+        payload = [
+            {"full_name": "One", "email": "one@test.com", "source": "direct"},
+            {"full_name": "Bad", "source": "direct"},
+        ]
+        res = self.client.post(self.url + "?results=summary", payload, format="json")
+        self.assertEqual(
+            res.data, {"summary": {"total": 2, "created": 1, "updated": 0, "error": 1}}
+        )
+        res = self.client.post(self.url + "?results=errors_only", payload, format="json")
+        self.assertEqual(res.data["summary"]["updated"], 1)
+        self.assertEqual([r["index"] for r in res.data["results"]], [1])
+        res = self.client.post(self.url + "?results=everything", payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_query_count_grows_only_with_insert_batches(self):
+        # bulk_create splits an INSERT at the database's bound-parameter limit
+        # (999 // 10 columns = 99 rows on SQLite); everything else is one query.
+        fields = [f for f in Professional._meta.concrete_fields if not f.primary_key]
+        per_insert = connection.ops.bulk_batch_size(fields, []) or 100
+
+        def payload(n, offset):
+            return [
+                {
+                    "full_name": f"P{i}",
+                    "email": f"p{i}@test.com",
+                    "phone": f"555-{i:04d}",
+                    "source": "direct",
+                }
+                for i in range(offset, offset + n)
+            ]
+
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, payload(5, 0), format="json")
+        with CaptureQueriesContext(connection) as large:
+            self.client.post(self.url, payload(100, 100), format="json")
+        inserts = -(-100 // per_insert)
+        self.assertEqual(len(large), len(small) + inserts - 1)
+        self.assertEqual(Professional.objects.count(), 105)
+
+    def test_bulk_update_query_count_does_not_grow_with_batch_size(self):
+        def payload(n, name):
+            return [
+                {"full_name": name, "email": f"u{i}@test.com", "phone": f"555-{i:04d}", "source": "direct"}
+                for i in range(n)
+            ]
+
+        self.client.post(self.url, payload(60, "Created"), format="json")
+        with CaptureQueriesContext(connection) as small:
+            self.client.post(self.url, payload(5, "Updated"), format="json")
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.post(self.url, payload(60, "Updated"), format="json")
+        self.assertEqual(len(small), len(large))
+        self.assertEqual({r["status"] for r in res.data["results"]}, {"updated"})
+        self.assertEqual(Professional.objects.filter(full_name="Updated").count(), 60)
+
+    def test_bulk_commits_per_chunk(self):
+        payload = [
+            {"full_name": f"C{i}", "email": f"c{i}@test.com", "source": "direct"}
+            for i in range(5)
+        ]
+        res = self.client.post(self.url + "?chunk_size=2", payload, format="json")
+        self.assertEqual([r["index"] for r in res.data["results"]], [0, 1, 2, 3, 4])
+        self.assertEqual(Professional.objects.count(), 5)
+
+        # A failure in the third chunk leaves the first two committed.
+        from professionals import ingest
+
+        calls = []
+
+        def fail_third(chunk, **kwargs):
+            calls.append(chunk)
+            if len(calls) == 3:
+                raise RuntimeError("crash")
+            return real(chunk, **kwargs)
+
+        real = ingest.bulk_upsert
+        more = [{**item, "email": f"more{i}@test.com"} for i, item in enumerate(payload)]
+        with mock.patch.object(ingest, "bulk_upsert", side_effect=fail_third):
+            with self.assertRaises(RuntimeError):
+                self.client.post(self.url + "?chunk_size=2", more, format="json")
+        self.assertEqual(Professional.objects.filter(email__startswith="more").count(), 4)
+
+    def test_bulk_atomic_all_is_all_or_nothing(self):
+        payload = [
+            {"full_name": "Good", "email": "good@test.com", "source": "direct"},
+            {"full_name": "Bad", "source": "direct"},
+            {"full_name": "Later", "email": "later@test.com", "source": "direct"},
+        ]
+        res = self.client.post(self.url + "?atomic=all&chunk_size=1", payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data["error"], "Nothing was written: 1 of 3 items failed.")
+        self.assertEqual([r["index"] for r in res.data["results"]], [1])
+        self.assertEqual(Professional.objects.count(), 0)
+        self.assertEqual(ProfessionalChange.objects.count(), 0)
+
+        res = self.client.post(self.url + "?atomic=all", [payload[0], payload[2]], format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_bulk_rejects_bad_chunking_params(self):
+        for query in ("?chunk_size=0", "?chunk_size=x", "?atomic=none", "?atomic=all&async=true"):
+            res = self.client.post(self.url + query, [], format="json")
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_sequential_fallback_isolates_failed_rows_with_savepoints(self):
+        Professional.objects.create(full_name="Email Owner", email="owner@test.com", source="direct")
+        Professional.objects.create(full_name="Phone Owner", phone="555-0040", source="direct")
+        payload = [
+            {"full_name": "Before", "email": "before@test.com", "source": "direct"},
+            {"full_name": "Clash", "email": "owner@test.com", "phone": "555-0040", "source": "partner"},
+            {"full_name": "After", "email": "after@test.com", "source": "direct"},
+        ]
+        # Skip model validation so the clash reaches the database.
+        with mock.patch("professionals.upsert._apply", side_effect=IntegrityError), \
+                mock.patch.object(Professional, "full_clean"):
+            res = self.client.post(self.url, payload, format="json")
+        statuses = [r["status"] for r in res.data["results"]]
+        self.assertEqual(statuses, ["created", "error", "created"])
+        self.assertEqual(Professional.objects.count(), 4)
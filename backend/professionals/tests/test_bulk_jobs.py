@@ -0,0 +1,120 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.jobs import recover_bulk_imports, run_bulk_import
+from professionals.models import BulkImportJob, Professional
+
+
+class BulkImportJobTest(TransactionTestCase):
+    """Jobs run on the worker pool with their own connection, so use real commits."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/professionals/bulk/?async=true"
+
+    def wait_for(self, job_url, timeout=10):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            res = self.client.get(job_url)
+            if res.data["status"] in ("succeeded", "failed"):
+                return res
+            time.sleep(0.05)
+        self.fail("bulk import job did not finish")
+
+    def test_async_import_returns_job_and_reports_results(self):
+        Professional.objects.create(full_name="Old", email="up@test.com", source="direct")
+        payload = [
+            {"full_name": "Updated", "email": "up@test.com", "source": "partner"},
+            {"full_name": "New", "phone": "555-0001", "source": "internal"},
+            {"full_name": "Bad", "source": "invalid"},
+        ]
+        res = self.client.post(self.url, payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(res.data["total"], 3)
+        self.assertTrue(res["Location"].endswith(f"/api/professionals/bulk/jobs/{res.data['id']}/"))
+
+        job = self.wait_for(res["Location"]).data
+        self.assertEqual(job["status"], "succeeded")
+        self.assertEqual(
+            (job["processed"], job["created"], job["updated"], job["failed"]), (3, 1, 1, 1)
+        )
+        self.assertEqual([r["status"] for r in job["results"]], ["updated", "created", "error"])
+        self.assertEqual(BulkImportJob.objects.get().payload, [])
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_async_import_keeps_results_as_requested(self):
+        payload = [
+            {"full_name": "Good", "email": "good@test.com", "source": "direct"},
+            {"full_name": "Bad", "source": "invalid"},
+        ]
+        res = self.client.post(f"{self.url}&results=errors_only", payload, format="json")
+        job = self.wait_for(res["Location"]).data
+        self.assertEqual(job["results_mode"], "errors_only")
+        self.assertEqual([(r["index"], r["status"]) for r in job["results"]], [(1, "error")])
+
+        payload[0]["email"] = "other@test.com"
+        res = self.client.post(f"{self.url}&results=summary", payload, format="json")
+        job = self.wait_for(res["Location"]).data
+        self.assertEqual((job["created"], job["failed"], job["results"]), (1, 1, None))
+
+    def test_async_import_rejects_non_list(self):
+        res = self.client.post(self.url, {"not": "a list"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(BulkImportJob.objects.exists())
+
+    def test_unknown_job_returns_404(self):
+        res = self.client.get("/api/professionals/bulk/jobs/999/")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class BulkImportRecoveryTest(TransactionTestCase):
+    def job(self, status, age, heartbeat_age=None):
+        now = timezone.now()
+        job = BulkImportJob.objects.create(
+            status=status,
+            payload=[{"full_name": f"{status} {age}", "email": f"{status}{age}@test.com", "source": "direct"}],
+            total=1,
+        )
+        BulkImportJob.objects.filter(pk=job.pk).update(
+            created_at=now - timedelta(seconds=age),
+            heartbeat_at=None if heartbeat_age is None else now - timedelta(seconds=heartbeat_age),
+        )
+        return job.pk
+
+    def test_stranded_jobs_are_requeued_or_failed(self):
+        stale_pending = self.job("pending", 600)
+        fresh_pending = self.job("pending", 5)
+        orphaned = self.job("running", 900, heartbeat_age=600)
+        live = self.job("running", 900, heartbeat_age=5)
+
+        with self.assertLogs("professionals.jobs", "WARNING") as logs:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                requeued, failed = recover_bulk_imports(executor)
+        self.assertEqual((requeued, failed), ([stale_pending], [orphaned]))
+        self.assertEqual(
+            logs.output,
+            [f"WARNING:professionals.jobs:Bulk import recovery: requeued jobs [{stale_pending}], "
+             f"failed jobs [{orphaned}]"],
+        )
+
+        statuses = dict(BulkImportJob.objects.values_list("pk", "status"))
+        self.assertEqual(
+            [statuses[pk] for pk in (stale_pending, fresh_pending, orphaned, live)],
+            ["succeeded", "pending", "failed", "running"],
+        )
+        self.assertIn("Interrupted", BulkImportJob.objects.get(pk=orphaned).error)
+        self.assertEqual(list(Professional.objects.values_list("full_name", flat=True)), ["pending 600"])
+
+    def test_a_job_runs_once_however_often_it_is_queued(self):
+        job_id = self.job("pending", 600)
+        run_bulk_import(job_id)
+        BulkImportJob.objects.filter(pk=job_id).update(processed=0)
+        run_bulk_import(job_id)
+        self.assertEqual(BulkImportJob.objects.get(pk=job_id).processed, 0)
+        self.assertEqual(Professional.objects.count(), 1)
@@ -0,0 +1,69 @@
+import json
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.models import Professional
+
+
+class BulkStreamEndpointTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/professionals/bulk/stream/"
+
+    def post(self, body, content_type, **params):
+        url = self.url
+        if params:
+            url += "?" + "&".join(f"{k}={v}" for k, v in params.items())
+        return self.client.generic("POST", url, body, content_type=content_type)
+
+    def read_lines(self, res):
+        body = b"".join(res.streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_ndjson_is_processed_in_chunks(self):
+        body = "\n".join(
+            json.dumps({"full_name": f"P{i}", "email": f"p{i}@test.com", "source": "direct"})
+            for i in range(5)
+        )
+        res = self.post(body, "application/x-ndjson", chunk_size=2)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        lines = self.read_lines(res)
+        self.assertEqual([len(line["results"]) for line in lines[:-1]], [2, 2, 1])
+        self.assertEqual([r["index"] for r in lines[2]["results"]], [4])
+        self.assertEqual(
+            lines[-1]["summary"], {"total": 5, "created": 5, "updated": 0, "error": 0}
+        )
+        self.assertEqual(Professional.objects.count(), 5)
+
+    def test_ndjson_invalid_line_is_reported_at_its_index(self):
+        body = (
+            '{"full_name": "Good", "email": "good@test.com", "source": "direct"}\n'
+            "not json\n"
+        )
+        lines = self.read_lines(self.post(body, "application/x-ndjson"))
+        results = lines[0]["results"]
+        self.assertEqual(results[0]["status"], "created")
+        self.assertEqual(results[1]["status"], "error")
+        self.assertEqual(lines[-1]["summary"]["error"], 1)
+
+    def test_csv_upserts_by_email_then_phone(self):
+        Professional.objects.create(full_name="Old", phone="555-0010", source="direct")
+        body = (
+            "full_name,email,phone,source\n"
+            "By Phone,,555-0010,partner\n"
+            "New,new@test.com,,internal\n"
+        )
+        lines = self.read_lines(self.post(body, "text/csv"))
+        statuses = [r["status"] for r in lines[0]["results"]]
+        self.assertEqual(statuses, ["updated", "created"])
+        self.assertEqual(Professional.objects.get(phone="555-0010").full_name, "By Phone")
+
+    def test_rejects_unsupported_content_type(self):
+        res = self.client.post(self.url, [], format="json")
+        self.assertEqual(res.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def test_rejects_invalid_chunk_size(self):
+        res = self.post("", "application/x-ndjson", chunk_size=0)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
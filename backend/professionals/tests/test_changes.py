@@ -0,0 +1,86 @@
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.models import Professional, ProfessionalChange
+
+
+class ChangesEndpointTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/professionals/changes/"
+
+    def changes(self, **params):
+        res = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data
+
+    def bulk(self, payload):
+        return self.client.post("/api/professionals/bulk/", payload, format="json")
+
+    def test_create_and_bulk_upsert_are_logged(self):
+        self.client.post(
+            "/api/professionals/",
+            {"full_name": "Single", "email": "single@test.com", "source": "direct"},
+            format="json",
+        )
+        self.bulk([
+            {"full_name": "Single 2", "email": "single@test.com", "source": "partner"},
+            {"full_name": "New", "email": "new@test.com", "source": "direct"},
+        ])
+        actions = list(ProfessionalChange.objects.values_list("action", flat=True))
+        self.assertEqual(actions, ["created", "updated", "created"])
+
+    def test_only_changes_after_cursor_are_returned(self):
+        self.bulk([
+            {"full_name": "A", "email": "a@test.com", "source": "direct"},
+            {"full_name": "B", "email": "b@test.com", "source": "direct"},
+        ])
+        cursor = self.changes()["cursor"]
+
+        self.bulk([{"full_name": "B2", "email": "b@test.com", "source": "partner"}])
+        data = self.changes(since=cursor)
+        self.assertEqual(len(data["results"]), 1)
+        change = data["results"][0]
+        self.assertEqual(change["action"], "updated")
+        self.assertEqual(change["professional"]["full_name"], "B2")
+        self.assertEqual(self.changes(since=data["cursor"])["results"], [])
+
+    def test_page_keeps_latest_change_per_professional(self):
+        prof = Professional.objects.create(full_name="P", email="p@test.com", source="direct")
+        prof.job_title = "Lead"
+        prof.save()
+        data = self.changes()
+        self.assertEqual([(c["id"], c["action"]) for c in data["results"]], [(prof.pk, "updated")])
+        self.assertEqual(data["results"][0]["professional"]["job_title"], "Lead")
+
+    def test_deletes_are_logged(self):
+        prof = Professional.objects.create(full_name="Gone", email="gone@test.com", source="direct")
+        cursor = self.changes()["cursor"]
+        Professional.objects.filter(pk=prof.pk).delete()
+        change = self.changes(since=cursor)["results"][0]
+        self.assertEqual((change["id"], change["action"], change["professional"]), (prof.pk, "deleted", None))
+
+    def test_limit_pages_through_the_log(self):
+        self.bulk([
+            {"full_name": f"P{i}", "email": f"p{i}@test.com", "source": "direct"} for i in range(5)
+        ])
+        seen, cursor, has_more = [], 0, True
+        while has_more:
+            data = self.changes(since=cursor, limit=2)
+            seen += [c["professional"]["full_name"] for c in data["results"]]
+            cursor, has_more = data["cursor"], data["has_more"]
+        self.assertEqual(seen, [f"P{i}" for i in range(5)])
+
+    def test_bulk_update_bumps_updated_at(self):
+        prof = Professional.objects.create(full_name="P", email="p@test.com", source="direct")
+        created_at, updated_at = prof.created_at, prof.updated_at
+        self.bulk([{"full_name": "P2", "email": "p@test.com", "source": "direct"}])
+        prof.refresh_from_db()
+        self.assertGreater(prof.updated_at, updated_at)
+        self.assertEqual(prof.created_at, created_at)
+
+    def test_rejects_invalid_cursor(self):
+        for params in ({"since": "abc"}, {"since": -1}, {"limit": 0}):
+            res = self.client.get(self.url, params)
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
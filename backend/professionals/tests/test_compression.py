@@ -0,0 +1,75 @@
+import gzip
+import unittest
+import zlib
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from professionals import compression
+from professionals.instrumentation import registry
+from professionals.models import Professional
+
+
+class CompressionMiddlewareTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/"
+        for i in range(20):
+            Professional.objects.create(
+                full_name=f"Person {i}", email=f"p{i}@test.com", company_name="Acme", source="direct"
+            )
+
+    def test_gzip_when_accepted(self):
+        plain = self.client.get(self.url)
+        res = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(res["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", res["Vary"])
+        self.assertEqual(gzip.decompress(res.content), plain.content)
+        self.assertLess(len(res.content), len(plain.content))
+        self.assertFalse(plain.has_header("Content-Encoding"))
+
+    def test_html_is_not_compressed(self):
+        res = self.client.get(self.url, HTTP_ACCEPT="text/html", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(res.has_header("Content-Encoding"))
+
+    def test_streaming_export_is_compressed_per_chunk(self):
+        plain = b"".join(self.client.get("/api/professionals/export/").streaming_content)
+        res = self.client.get("/api/professionals/export/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(res["Content-Encoding"], "gzip")
+        self.assertFalse(res.has_header("Content-Length"))
+        self.assertEqual(gzip.decompress(b"".join(res.streaming_content)), plain)
+
+    def test_weak_etag_still_revalidates(self):
+        res = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertTrue(res["ETag"].startswith('W/"'))
+        res = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=res["ETag"])
+        self.assertEqual(res.status_code, 304)
+
+    def test_bytes_saved_are_counted(self):
+        labels = {"view": "professional-list-create", "encoding": "gzip"}
+        before = (
+            registry.get("professionals_response_bytes_total", **labels),
+            registry.get("professionals_response_compressed_bytes_total", **labels),
+        )
+        res = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        raw = registry.get("professionals_response_bytes_total", **labels) - before[0]
+        sent = registry.get("professionals_response_compressed_bytes_total", **labels) - before[1]
+        self.assertEqual(sent, len(res.content))
+        self.assertEqual(raw, len(gzip.decompress(res.content)))
+
+    @unittest.skipUnless(compression.brotli, "brotli is not installed")
+    def test_brotli_preferred_when_available(self):
+        plain = b"".join(self.client.get("/api/professionals/export/").streaming_content)
+        res = self.client.get("/api/professionals/export/", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(res["Content-Encoding"], "br")
+        self.assertEqual(compression.brotli.decompress(b"".join(res.streaming_content)), plain)
+
+    def test_stream_compressor_flushes_every_chunk(self):
+        compressor = compression._StreamCompressor("gzip")
+        decompressor = zlib.decompressobj(wbits=31)
+        for chunk in (b"first line\n", b"second line\n"):
+            self.assertEqual(decompressor.decompress(compressor.chunk(chunk)), chunk)
+        decompressor.decompress(compressor.finish())
+        self.assertTrue(decompressor.eof)
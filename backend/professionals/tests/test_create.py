@@ -67,6 +67,17 @@ class SingleCreateEndpointTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("phone", res.data)
 
+    def test_duplicate_rejected_after_normalization(self):
+        Professional.objects.create(
+            full_name="Existing", email="dup@example.com", phone="555-0001", source="direct"
+        )
+        for field, value in (("email", "Dup@Example.com "), ("phone", "(555) 0001")):
+            res = self.client.post(
+                self.url, {"full_name": "New", field: value, "source": "direct"}, format="json"
+            )
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field, res.data)
+
     def test_invalid_source_rejected(self):
         payload = {
             "full_name": "Bad Source",
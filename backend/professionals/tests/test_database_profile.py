@@ -0,0 +1,50 @@
+import importlib
+
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from professionals.db import apply_sqlite_pragmas
+
+
+class SQLitePragmaHookTest(SimpleTestCase):
+    databases = {"default"}
+
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_hook_applies_configured_pragmas(self):
+        original = self.pragma("cache_size")
+        try:
+            with override_settings(SQLITE_PRAGMAS={"cache_size": -1234}):
+                apply_sqlite_pragmas(sender=None, connection=connection)
+            self.assertEqual(self.pragma("cache_size"), -1234)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f"PRAGMA cache_size = {original}")
+
+    def test_hook_is_a_noop_without_pragmas(self):
+        connection.ensure_connection()
+        with override_settings(SQLITE_PRAGMAS={}), CaptureQueriesContext(connection) as queries:
+            apply_sqlite_pragmas(sender=None, connection=connection)
+        self.assertEqual(len(queries), 0)
+
+    def test_production_profile(self):
+        production = importlib.import_module("backend.settings_production")
+        base = importlib.import_module("backend.settings")
+        db = production.DATABASES["default"]
+        self.assertEqual(production.SQLITE_PRAGMAS["journal_mode"], "WAL")
+        self.assertEqual(production.SQLITE_PRAGMAS["synchronous"], "NORMAL")
+        self.assertGreater(db["CONN_MAX_AGE"], 0)
+        self.assertEqual(db["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(base.DATABASES["default"].get("CONN_MAX_AGE", 0), 0)
+
+    def test_replica_profile(self):
+        replica = importlib.import_module("backend.settings_replica")
+        self.assertIn("professionals.replica.ReadReplicaRouter", replica.DATABASE_ROUTERS)
+        db = replica.DATABASES[replica.PROFESSIONALS_READ_DATABASE]
+        self.assertNotEqual(db["NAME"], replica.DATABASES["default"]["NAME"])
+        self.assertEqual(db["SQLITE_PRAGMAS"]["query_only"], 1)
+        self.assertEqual(db["TEST"], {"MIRROR": "default"})
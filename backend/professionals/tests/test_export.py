@@ -0,0 +1,115 @@
+import csv
+import io
+import json
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals import export
+from professionals.models import Professional
+from professionals.serializers import LIST_FIELDS
+
+
+class ExportEndpointTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/export/"
+        base = timezone.now() - timedelta(days=10)
+        self.profs = []
+        for i, source in enumerate(["direct", "partner", "partner", "internal"]):
+            prof = Professional.objects.create(
+                full_name=f"P{i}", email=f"p{i}@test.com", source=source
+            )
+            Professional.objects.filter(pk=prof.pk).update(created_at=base + timedelta(days=i))
+            prof.refresh_from_db()
+            self.profs.append(prof)
+
+    def get(self, **params):
+        res = self.client.get(self.url, params)
+        body = b"".join(res.streaming_content) if res.streaming else res.content
+        return res, body.decode()
+
+    def test_csv_is_default_and_oldest_first(self):
+        res, body = self.get()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(list(rows[0]), LIST_FIELDS)
+        self.assertEqual([r["full_name"] for r in rows], ["P0", "P1", "P2", "P3"])
+        self.assertEqual(rows[0]["phone"], "")
+
+    def test_ndjson_matches_list_item_shape(self):
+        res, body = self.get(format="ndjson")
+        items = [json.loads(line) for line in body.splitlines()]
+        listed = self.client.get("/api/professionals/").json()
+        self.assertEqual(items, listed[::-1])
+
+    def test_source_and_range_filters(self):
+        res, body = self.get(
+            format="ndjson",
+            source="partner",
+            created_after=self.profs[2].created_at.isoformat(),
+            created_before=self.profs[3].created_at.isoformat(),
+        )
+        self.assertEqual([json.loads(line)["full_name"] for line in body.splitlines()], ["P2"])
+
+    def test_watermark_supports_incremental_pulls(self):
+        res, body = self.get(format="ndjson")
+        watermark = res["X-Export-Watermark"]
+        self.assertEqual(len(body.splitlines()), 4)
+
+        res, body = self.get(format="ndjson", since=watermark)
+        self.assertEqual(body, "")
+        self.assertEqual(res["X-Export-Watermark"], watermark)
+
+        Professional.objects.create(full_name="New", email="new@test.com", source="direct")
+        self.profs[0].full_name = "Renamed"
+        self.profs[0].save()
+        res, body = self.get(format="ndjson", since=watermark)
+        self.assertEqual([json.loads(line)["full_name"] for line in body.splitlines()], ["New"])
+
+    def test_watermark_catches_rows_committed_after_an_export(self):
+        _, watermark = export.export_queryset()
+        # A transaction that stamped created_at before the export started but
+        # committed after it: older than every exported row, newer in the log.
+        late = Professional.objects.create(full_name="Late", email="late@test.com", source="direct")
+        Professional.objects.filter(pk=late.pk).update(created_at=self.profs[0].created_at - timedelta(days=1))
+        res, body = self.get(format="ndjson", since=watermark)
+        self.assertEqual([json.loads(line)["full_name"] for line in body.splitlines()], ["Late"])
+
+    def test_rows_created_while_streaming_wait_for_the_next_pull(self):
+        queryset, watermark = export.export_queryset()
+        Professional.objects.create(full_name="During", email="during@test.com", source="direct")
+        self.assertEqual([p.full_name for p in queryset], ["P0", "P1", "P2", "P3"])
+        queryset, _ = export.export_queryset(since=watermark)
+        self.assertEqual([p.full_name for p in queryset], ["During"])
+
+    def test_streams_in_chunks(self):
+        with mock.patch("professionals.views.EXPORT_CHUNK_SIZE", 3):
+            res = self.client.get(self.url, {"format": "ndjson"})
+            parts = list(res.streaming_content)
+        self.assertEqual([part.count(b"\n") for part in parts], [3, 1])
+
+    def test_rejects_unknown_format_and_bad_timestamps(self):
+        res, _ = self.get(format="xml")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res, _ = self.get(created_after="yesterday")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        res, _ = self.get(since="2024-01-01T00:00:00Z")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @unittest.skipUnless(export.ARROW_AVAILABLE, "pyarrow is not installed")
+    def test_arrow_stream(self):
+        import pyarrow.ipc
+
+        res = self.client.get(self.url, {"format": "arrow"})
+        table = pyarrow.ipc.open_stream(b"".join(res.streaming_content)).read_all()
+        self.assertEqual(table.column_names, LIST_FIELDS)
+        self.assertEqual(table.column("full_name").to_pylist(), ["P0", "P1", "P2", "P3"])
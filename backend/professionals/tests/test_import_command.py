@@ -0,0 +1,136 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+
+from professionals.importer import plan_shards, run_shard
+from professionals.models import Professional
+from professionals.upsert import bulk_upsert
+
+
+class PlanShardsTest(TestCase):
+    def test_rows_sharing_a_normalized_key_share_a_shard(self):
+        items = [
+            {"full_name": "A", "email": "a@test.com", "phone": "555-0001", "source": "direct"},
+            {"full_name": "B", "email": "b@test.com", "phone": "(555) 0001", "source": "direct"},
+            {"full_name": "C", "email": "B@Test.com", "source": "direct"},
+        ] + [
+            {"full_name": f"P{i}", "email": f"p{i}@test.com", "phone": f"555-2{i:03d}", "source": "direct"}
+            for i in range(50)
+        ]
+        shards = plan_shards(iter(items), 4)
+        self.assertEqual(len(shards), len(items))
+        self.assertEqual({shards[i] for i in range(3)}, {shards[0]})
+        self.assertEqual(set(shards), {0, 1, 2, 3})
+
+    def test_rows_linked_through_an_existing_row_share_a_shard(self):
+        Professional.objects.create(
+            full_name="X", email="x@test.com", phone="555-0009", source="direct"
+        )
+        items = [
+            {"full_name": "By phone", "email": "new@test.com", "phone": "5550009", "source": "direct"},
+            {"full_name": "By email", "email": "x@test.com", "source": "partner"},
+        ]
+        for workers in range(2, 8):
+            shards = plan_shards(items, workers)
+            self.assertEqual(shards[0], shards[1])
+
+    def test_shards_in_any_order_match_a_single_batch(self):
+        Professional.objects.create(full_name="X", email="x@test.com", phone="555-0009", source="direct")
+        items = [
+            {"full_name": f"P{i % 7}", "email": f"p{i % 7}@test.com", "phone": f"555-1{i:03d}", "source": "direct"}
+            for i in range(20)
+        ] + [
+            {"full_name": "X2", "phone": "555 0009", "source": "partner"},
+            {"full_name": "Bad", "source": "direct"},
+            {"full_name": "Clash", "email": "p1@test.com", "phone": "555-1000", "source": "direct"},
+        ]
+
+        def table():
+            return list(Professional.objects.order_by("email_key", "phone_key").values_list(
+                "full_name", "email_key", "phone_key", "source"
+            ))
+
+        with transaction.atomic():
+            results = bulk_upsert(items)
+            expected = (
+                Counter(r["status"] for r in results),
+                [(r["index"], r["errors"]) for r in results if r["status"] == "error"],
+                table(),
+            )
+            transaction.set_rollback(True)
+
+        assignment = plan_shards(items, 3)
+        counts, errors = Counter(), []
+        for shard in reversed(range(3)):
+            shard_counts, shard_errors = run_shard(items, assignment, shard, chunk_size=4)
+            counts += shard_counts
+            errors += shard_errors
+        errors.sort(key=lambda e: e["index"])
+        self.assertEqual((counts, [(e["index"], e["errors"]) for e in errors], table()), expected)
+
+
+class ImportProfessionalsCommandTest(TestCase):
+    def write(self, suffix, text):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_imports_csv_and_ndjson_in_order(self):
+        csv_path = self.write(
+            ".csv", "full_name,email,phone,source\nA,a@test.com,,direct\nB,,555-0002,partner\n"
+        )
+        ndjson_path = self.write(
+            ".ndjson",
+            json.dumps({"full_name": "A2", "email": "A@test.com", "source": "internal"}) + "\n"
+            + json.dumps({"full_name": "Bad", "source": "direct"}) + "\n",
+        )
+        report_path = self.write(".json", "")
+        out = StringIO()
+        call_command(
+            "import_professionals", csv_path, ndjson_path,
+            workers=1, report=report_path, stdout=out,
+        )
+        self.assertIn("4 rows: 2 created, 1 updated, 1 errors", out.getvalue())
+        self.assertEqual(Professional.objects.get(email_key="a@test.com").full_name, "A2")
+        with open(report_path) as f:
+            report = json.load(f)
+        self.assertEqual([e["index"] for e in report["errors"]], [3])
+
+    def test_rejects_unknown_extension(self):
+        path = self.write(".txt", "")
+        with self.assertRaises(CommandError):
+            call_command("import_professionals", path, workers=1, stdout=StringIO())
+
+
+class ImportWorkersTest(TransactionTestCase):
+    def setUp(self):
+        # Settings point the test database at a file; an override may not.
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("spawned workers cannot open an in-memory test database")
+
+    def test_process_pool_matches_one_worker(self):
+        Professional.objects.create(full_name="X", email="x@test.com", phone="555-0009", source="direct")
+        fd, path = tempfile.mkstemp(suffix=".ndjson")
+        with os.fdopen(fd, "w") as f:
+            for i in range(40):
+                f.write(json.dumps({"full_name": f"P{i % 30}", "email": f"p{i % 30}@test.com",
+                                    "phone": f"555-1{i:03d}", "source": "direct"}) + "\n")
+            f.write(json.dumps({"full_name": "X2", "phone": "5550009", "source": "partner"}) + "\n")
+            f.write(json.dumps({"full_name": "Bad", "source": "direct"}) + "\n")
+        self.addCleanup(os.remove, path)
+
+        out = StringIO()
+        call_command("import_professionals", path, workers=2, chunk_size=7, stdout=out)
+        self.assertIn("42 rows: 30 created, 11 updated, 1 errors", out.getvalue())
+        self.assertIn("2 workers", out.getvalue())
+        self.assertEqual(Professional.objects.count(), 31)
+        self.assertEqual(Professional.objects.get(phone_key="5550009").full_name, "X2")
+        self.assertEqual(Professional.objects.get(email_key="p5@test.com").phone, "555-1035")
@@ -0,0 +1,55 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from professionals.instrumentation import QueryMetricsMiddleware, registry
+from professionals.models import Professional
+
+
+class QueryMetricsMiddlewareTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_server_timing_reports_queries(self):
+        res = self.client.post(
+            "/api/professionals/bulk/",
+            [{"full_name": "One", "email": "one@test.com", "source": "direct"}],
+            format="json",
+        )
+        timing = res["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertRegex(timing, r"serialize;dur=[\d.]+")
+        self.assertRegex(timing, r"total;dur=[\d.]+")
+
+    def test_metrics_endpoint_counts_requests_by_view(self):
+        before = registry.get("professionals_requests_total", view="professional-list-create")
+        self.client.get("/api/professionals/")
+        after = registry.get("professionals_requests_total", view="professional-list-create")
+        self.assertEqual(after, before + 1)
+
+        res = self.client.get("/api/metrics/")
+        self.assertEqual(res["Content-Type"], "text/plain; version=0.0.4")
+        body = res.content.decode()
+        self.assertIn("# TYPE professionals_db_queries_total counter", body)
+        self.assertIn('professionals_requests_total{view="professional-list-create"}', body)
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=3)
+    def test_repeated_query_shape_is_flagged(self):
+        def n_plus_one_view(request):
+            for email in ("a@test.com", "b@test.com", "c@test.com"):
+                Professional.objects.filter(email=email).first()
+            # Batched lookups of different sizes share one shape and are not flagged.
+            Professional.objects.filter(email__in=["a"]).count()
+            Professional.objects.filter(email__in=["a", "b"]).count()
+            return HttpResponse()
+
+        request = RequestFactory().get("/")
+        middleware = QueryMetricsMiddleware(n_plus_one_view)
+        before = registry.get("professionals_repeated_queries_total", view="unmatched")
+        with self.assertLogs("professionals.instrumentation", "WARNING") as logs:
+            response = middleware(request)
+        self.assertIn('desc="5 queries"', response["Server-Timing"])
+        self.assertIn("3 x SELECT", logs.output[0])
+        self.assertEqual(
+            registry.get("professionals_repeated_queries_total", view="unmatched"), before + 1
+        )
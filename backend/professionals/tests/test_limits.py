@@ -0,0 +1,133 @@
+import json
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.instrumentation import registry
+from professionals.limits import RowBucket
+from professionals.models import Professional
+
+
+def rows(n, offset=0):
+    return [
+        {"full_name": f"R{i}", "email": f"r{i}@test.com", "source": "direct"}
+        for i in range(offset, offset + n)
+    ]
+
+
+@override_settings(BULK_ROWS_PER_MINUTE=60, BULK_ROW_BURST=3)
+class BulkLimitsTest(TestCase):
+    url = "/api/professionals/bulk/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.now = 1_000_000.0
+        patcher = mock.patch("professionals.limits.time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def rejections(self, reason, view="professional-bulk"):
+        return (
+            registry.get("professionals_bulk_rejections_total", view=view, reason=reason),
+            registry.get("professionals_bulk_rejected_rows_total", view=view, reason=reason),
+        )
+
+    @override_settings(BULK_MAX_ITEMS=2)
+    def test_item_cap(self):
+        before = self.rejections("items")
+        res = self.client.post(self.url, rows(3), format="json")
+        self.assertEqual(res.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(res.data["error"], "Batch has 3 items; the limit is 2. Split it into smaller requests.")
+        self.assertEqual(self.rejections("items"), (before[0] + 1, before[1] + 3))
+        self.assertEqual(Professional.objects.count(), 0)
+
+    @override_settings(BULK_MAX_BYTES=50)
+    def test_byte_cap(self):
+        res = self.client.post(self.url, rows(2), format="json")
+        self.assertEqual(res.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertTrue(res.data["error"].endswith("the limit is 50."))
+
+    def test_row_throttle_returns_429_with_retry_after(self):
+        before = self.rejections("rate")
+        self.assertEqual(self.client.post(self.url, rows(3), format="json").status_code, 200)
+        res = self.client.post(self.url, rows(2, 3), format="json")
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(res["Retry-After"], "2")
+        self.assertEqual(self.rejections("rate"), (before[0] + 1, before[1] + 2))
+        self.assertEqual(Professional.objects.count(), 3)
+
+        # Other clients have their own bucket; this one refills at 1 row/s.
+        other = self.client.post(self.url, rows(1, 10), format="json", REMOTE_ADDR="10.0.0.2")
+        self.assertEqual(other.status_code, status.HTTP_200_OK)
+        self.now += 2
+        self.assertEqual(self.client.post(self.url, rows(2, 3), format="json").status_code, 200)
+
+    def test_rejected_requests_take_no_tokens(self):
+        self.assertEqual(self.client.post(self.url + "?chunk_size=0", rows(3), format="json").status_code, 400)
+        self.assertEqual(self.client.post(self.url, rows(3), format="json").status_code, 200)
+
+    def test_stream_is_charged_as_it_is_read(self):
+        body = "\n".join(json.dumps(row) for row in rows(5))
+        stream_url = "/api/professionals/bulk/stream/"
+        res = self.client.post(stream_url, body, content_type="application/x-ndjson")
+        b"".join(res.streaming_content)
+        self.assertEqual(Professional.objects.count(), 5)
+        # Five rows against a burst of three: two seconds of debt.
+        res = self.client.post(stream_url, body, content_type="application/x-ndjson")
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(res["Retry-After"], "2")
+        self.assertEqual(self.client.post(self.url, rows(1, 20), format="json").status_code, 429)
+
+    def test_body_between_django_default_and_byte_cap_is_accepted(self):
+        # 3 MB: over Django's default 2.5 MB upload limit, under BULK_MAX_BYTES.
+        body = json.dumps(rows(3)) + " " * (3 * 1024 * 1024)
+        self.assertLess(len(body), settings.BULK_MAX_BYTES)
+        before = self.rejections("bytes")
+        res = self.client.post(self.url, body, content_type="application/json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.rejections("bytes"), before)
+        self.assertEqual(Professional.objects.count(), 3)
+
+    @override_settings(BULK_ROWS_PER_MINUTE=None, BULK_MAX_ITEMS=None, BULK_MAX_BYTES=None)
+    def test_limits_can_be_disabled(self):
+        for _ in range(3):
+            res = self.client.post(self.url, rows(5), format="json")
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class RowBucketTest(TestCase):
+    def test_cost_is_capped_at_burst(self):
+        cache.clear()
+        bucket = RowBucket(per_minute=60, burst=3)
+        self.assertEqual(bucket.take("a", 10), 0)
+        self.assertGreater(bucket.take("a", 1), 0)
+
+
+@override_settings(BULK_ROWS_PER_MINUTE=60, BULK_ROW_BURST=3, BULK_MAX_ITEMS=4)
+class AsyncBulkLimitsTest(TransactionTestCase):
+    url = "/api/async/professionals/bulk/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = AsyncClient()
+
+    async def post(self, payload):
+        return await self.client.post(self.url, json.dumps(payload), content_type="application/json")
+
+    async def test_caps_and_throttle(self):
+        res = await self.post(rows(5))
+        self.assertEqual(res.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual((await self.post(rows(3))).status_code, status.HTTP_200_OK)
+        res = await self.post(rows(3, 3))
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", res)
+
+    async def test_body_between_django_default_and_byte_cap_is_accepted(self):
+        body = json.dumps(rows(3)) + " " * (3 * 1024 * 1024)
+        res = await self.client.post(self.url, body, content_type="application/json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -1,12 +1,25 @@
+import json
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient
 
 from professionals.models import Professional
+from professionals.upsert import bulk_upsert
+from professionals.serializers import (
+    LIST_FIELDS,
+    ProfessionalSerializer,
+    serialize_professional_rows,
+)
 
 
 class ListEndpointTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.url = "/api/professionals/"
         Professional.objects.create(
@@ -41,3 +54,193 @@ class ListEndpointTest(TestCase):
         for field in ["id", "full_name", "email", "phone", "job_title",
                        "company_name", "source", "created_at"]:
             self.assertIn(field, entry)
+
+
+class ListPaginationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/"
+        for i in range(5):
+            Professional.objects.create(
+                full_name=f"P{i}", email=f"p{i}@test.com",
+                source="partner" if i % 2 else "direct"
+            )
+
+    def test_walks_all_pages_newest_first(self):
+        names = []
+        res = self.client.get(self.url, {"page_size": 2})
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            names.extend(p["full_name"] for p in res.data["results"])
+            if res.data["next"] is None:
+                break
+            res = self.client.get(res.data["next"])
+        self.assertEqual(names, ["P4", "P3", "P2", "P1", "P0"])
+
+    def test_rows_with_equal_created_at_are_not_skipped(self):
+        Professional.objects.update(created_at=Professional.objects.first().created_at)
+        ids = []
+        res = self.client.get(self.url, {"page_size": 2})
+        while True:
+            ids.extend(p["id"] for p in res.data["results"])
+            if res.data["next"] is None:
+                break
+            res = self.client.get(res.data["next"])
+        self.assertEqual(ids, sorted(Professional.objects.values_list("id", flat=True), reverse=True))
+
+    def test_pagination_respects_source_filter(self):
+        res = self.client.get(self.url, {"source": "partner", "page_size": 1})
+        self.assertEqual(len(res.data["results"]), 1)
+        res = self.client.get(res.data["next"])
+        self.assertEqual(res.data["results"][0]["full_name"], "P1")
+        self.assertIsNone(res.data["next"])
+
+    def test_no_cursor_keeps_unpaginated_list(self):
+        res = self.client.get(self.url)
+        self.assertIsInstance(res.data, list)
+        self.assertEqual(len(res.data), 5)
+
+    def test_invalid_cursor_returns_404(self):
+        res = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ListCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/"
+        Professional.objects.create(full_name="A", email="a@test.com", source="direct")
+
+    def test_repeat_request_is_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            res = self.client.get(self.url)
+        self.assertEqual(len(res.data), 1)
+
+    def test_cache_is_keyed_by_filter(self):
+        self.client.get(self.url)
+        res = self.client.get(self.url, {"source": "partner"})
+        self.assertEqual(len(res.data), 0)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+
+    def test_create_invalidates_cache(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                self.url, {"full_name": "B", "email": "b@test.com", "source": "direct"},
+                format="json",
+            )
+        res = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 2)
+        self.assertNotEqual(res["ETag"], etag)
+
+    def test_bulk_upsert_invalidates_cache(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/api/professionals/bulk/",
+                [{"full_name": "A2", "email": "a@test.com", "source": "partner"}],
+                format="json",
+            )
+        res = self.client.get(self.url)
+        self.assertEqual(res.data[0]["full_name"], "A2")
+
+    def test_version_is_bumped_on_commit_not_on_write(self):
+        # A list read between the write and its commit must not be cached
+        # under the version the commit moves to: another connection would
+        # have read, and cached, the rows before the write.
+        for write in (
+            lambda: Professional.objects.create(full_name="B", email="b@test.com", source="direct"),
+            lambda: bulk_upsert([{"full_name": "C", "email": "c@test.com", "source": "direct"}]),
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+                during = self.client.get(self.url)
+            with CaptureQueriesContext(connection) as queries:
+                after = self.client.get(self.url)
+            self.assertNotEqual(after["ETag"], during["ETag"])
+            self.assertTrue(queries.captured_queries)
+
+
+class FastListSerializerParityTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/"
+        Professional.objects.create(
+            full_name="Zoë Ångström", email="zoe@test.com", phone="555-0101",
+            company_name="Acme", job_title="Engineer", source="direct",
+        )
+        Professional.objects.create(full_name="Phone Only", phone="555-0102", source="partner")
+        whole_second = Professional.objects.create(
+            full_name="Email Only", email="e@test.com", source="internal"
+        )
+        Professional.objects.filter(pk=whole_second.pk).update(
+            created_at=whole_second.created_at.replace(microsecond=0)
+        )
+
+    def expected_bytes(self, queryset):
+        data = ProfessionalSerializer(queryset, many=True).data
+        return JSONRenderer().render(data)
+
+    def test_rows_match_model_serializer_byte_for_byte(self):
+        queryset = Professional.objects.all()
+        fast = serialize_professional_rows(queryset.values_list(*LIST_FIELDS))
+        self.assertEqual(JSONRenderer().render(fast), self.expected_bytes(queryset))
+
+    def test_list_response_matches_model_serializer(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.content, self.expected_bytes(Professional.objects.all()))
+
+    def test_paginated_page_matches_model_serializer(self):
+        res = self.client.get(self.url, {"page_size": 2})
+        expected = ProfessionalSerializer(Professional.objects.all()[:2], many=True).data
+        self.assertEqual(res.json()["results"], json.loads(JSONRenderer().render(expected)))
+
+
+class SparseFieldsetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/professionals/"
+        for i in range(3):
+            Professional.objects.create(
+                full_name=f"P{i}", email=f"p{i}@test.com", company_name="Acme", source="direct"
+            )
+
+    def test_unpaginated_list_selects_and_returns_only_requested_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(self.url, {"fields": "source,id,full_name"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(res.data[0]), ["id", "full_name", "source"])
+        select = next(q["sql"] for q in queries if q["sql"].startswith("SELECT"))
+        self.assertNotIn("company_name", select)
+        self.assertNotIn("email", select)
+
+    def test_paginated_list_keeps_cursor_working(self):
+        res = self.client.get(self.url, {"fields": "full_name", "page_size": 2})
+        self.assertEqual(res.data["results"], [{"full_name": "P2"}, {"full_name": "P1"}])
+        res = self.client.get(res.data["next"])
+        self.assertEqual(res.data["results"], [{"full_name": "P0"}])
+
+    def test_full_field_list_matches_default_response(self):
+        res = self.client.get(self.url, {"fields": ",".join(LIST_FIELDS)})
+        self.assertEqual(res.data, self.client.get(self.url).data)
+
+    def test_unknown_field_is_rejected(self):
+        res = self.client.get(self.url, {"fields": "id,salary"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("salary", res.data["error"])
+
+    def test_payload_shrinks_with_fields(self):
+        full = self.client.get(self.url, {"page_size": 50}).content
+        sparse = self.client.get(self.url, {"page_size": 50, "fields": "id,full_name,source"}).content
+        self.assertLess(len(sparse), len(full) / 2)
@@ -1,7 +1,8 @@
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from professionals.models import Professional
+from professionals.normalization import email_key, normalize_keys, phone_key
 
 
 class ProfessionalModelTest(TestCase):
@@ -26,3 +27,41 @@ class ProfessionalModelTest(TestCase):
         professionals = list(Professional.objects.all())
         self.assertEqual(professionals[0].pk, b.pk)
         self.assertEqual(professionals[1].pk, a.pk)
+
+    def test_save_sets_normalized_keys(self):
+        p = Professional.objects.create(
+            full_name="Keys", email=" Mixed@Test.COM ", phone="(555) 010-2030", source="direct"
+        )
+        self.assertEqual(p.email_key, "mixed@test.com")
+        self.assertEqual(p.phone_key, "5550102030")
+
+    def test_full_clean_rejects_normalized_duplicate(self):
+        Professional.objects.create(full_name="A", email="dup@test.com", source="direct")
+        p = Professional(full_name="B", email="DUP@test.com", source="direct")
+        with self.assertRaises(ValidationError) as ctx:
+            p.full_clean()
+        self.assertIn("email", ctx.exception.message_dict)
+
+
+class NormalizationTest(SimpleTestCase):
+    def test_email_key(self):
+        self.assertEqual(email_key("  A@B.com "), "a@b.com")
+        self.assertIsNone(email_key(""))
+        self.assertIsNone(email_key(None))
+
+    def test_phone_key(self):
+        self.assertEqual(phone_key("+1 (555) 000-1111"), "15550001111")
+        self.assertEqual(phone_key("N/A"), "n/a")
+        self.assertIsNone(phone_key("   "))
+        self.assertIsNone(phone_key(None))
+
+    def test_normalize_keys_matches_single_row_helpers(self):
+        rows = [
+            {"email": "X@Y.org", "phone": None},
+            {"email": None, "phone": "555.0002"},
+            {"email": " ", "phone": "ext"},
+        ]
+        self.assertEqual(
+            normalize_keys(rows),
+            [(email_key(r["email"]), phone_key(r["phone"])) for r in rows],
+        )
@@ -0,0 +1,59 @@
+import unittest
+from datetime import datetime, timezone
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+
+from professionals.models import Professional
+from professionals.pagination import KeysetPagination
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN is SQLite-specific")
+class QueryPlanTest(TestCase):
+    """The list and bulk lookup query shapes are served by an index, with no sort step."""
+
+    def explain(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = self.explain(queryset)
+        self.assertTrue(any(index_name in step for step in plan), plan)
+        self.assertFalse(any("TEMP B-TREE" in step for step in plan), plan)
+
+    def test_list_uses_created_index(self):
+        self.assertUsesIndex(Professional.objects.all(), "prof_created_id_idx")
+
+    def test_source_filter_uses_source_index(self):
+        self.assertUsesIndex(
+            Professional.objects.filter(source="partner"), "prof_source_created_idx"
+        )
+
+    def test_keyset_page_uses_created_index(self):
+        created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        qs = (
+            Professional.objects.order_by(*KeysetPagination.ordering)
+            .filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=10))
+        )[:51]
+        self.assertUsesIndex(qs, "prof_created_id_idx")
+
+    def test_filtered_keyset_page_uses_source_index(self):
+        qs = Professional.objects.filter(source="partner").order_by(
+            *KeysetPagination.ordering
+        )[:51]
+        self.assertUsesIndex(qs, "prof_source_created_idx")
+
+    def test_bulk_lookups_use_unique_indexes(self):
+        for field in ("email_key", "phone_key"):
+            plan = self.explain(Professional.objects.filter(**{f"{field}__in": ["a", "b"]}))
+            self.assertTrue(any(f"({field}=?)" in step for step in plan), plan)
+
+    def test_combined_bulk_lookup_uses_both_unique_indexes(self):
+        plan = self.explain(
+            Professional.objects.filter(Q(email_key__in=["a", "b"]) | Q(phone_key__in=["1", "2"]))
+        )
+        for field in ("email_key", "phone_key"):
+            self.assertTrue(any(f"({field}=?)" in step for step in plan), plan)
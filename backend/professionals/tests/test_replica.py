@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+from rest_framework.test import APIClient
+
+from professionals.models import Professional
+from professionals.replica import PIN_COOKIE, ReadReplicaRouter, refresh_replica, replica_reads
+
+REPLICA = "replica"
+ROUTED = override_settings(
+    DATABASE_ROUTERS=["professionals.replica.ReadReplicaRouter"],
+    PROFESSIONALS_READ_DATABASE=REPLICA,
+)
+
+
+def add_replica_alias(test, name):
+    """Registers a ``replica`` alias on SQLite file ``name`` for one test."""
+    configured = connections.configure_settings({
+        DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+        REPLICA: {
+            **connections.settings[DEFAULT_DB_ALIAS],
+            "NAME": name,
+            "SQLITE_PRAGMAS": {"query_only": 1},
+        },
+    })
+    connections.settings[REPLICA] = configured[REPLICA]
+
+    def remove():
+        if hasattr(connections._connections, REPLICA):
+            connections[REPLICA].close()
+            del connections[REPLICA]
+        del connections.settings[REPLICA]
+
+    test.addCleanup(remove)
+
+
+class ReadReplicaRouterTest(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.router = ReadReplicaRouter()
+
+    def read_db(self, request):
+        with replica_reads(request):
+            return self.router.db_for_read(Professional)
+
+    def test_routes_only_inside_replica_reads_when_configured(self):
+        get = self.factory.get("/api/professionals/")
+        with ROUTED:
+            self.assertIsNone(self.read_db(get))  # alias not defined
+        add_replica_alias(self, ":memory:")
+        self.assertIsNone(self.read_db(get))  # not enabled
+        with ROUTED:
+            self.assertEqual(self.read_db(get), REPLICA)
+            self.assertIsNone(self.router.db_for_read(Professional))
+            self.assertIsNone(self.read_db(self.factory.post("/api/professionals/")))
+            pinned = self.factory.get("/api/professionals/")
+            pinned.COOKIES[PIN_COOKIE] = "1"
+            self.assertIsNone(self.read_db(pinned))
+
+    def test_writes_go_to_default_and_end_replica_reads(self):
+        # The router only reads the app label; contrib apps may not be installed.
+        other_app = SimpleNamespace(_meta=SimpleNamespace(app_label="auth"))
+        add_replica_alias(self, ":memory:")
+        with ROUTED, replica_reads(self.factory.get("/")):
+            self.assertIsNone(self.router.db_for_read(other_app))
+            self.assertEqual(self.router.db_for_read(Professional), REPLICA)
+            self.assertEqual(self.router.db_for_write(Professional), DEFAULT_DB_ALIAS)
+            self.assertIsNone(self.router.db_for_read(Professional))
+            self.assertFalse(self.router.allow_migrate(REPLICA, "professionals"))
+            self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "professionals"))
+
+
+class ReadReplicaEndToEndTest(TransactionTestCase):
+    """Two SQLite files: default, and a replica snapshot taken by refresh_replica."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "replica.sqlite3")
+        add_replica_alias(self, self.path)
+        # The alias did not exist when the class was set up; allow it for
+        # this test only. Cleanups run before the flush, which stays on default.
+        databases = type(self).databases
+        type(self).databases = databases | {REPLICA}
+        self.addCleanup(setattr, type(self), "databases", databases)
+        ROUTED.enable()
+        self.addCleanup(ROUTED.disable)
+
+    def names(self, client):
+        return [p["full_name"] for p in client.get("/api/professionals/").json()]
+
+    def test_reads_come_from_the_snapshot_and_writers_read_their_writes(self):
+        Professional.objects.create(full_name="Snapshotted", email="s@test.com", source="direct")
+        refresh_replica()
+        with sqlite3.connect(self.path) as replica:
+            count = replica.execute("SELECT count(*) FROM professionals_professional").fetchone()
+        self.assertEqual(count, (1,))
+
+        reader, writer = APIClient(), APIClient()
+        res = writer.post(
+            "/api/professionals/",
+            {"full_name": "Fresh", "email": "f@test.com", "source": "partner"},
+            format="json",
+        )
+        self.assertIn(PIN_COOKIE, res.cookies)
+        self.assertEqual(self.names(reader), ["Snapshotted"])
+        self.assertEqual(self.names(writer), ["Fresh", "Snapshotted"])
+        res = reader.get("/api/professionals/search/", {"q": "fresh"})
+        self.assertEqual(res.json()["results"], [])
+
+        refresh_replica()
+        self.assertEqual(self.names(reader), ["Fresh", "Snapshotted"])
+        with replica_reads(RequestFactory().get("/")):
+            self.assertEqual(router.db_for_read(Professional), REPLICA)
+
+    def test_cached_pages_follow_a_snapshot_taken_by_another_process(self):
+        Professional.objects.create(full_name="Before", email="b@test.com", source="direct")
+        refresh_replica()
+        reader = APIClient()
+        first = reader.get("/api/professionals/")
+        self.assertEqual([p["full_name"] for p in first.json()], ["Before"])
+
+        # Another process writes and takes the snapshot; nothing touches this
+        # process's cache version.
+        default = connections[DEFAULT_DB_ALIAS].settings_dict["NAME"]
+        with sqlite3.connect(default) as source:
+            source.execute("UPDATE professionals_professional SET full_name = 'After'")
+        with sqlite3.connect(default) as source, sqlite3.connect(self.path) as target:
+            source.backup(target)
+
+        res = reader.get("/api/professionals/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], first["ETag"])
+        self.assertEqual([p["full_name"] for p in res.json()], ["After"])
@@ -0,0 +1,130 @@
+import io
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.models import Professional, ProfessionalSearchToken
+from professionals.search import has_fts_index, search_filter
+
+
+class SearchEndpointTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/professionals/search/"
+        self.jane = Professional.objects.create(
+            full_name="Jane Doe", email="jane@acme.com", company_name="Acme",
+            job_title="Engineer", source="direct",
+        )
+        Professional.objects.create(
+            full_name="Janet Smith", email="janet@globex.com", company_name="Globex",
+            job_title="Designer", source="partner",
+        )
+        Professional.objects.create(
+            full_name="Bob Stone", phone="555-0001", company_name="Acme Janitorial",
+            job_title="Manager", source="partner",
+        )
+
+    def names(self, **params):
+        res = self.client.get(self.url, params)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [p["full_name"] for p in res.data["results"]]
+
+    def test_fts_index_is_installed(self):
+        self.assertTrue(has_fts_index())
+
+    def test_prefix_match(self):
+        self.assertEqual(set(self.names(q="jan")), {"Jane Doe", "Janet Smith", "Bob Stone"})
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(set(self.names(q="jan acme")), {"Jane Doe", "Bob Stone"})
+        self.assertEqual(self.names(q="jane doe"), ["Jane Doe"])
+
+    def test_matches_email_tokens(self):
+        self.assertEqual(self.names(q="globex.com"), ["Janet Smith"])
+
+    def test_matches_word_starts_inside_emails(self):
+        Professional.objects.create(full_name="Kenji", email="kenji.tanaka@acme.com", source="direct")
+        self.assertEqual(self.names(q="tanaka"), ["Kenji"])
+        self.assertEqual(self.names(q="anaka"), [])
+
+    def test_source_filter(self):
+        self.assertEqual(set(self.names(q="jan", source="partner")), {"Janet Smith", "Bob Stone"})
+
+    def test_results_use_list_shape(self):
+        res = self.client.get(self.url, {"q": "jane"})
+        self.assertEqual(
+            list(res.data["results"][0]),
+            ["id", "full_name", "email", "company_name", "job_title", "phone", "source", "created_at"],
+        )
+
+    def test_pagination(self):
+        res = self.client.get(self.url, {"q": "jan", "page_size": 2})
+        self.assertEqual(len(res.data["results"]), 2)
+        res = self.client.get(res.data["next"])
+        self.assertEqual(len(res.data["results"]), 1)
+        self.assertIsNone(res.data["next"])
+
+    def test_index_follows_bulk_upsert(self):
+        self.client.post(
+            "/api/professionals/bulk/",
+            [
+                {"full_name": "Jane Renamed", "email": "jane@acme.com", "source": "direct"},
+                {"full_name": "Zed Newcomer", "phone": "555-0099", "source": "internal"},
+            ],
+            format="json",
+        )
+        self.assertEqual(self.names(q="renamed"), ["Jane Renamed"])
+        self.assertEqual(self.names(q="doe"), [])
+        self.assertEqual(self.names(q="newcomer"), ["Zed Newcomer"])
+
+    def test_index_follows_delete(self):
+        Professional.objects.filter(full_name="Jane Doe").delete()
+        self.assertEqual(self.names(q="doe"), [])
+
+    def test_requires_query(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ranks_every_match_not_just_the_newest(self):
+        # Bob Stone is the newest match but only matches once, in a
+        # field that does not start with the term; he ranks last.
+        self.assertEqual(self.names(q="jan")[-1], "Bob Stone")
+        self.assertEqual(self.names(q="jan", page_size=2, page=2), ["Bob Stone"])
+
+    def test_admin_search_filter(self):
+        matches = search_filter(Professional.objects.all(), "acme")
+        self.assertEqual({p.full_name for p in matches}, {"Jane Doe", "Bob Stone"})
+
+
+class SearchFallbackTest(SearchEndpointTest):
+    """The same behaviour from the token index, as on a database without FTS5."""
+
+    def setUp(self):
+        patcher = mock.patch("professionals.search.has_fts_index", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_fts_index_is_installed(self):
+        tokens = ProfessionalSearchToken.objects.filter(professional_id=self.jane.pk)
+        self.assertEqual(
+            set(tokens.values_list("token", flat=True)),
+            {"jane", "doe", "acme", "engineer", "com"},
+        )
+
+    def test_tokens_follow_saves(self):
+        self.jane.job_title = "Architect"
+        self.jane.save()
+        self.assertEqual(self.names(q="architect"), ["Jane Doe"])
+        self.assertEqual(self.names(q="engineer"), [])
+
+    def test_rebuild_restores_drifted_tokens(self):
+        ProfessionalSearchToken.objects.all().delete()
+        self.assertEqual(self.names(q="jane"), [])
+        out = io.StringIO()
+        call_command("rebuild_search_tokens", stdout=out)
+        self.assertIn("Rebuilt", out.getvalue())
+        self.assertEqual(self.names(q="jane doe"), ["Jane Doe"])
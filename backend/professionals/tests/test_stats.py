@@ -0,0 +1,90 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from professionals.models import Professional, ProfessionalDailyCount
+from professionals.stats import rebuild_counts
+
+
+class StatsEndpointTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = "/api/professionals/stats/"
+
+    def counters(self):
+        return {
+            (source, day): count
+            for source, day, count in ProfessionalDailyCount.objects.exclude(count=0)
+            .values_list("source", "day", "count")
+        }
+
+    def bulk(self, payload):
+        return self.client.post("/api/professionals/bulk/", payload, format="json")
+
+    def test_counts_follow_create_bulk_upsert_and_delete(self):
+        self.client.post(
+            "/api/professionals/",
+            {"full_name": "A", "email": "a@test.com", "source": "direct"},
+            format="json",
+        )
+        self.bulk([
+            {"full_name": "B", "email": "b@test.com", "source": "partner"},
+            {"full_name": "C", "phone": "555-0003", "source": "partner"},
+            # Moves A from direct to internal.
+            {"full_name": "A", "email": "a@test.com", "source": "internal"},
+        ])
+        Professional.objects.filter(email="b@test.com").delete()
+
+        data = self.client.get(self.url).data
+        self.assertEqual(data["by_source"], {"direct": 0, "partner": 1, "internal": 1})
+        self.assertEqual(data["total"], 2)
+        today = data["created_per_day"][-1]
+        self.assertEqual(today["date"], timezone.localdate().isoformat())
+        self.assertEqual(today["total"], 2)
+
+    def test_single_update_moving_source_moves_count(self):
+        prof = Professional.objects.create(full_name="P", email="p@test.com", source="direct")
+        prof.source = "partner"
+        prof.save()
+        prof.job_title = "Lead"
+        prof.save(update_fields=["job_title"])
+        self.assertEqual(self.counters(), {("partner", timezone.localdate()): 1})
+
+    def test_histogram_covers_requested_days(self):
+        prof = Professional.objects.create(full_name="Old", email="old@test.com", source="direct")
+        Professional.objects.filter(pk=prof.pk).update(created_at=timezone.now() - timedelta(days=3))
+        rebuild_counts()
+
+        days = self.client.get(self.url, {"days": 7}).data["created_per_day"]
+        self.assertEqual(len(days), 7)
+        self.assertEqual([d["direct"] for d in days], [0, 0, 0, 1, 0, 0, 0])
+
+    def test_rebuild_matches_maintained_counters(self):
+        self.bulk([
+            {"full_name": f"P{i}", "email": f"p{i}@test.com", "source": src}
+            for i, src in enumerate(["direct", "partner", "partner", "internal"])
+        ])
+        maintained = self.counters()
+        ProfessionalDailyCount.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_professional_counts", stdout=out)
+        self.assertIn("Rebuilt 3", out.getvalue())
+        self.assertEqual(self.counters(), maintained)
+
+    def test_reads_counter_table_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertEqual(len(queries), 2)
+        self.assertTrue(all("professionaldailycount" in q["sql"] for q in queries))
+
+    def test_rejects_invalid_days(self):
+        for days in ("0", "x", "1000"):
+            res = self.client.get(self.url, {"days": days})
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+
+from professionals.serializers import BulkProfessionalItemSerializer
+from professionals.validation import validate_batch
+
+PAYLOADS = [
+    {"full_name": "Plain", "email": "plain@test.com", "source": "direct"},
+    {"full_name": "  Padded  ", "email": " pad@test.com ", "phone": " 555-0001 ",
+     "job_title": " Lead ", "source": "partner"},
+    {"full_name": "Phone Only", "phone": "555-0002", "email": "", "source": "internal"},
+    {"full_name": 42, "email": "int@test.com", "source": "direct"},
+    {"full_name": "", "email": "blank@test.com", "source": "direct"},
+    {"full_name": "x" * 256, "email": "long@test.com", "source": "direct"},
+    {"full_name": "Nul\x00", "email": "nul@test.com", "source": "direct"},
+    {"email": "noname@test.com", "source": "direct"},
+    {"full_name": "Null Email", "email": None, "phone": "555-0003", "source": "direct"},
+    {"full_name": "Bad Email", "email": "not-an-email", "source": "direct"},
+    {"full_name": "Long Phone", "phone": "5" * 21, "source": "direct"},
+    {"full_name": "Null Company", "phone": "555-0004", "company_name": None, "source": "direct"},
+    {"full_name": "Bad Source", "email": "src@test.com", "source": "unknown"},
+    {"full_name": "Blank Source", "email": "src@test.com", "source": ""},
+    {"full_name": "No Source", "email": "src@test.com"},
+    {"full_name": "No Contact", "source": "direct"},
+    {"full_name": "Many", "email": "bad", "phone": "5" * 30, "source": "x"},
+    "not an object",
+    None,
+    [1, 2],
+]
+
+
+class BatchValidationParityTest(SimpleTestCase):
+    def test_matches_per_item_serializer(self):
+        valid, errors = validate_batch(PAYLOADS)
+        valid = dict(valid)
+        for offset, payload in enumerate(PAYLOADS):
+            serializer = BulkProfessionalItemSerializer(data=payload)
+            with self.subTest(payload=payload):
+                if serializer.is_valid():
+                    self.assertEqual(valid[offset], dict(serializer.validated_data))
+                    self.assertEqual(list(valid[offset]), list(serializer.validated_data))
+                else:
+                    self.assertEqual(errors[offset], serializer.errors)
+
+    def test_email_longer_than_model_column_is_rejected(self):
+        email = "a" * 60 + "@" + ".".join(["b" * 60] * 4) + ".com"
+        _, errors = validate_batch([{"full_name": "Long", "email": email, "source": "direct"}])
+        self.assertEqual(
+            errors[0],
+            "{'email': ['Ensure this value has at most 254 characters (it has %d).']}"
+            % len(email),
+        )
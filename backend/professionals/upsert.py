@@ -0,0 +1,267 @@
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .instrumentation import timed_serialization
+from .list_cache import bump_list_version
+from .models import Professional, ProfessionalChange, ProfessionalDailyCount
+from .normalization import normalize_keys
+from .search import index_search_tokens
+from .serializers import LIST_FIELDS, serialize_professional_rows
+from .validation import validate_batch
+
+UPSERT_FIELDS = [
+    "full_name",
+    "email",
+    "company_name",
+    "job_title",
+    "phone",
+    "source",
+    "email_key",
+    "phone_key",
+    "updated_at",
+]
+
+# Keys per IN (...) lookup, under SQLite's 999 bound-variable limit.
+LOOKUP_BATCH_SIZE = 500
+# Rows per INSERT at most. bulk_create also caps each INSERT at the limit
+# divided by the columns written, which on SQLite is lower (99 rows of
+# Professional), so there this only bounds the change log inserts.
+WRITE_BATCH_SIZE = 500
+
+
+RESULT_MODES = ("full", "summary", "errors_only")
+
+
+def bulk_upsert(items, start=0, echo=True):
+    """
+    Upserts a list of professional payloads in a handful of set-based
+    queries: one key lookup per ``LOOKUP_BATCH_SIZE`` keys, one executemany
+    for every update, and one INSERT per batch of new rows that fits the
+    database's bound-variable limit (99 rows on SQLite). The count grows
+    with the batch only through those batch sizes.
+
+    Matching follows the per-item rule of the bulk endpoint: email first,
+    then phone, both compared by their normalized keys (see
+    ``normalization``). Items are resolved in order against an in-memory key
+    index, so later items see the effect of earlier ones exactly as if they
+    had been saved one at a time: repeats of a key collapse into one write
+    holding the last item's values, and an item whose email and phone belong
+    to two different professionals is an error for that index alone. Returns
+    one result dict per item, indexed from ``start``; with ``echo=False``
+    successful results leave out the serialized ``professional``.
+    """
+    results = [None] * len(items)
+    valid, errors = validate_batch(items)
+    for offset, error in errors.items():
+        results[offset] = {"index": start + offset, "status": "error", "errors": error}
+
+    try:
+        with transaction.atomic():
+            applied = _apply(valid, results, start)
+    except IntegrityError:
+        # A concurrent writer took one of our keys between the lookup and the
+        # write. Fall back to the row-at-a-time path for this batch, still
+        # committed once, with a savepoint per row.
+        with transaction.atomic():
+            applied = _apply_sequential(valid, results, start)
+
+    if applied:
+        # The batch writes skip the post_save signal, so invalidate here, once
+        # the batch is visible to other connections (see signals).
+        transaction.on_commit(bump_list_version)
+
+    if not echo:
+        for offset, status, _, _ in applied:
+            results[offset] = {"index": start + offset, "status": status}
+        return results
+
+    with timed_serialization():
+        # Each item echoes its own values, not the final state of its row,
+        # so a collapsed repeat shows what that item wrote.
+        rows = []
+        for _, _, instance, data in applied:
+            values = {**data, "id": instance.pk, "created_at": instance.created_at}
+            rows.append([values.get(field) for field in LIST_FIELDS])
+        for (offset, status, _, _), professional in zip(applied, serialize_professional_rows(rows)):
+            results[offset] = {"index": start + offset, "status": status, "professional": professional}
+    return results
+
+
+def summarize(results):
+    summary = {"total": len(results), "created": 0, "updated": 0, "error": 0}
+    for result in results:
+        summary[result["status"]] += 1
+    return summary
+
+
+def shape_results(results, mode):
+    """
+    Builds a bulk response body for a ``?results=`` mode: every result
+    (``full``), only the counts (``summary``), or the counts plus the failed
+    items (``errors_only``).
+    """
+    if mode == "full":
+        return {"results": results}
+    body = {"summary": summarize(results)}
+    if mode == "errors_only":
+        body["results"] = [result for result in results if result["status"] == "error"]
+    return body
+
+
+def _load_existing(keys):
+    """
+    Loads the batch key index: every existing row matching any email or
+    phone key of the batch, as ``(by_email, by_phone)`` dicts sharing one
+    instance per row. Each chunk of keys is one ``email_key IN (...) OR
+    phone_key IN (...)`` query, served by both unique indexes.
+    """
+    lookups = [("email_key", email) for email in {email for email, _ in keys if email}]
+    lookups += [("phone_key", phone) for phone in {phone for _, phone in keys if phone}]
+    by_email, by_phone = {}, {}
+    for i in range(0, len(lookups), LOOKUP_BATCH_SIZE):
+        chunk = lookups[i : i + LOOKUP_BATCH_SIZE]
+        query = Q()
+        for field in ("email_key", "phone_key"):
+            values = [value for name, value in chunk if name == field]
+            if values:
+                query |= Q(**{f"{field}__in": values})
+        for prof in Professional.objects.filter(query):
+            # A row may match in two chunks; keep the instance seen first.
+            prof = by_email.get(prof.email_key) or by_phone.get(prof.phone_key) or prof
+            if prof.email_key:
+                by_email[prof.email_key] = prof
+            if prof.phone_key:
+                by_phone[prof.phone_key] = prof
+    return by_email, by_phone
+
+
+def _update_rows(instances):
+    """
+    Writes ``UPSERT_FIELDS`` of existing rows as one executemany ``UPDATE
+    ... WHERE id = %s``. ``bulk_update`` instead builds a ``CASE WHEN id =
+    ...`` per field over the whole batch, which the database evaluates for
+    every row it updates, so its cost grows with the square of the batch.
+    """
+    if not instances:
+        return
+    connection = connections[router.db_for_write(Professional)]
+    opts = Professional._meta
+    fields = [opts.get_field(name) for name in UPSERT_FIELDS]
+    qn = connection.ops.quote_name
+    sql = "UPDATE {} SET {} WHERE {} = %s".format(
+        qn(opts.db_table),
+        ", ".join(f"{qn(field.column)} = %s" for field in fields),
+        qn(opts.pk.column),
+    )
+    params = [
+        [field.get_db_prep_save(getattr(instance, field.attname), connection) for field in fields]
+        + [instance.pk]
+        for instance in instances
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def _unique_errors(instance, keys, by_email, by_phone):
+    errors = {}
+    for field, key, index in zip(("email", "phone"), keys, (by_email, by_phone)):
+        owner = index.get(key) if key else None
+        if owner is not None and owner is not instance:
+            errors[field] = instance.unique_error_message(Professional, (field,))
+    return ValidationError(errors) if errors else None
+
+
+def _apply(valid, results, start):
+    all_keys = normalize_keys([data for _, data in valid])
+    by_email, by_phone = _load_existing(all_keys)
+    loaded_sources = {prof.pk: prof.source for prof in (*by_email.values(), *by_phone.values())}
+    to_create = {}
+    to_update = {}
+    applied = []
+
+    for (offset, data), keys in zip(valid, all_keys):
+        email_key, phone_key = keys
+        existing = None
+        if email_key:
+            existing = by_email.get(email_key)
+        if existing is None and phone_key:
+            existing = by_phone.get(phone_key)
+
+        instance = existing or Professional()
+        error = _unique_errors(instance, keys, by_email, by_phone)
+        if error is not None:
+            results[offset] = {"index": start + offset, "status": "error", "errors": str(error)}
+            continue
+
+        for field, index in (("email_key", by_email), ("phone_key", by_phone)):
+            old = getattr(instance, field)
+            if old and index.get(old) is instance:
+                del index[old]
+        for field, value in data.items():
+            setattr(instance, field, value)
+        # bulk_create and _update_rows bypass save(), so set the keys here.
+        instance.email_key, instance.phone_key = keys
+        if email_key:
+            by_email[email_key] = instance
+        if phone_key:
+            by_phone[phone_key] = instance
+
+        if instance.pk is None:
+            to_create[id(instance)] = instance
+        else:
+            to_update[instance.pk] = instance
+        applied.append((offset, "updated" if existing else "created", instance, dict(data)))
+
+    # The raw update skips auto_now, so stamp updates by hand; bulk_create
+    # sets created_at/updated_at itself.
+    now = timezone.now()
+    for instance in to_update.values():
+        instance.updated_at = now
+    # Updates go first so keys released by an update are free for new rows.
+    _update_rows(list(to_update.values()))
+    Professional.objects.bulk_create(to_create.values(), batch_size=WRITE_BATCH_SIZE)
+    ProfessionalChange.objects.bulk_create(
+        [
+            ProfessionalChange(professional_id=instance.pk, action=action, changed_at=instance.updated_at)
+            for action, instances in (("updated", to_update), ("created", to_create))
+            for instance in instances.values()
+        ],
+        batch_size=WRITE_BATCH_SIZE,
+    )
+    counts = Counter((instance.source, instance.created_at) for instance in to_create.values())
+    for pk, instance in to_update.items():
+        if loaded_sources[pk] != instance.source:
+            counts[(loaded_sources[pk], instance.created_at)] -= 1
+            counts[(instance.source, instance.created_at)] += 1
+    ProfessionalDailyCount.objects.apply_deltas(counts)
+    index_search_tokens([*to_update.values(), *to_create.values()])
+    return applied
+
+
+def _apply_sequential(valid, results, start):
+    applied = []
+    all_keys = normalize_keys([data for _, data in valid])
+    for (offset, data), (email_key, phone_key) in zip(valid, all_keys):
+        existing = None
+        if email_key:
+            existing = Professional.objects.filter(email_key=email_key).first()
+        if existing is None and phone_key:
+            existing = Professional.objects.filter(phone_key=phone_key).first()
+
+        instance = existing or Professional()
+        try:
+            for field, value in data.items():
+                setattr(instance, field, value)
+            instance.full_clean()
+            # save() is atomic, i.e. a savepoint inside the batch's
+            # transaction: a failed row rolls back alone.
+            instance.save()
+        except Exception as e:
+            results[offset] = {"index": start + offset, "status": "error", "errors": str(e)}
+            continue
+        applied.append((offset, "updated" if existing else "created", instance, dict(data)))
+    return applied
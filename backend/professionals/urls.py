@@ -1,8 +1,18 @@
 from django.urls import path
 
-from . import views
+from . import async_views, views
+from .instrumentation import metrics_view
 
 urlpatterns = [
     path("professionals/", views.ProfessionalListCreateView.as_view(), name="professional-list-create"),
+    path("professionals/search/", views.ProfessionalSearchView.as_view(), name="professional-search"),
+    path("professionals/stats/", views.ProfessionalStatsView.as_view(), name="professional-stats"),
+    path("professionals/changes/", views.ProfessionalChangesView.as_view(), name="professional-changes"),
+    path("professionals/export/", views.ProfessionalExportView.as_view(), name="professional-export"),
     path("professionals/bulk/", views.BulkCreateView.as_view(), name="professional-bulk"),
+    path("professionals/bulk/jobs/<int:pk>/", views.BulkImportJobDetailView.as_view(), name="professional-bulk-job"),
+    path("professionals/bulk/stream/", views.BulkStreamView.as_view(), name="professional-bulk-stream"),
+    path("metrics/", metrics_view, name="metrics"),
+    path("async/professionals/", async_views.AsyncProfessionalListCreateView.as_view(), name="async-professional-list-create"),
+    path("async/professionals/bulk/", async_views.AsyncBulkCreateView.as_view(), name="async-professional-bulk"),
 ]
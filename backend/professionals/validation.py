@@ -0,0 +1,93 @@
+import re
+
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxLengthValidator, validate_email
+
+from .models import Professional
+from .serializers import BulkProfessionalItemSerializer
+
+_ITEM_FIELDS = BulkProfessionalItemSerializer().fields
+_SOURCES = frozenset(choice for choice, _ in Professional.SOURCE_CHOICES)
+_EMAIL_MAX_LENGTH = MaxLengthValidator(Professional._meta.get_field("email").max_length)
+# DRF rejects these in CharField input; leave such rows to the serializer.
+_UNSAFE_CHARS = re.compile("[\x00\ud800-\udfff]")
+_MISSING = object()
+_INVALID = object()
+
+
+def validate_batch(items):
+    """
+    Validates a list of bulk payloads in one pass.
+
+    Rows that are plainly valid are checked inline: types, lengths, email
+    syntax, ``SOURCE_CHOICES`` membership and the email-or-phone rule.
+    Anything else goes through ``BulkProfessionalItemSerializer`` so the
+    errors keep the exact shape the endpoint has always returned. Uniqueness
+    and duplicate keys within the payload are resolved later against the
+    batch key index in ``upsert``.
+
+    Returns ``(valid, errors)``: a list of ``(offset, data)`` pairs and a dict
+    of errors by offset.
+    """
+    valid, errors = [], {}
+    for offset, item in enumerate(items):
+        data = _fast_validate(item)
+        if data is None:
+            serializer = BulkProfessionalItemSerializer(data=item)
+            if not serializer.is_valid():
+                errors[offset] = serializer.errors
+                continue
+            data = serializer.validated_data
+
+        # The model allows shorter emails than the serializer; this used to
+        # surface from full_clean(), so keep its message format.
+        if data["email"]:
+            try:
+                _EMAIL_MAX_LENGTH(data["email"])
+            except ValidationError as e:
+                errors[offset] = str(ValidationError({"email": e.error_list}))
+                continue
+        valid.append((offset, data))
+    return valid, errors
+
+
+def _text(item, name):
+    field = _ITEM_FIELDS[name]
+    value = item.get(name, _MISSING)
+    if value is _MISSING and not field.required:
+        return field.default
+    if not isinstance(value, str) or _UNSAFE_CHARS.search(value):
+        return _INVALID
+    value = value.strip()
+    if (not value and not field.allow_blank) or len(value) > (field.max_length or len(value)):
+        return _INVALID
+    return value
+
+
+def _fast_validate(item):
+    """Returns cleaned data for a plainly valid row, or None to defer to the serializer."""
+    if type(item) is not dict:
+        return None
+
+    data = {
+        name: _text(item, name)
+        for name in ("full_name", "email", "company_name", "job_title", "phone")
+    }
+    if any(value is _INVALID for value in data.values()):
+        return None
+
+    source = item.get("source")
+    if type(source) is not str or source not in _SOURCES:
+        return None
+    data["source"] = source
+
+    data["email"] = data["email"] or None
+    data["phone"] = data["phone"] or None
+    if not data["email"] and not data["phone"]:
+        return None
+    if data["email"]:
+        try:
+            validate_email(data["email"])
+        except ValidationError:
+            return None
+    return data
@@ -1,13 +1,49 @@
+from functools import partial
+
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from rest_framework import generics, status
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
-from .models import Professional
-from .serializers import BulkProfessionalItemSerializer, ProfessionalSerializer
+from .changes import DEFAULT_CHANGES_LIMIT, MAX_CHANGES_LIMIT, changes_since
+from .export import EXPORT_CHUNK_SIZE, FORMATS, export_queryset, iter_rows, parse_timestamp
+from .ingest import (
+    ATOMIC_MODES,
+    MAX_CHUNK_SIZE,
+    chunked_upsert,
+    detect_format,
+    iter_records,
+    parse_chunk_size,
+    stream_upsert,
+)
+from .instrumentation import timed_serialization
+from .jobs import enqueue_bulk_import
+from .limits import charge_rows, check_body_size, check_item_count, throttle_rows
+from .list_cache import cached_list_response
+from .models import BulkImportJob, Professional
+from .pagination import KeysetPagination
+from .replica import replica_reads
+from .search import ranked_search
+from .serializers import (
+    LIST_FIELDS,
+    BulkImportJobSerializer,
+    ProfessionalSerializer,
+    parse_list_fields,
+    serialize_professional_rows,
+)
+from .stats import DEFAULT_STATS_DAYS, MAX_STATS_DAYS, get_stats
+from .upsert import RESULT_MODES, shape_results
+
+
+def rejection_response(rejection):
+    return Response(rejection.body, status=rejection.status, headers=rejection.headers)
 
 
 class ProfessionalListCreateView(generics.ListCreateAPIView):
     serializer_class = ProfessionalSerializer
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         qs = Professional.objects.all()
@@ -16,15 +52,150 @@ class ProfessionalListCreateView(generics.ListCreateAPIView):
             qs = qs.filter(source=source)
         return qs
 
+    def list(self, request, *args, **kwargs):
+        with replica_reads(request):
+            return cached_list_response(request, partial(self.fast_list, request))
+
+    def fast_list(self, request):
+        # ``?fields=`` narrows both the SELECT and the output.
+        fields, unknown = parse_list_fields(request.query_params.get("fields"))
+        if unknown:
+            return Response(
+                {"error": f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(LIST_FIELDS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Pages always load created_at and id for the next cursor.
+        page = self.paginate_queryset(queryset.only(*fields, "created_at"))
+        if page is not None:
+            rows = [[getattr(obj, field) for field in fields] for obj in page]
+            with timed_serialization():
+                data = serialize_professional_rows(rows, fields)
+            return self.get_paginated_response(data)
+        rows = list(queryset.values_list(*fields))
+        with timed_serialization():
+            data = serialize_professional_rows(rows, fields)
+        return Response(data)
+
+
+class ProfessionalSearchView(APIView):
+    """
+    Ranked search over full name, company, job title and email.
+
+    Every word in ``q`` must match the start of a word in one of those
+    fields. Supports the ``source`` filter and ``page``/``page_size``
+    pagination; results use the same shape as the list endpoint.
+    """
+
+    page_size = 20
+    max_page_size = 100
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"error": "The q parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            page = max(int(request.query_params.get("page", 1)), 1)
+            page_size = int(request.query_params.get("page_size", self.page_size))
+        except ValueError:
+            page, page_size = 1, self.page_size
+        page_size = min(max(page_size, 1), self.max_page_size)
+
+        with replica_reads(request):
+            ids = ranked_search(
+                query,
+                source=request.query_params.get("source"),
+                limit=page_size + 1,
+                offset=(page - 1) * page_size,
+            )
+            next_link = None
+            if len(ids) > page_size:
+                ids = ids[:page_size]
+                next_link = replace_query_param(request.build_absolute_uri(), "page", page + 1)
+
+            rows = Professional.objects.filter(pk__in=ids).values_list(*LIST_FIELDS)
+            by_id = {row[0]: row for row in rows}
+        results = serialize_professional_rows(by_id[pk] for pk in ids if pk in by_id)
+        return Response({"next": next_link, "results": results})
+
+
+class ProfessionalStatsView(APIView):
+    """
+    Professionals per source and created per day over the last ``days``
+    days (default 30). Served from the maintained counter table, so the cost
+    does not grow with the number of professionals.
+    """
+
+    def get(self, request):
+        try:
+            days = int(request.query_params.get("days", DEFAULT_STATS_DAYS))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= MAX_STATS_DAYS:
+            return Response(
+                {"error": f"days must be between 1 and {MAX_STATS_DAYS}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(get_stats(days))
+
+
+class ProfessionalChangesView(APIView):
+    """
+    Incremental change feed. Returns the professionals created, updated or
+    deleted after ``since`` (a cursor from an earlier response, or 0 for
+    the full history), at most ``limit`` log entries per call.
+
+    Keep calling with the returned ``cursor`` until ``has_more`` is false.
+    """
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get("since", 0))
+            limit = int(request.query_params.get("limit", DEFAULT_CHANGES_LIMIT))
+        except ValueError:
+            since = limit = -1
+        if since < 0 or not 1 <= limit <= MAX_CHANGES_LIMIT:
+            return Response(
+                {"error": f"since must be a cursor and limit between 1 and {MAX_CHANGES_LIMIT}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results, cursor, has_more = changes_since(since, limit)
+        return Response({"cursor": str(cursor), "has_more": has_more, "results": results})
+
 
 class BulkCreateView(APIView):
     """
     Accepts a JSON list of professional profiles.
     Upserts each entry by email, falling back to phone as the unique key.
     Returns per-item results to support partial success.
+
+    Keys are resolved with a handful of IN queries and written with one
+    executemany UPDATE and a bulk_create (see ``upsert.bulk_upsert``), one
+    transaction per ``?chunk_size=`` items (default 1000). With
+    ``?atomic=all`` the whole batch is one transaction: if any item fails,
+    nothing is written and the response is 400 with the failed items.
+
+    ``?results=summary`` returns only the counts and ``?results=errors_only``
+    the counts plus the failed items, skipping the echo of every saved row.
+
+    With ``?async=true`` the batch is queued as a BulkImportJob instead and
+    the response is 202 with the job; poll BulkImportJobDetailView for
+    progress and the per-item results, kept as ``?results=`` asks.
+
+    Bodies over ``BULK_MAX_BYTES`` and batches over ``BULK_MAX_ITEMS`` get
+    413; a client over ``BULK_ROWS_PER_MINUTE`` gets 429 with Retry-After
+    (see ``limits``).
     """
 
     def post(self, request):
+        rejection = check_body_size(request)
+        if rejection:
+            return rejection_response(rejection)
         items = request.data
         if not isinstance(items, list):
             return Response(
@@ -32,48 +203,153 @@ class BulkCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        results = []
-        for idx, item_data in enumerate(items):
-            serializer = BulkProfessionalItemSerializer(data=item_data)
-            if not serializer.is_valid():
-                results.append(
-                    {"index": idx, "status": "error", "errors": serializer.errors}
+        mode = request.query_params.get("results", "full")
+        if mode not in RESULT_MODES:
+            return Response(
+                {"error": f"results must be one of: {', '.join(RESULT_MODES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        chunk_size = parse_chunk_size(request.query_params.get("chunk_size"))
+        if chunk_size is None:
+            return Response(
+                {"error": f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        atomic = request.query_params.get("atomic", "chunk")
+        if atomic not in ATOMIC_MODES:
+            return Response(
+                {"error": f"atomic must be one of: {', '.join(ATOMIC_MODES)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rejection = check_item_count(request, len(items)) or throttle_rows(request, len(items))
+        if rejection:
+            return rejection_response(rejection)
+
+        if request.query_params.get("async", "").lower() in ("1", "true"):
+            if atomic == "all":
+                return Response(
+                    {"error": "atomic=all cannot be combined with async=true."},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
-                continue
+            job = enqueue_bulk_import(items, chunk_size, results_mode=mode)
+            location = reverse("professional-bulk-job", args=[job.pk])
+            return Response(
+                BulkImportJobSerializer(job).data,
+                status=status.HTTP_202_ACCEPTED,
+                headers={"Location": request.build_absolute_uri(location)},
+            )
+
+        results, committed = chunked_upsert(items, chunk_size, echo=mode == "full", atomic=atomic)
+        if not committed:
+            failed = [result for result in results if result["status"] == "error"]
+            return Response(
+                {"error": f"Nothing was written: {len(failed)} of {len(results)} items failed.", "results": failed},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(shape_results(results, mode), status=status.HTTP_200_OK)
 
-            data = serializer.validated_data
-            existing = None
 
-            if data.get("email"):
-                existing = Professional.objects.filter(email=data["email"]).first()
-            if existing is None and data.get("phone"):
-                existing = Professional.objects.filter(phone=data["phone"]).first()
+class BulkImportJobDetailView(generics.RetrieveAPIView):
+    queryset = BulkImportJob.objects.all()
+    serializer_class = BulkImportJobSerializer
 
-            try:
-                if existing:
-                    for field, value in data.items():
-                        setattr(existing, field, value)
-                    existing.full_clean()
-                    existing.save()
-                    results.append(
-                        {
-                            "index": idx,
-                            "status": "updated",
-                            "professional": ProfessionalSerializer(existing).data,
-                        }
-                    )
-                else:
-                    prof = Professional(**data)
-                    prof.full_clean()
-                    prof.save()
-                    results.append(
-                        {
-                            "index": idx,
-                            "status": "created",
-                            "professional": ProfessionalSerializer(prof).data,
-                        }
+
+class BulkStreamView(APIView):
+    """
+    Accepts an NDJSON or CSV body (by Content-Type) of professional profiles.
+    Reads the body incrementally and upserts it in fixed-size chunks with the
+    same rules as BulkCreateView, streaming back one NDJSON line of per-item
+    results per chunk and a final summary line.
+
+    There is no size cap, but rows count against the client's row rate as
+    they are read: the stream is refused with 429 while the client is in
+    debt, and a long stream may put it there.
+    """
+
+    def post(self, request):
+        fmt = detect_format(request.content_type)
+        if fmt is None:
+            return Response(
+                {"error": "Expected an NDJSON or CSV request body."},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+
+        chunk_size = parse_chunk_size(request.query_params.get("chunk_size"))
+        if chunk_size is None:
+            return Response(
+                {"error": f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rejection = throttle_rows(request, 0)
+        if rejection:
+            return rejection_response(rejection)
+
+        records = iter_records(request.stream or [], fmt)
+        return StreamingHttpResponse(
+            stream_upsert(records, chunk_size, on_chunk=partial(charge_rows, request)),
+            content_type="application/x-ndjson",
+        )
+
+
+class ProfessionalExportView(APIView):
+    """
+    Streams the whole table, or a ``source``/``created_at`` slice of it, for
+    bulk pulls. ``?format=`` is ``csv`` (default), ``ndjson`` or, when
+    pyarrow is installed, ``arrow`` (an Arrow IPC stream).
+
+    Rows come oldest first through a chunked server-side iterator, so memory
+    stays flat whatever the table size. ``created_after`` (inclusive) and
+    ``created_before`` (exclusive) bound the range; for incremental pulls
+    pass the ``X-Export-Watermark`` of the previous response as ``since``.
+    """
+
+    TIMESTAMP_PARAMS = ("created_after", "created_before")
+
+    def perform_content_negotiation(self, request, force=False):
+        # ``format`` picks the export encoding, not a DRF renderer.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request):
+        fmt = request.query_params.get("format", "csv")
+        if fmt not in FORMATS:
+            return Response(
+                {"error": f"format must be one of: {', '.join(FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        bounds = {}
+        for name in self.TIMESTAMP_PARAMS:
+            value = request.query_params.get(name)
+            if value:
+                bounds[name] = parse_timestamp(value)
+                if bounds[name] is None:
+                    return Response(
+                        {"error": f"{name} must be an ISO 8601 date or datetime."},
+                        status=status.HTTP_400_BAD_REQUEST,
                     )
-            except Exception as e:
-                results.append({"index": idx, "status": "error", "errors": str(e)})
 
-        return Response({"results": results}, status=status.HTTP_200_OK)
+        if "since" in request.query_params:
+            try:
+                bounds["since"] = int(request.query_params["since"])
+            except ValueError:
+                bounds["since"] = -1
+            if bounds["since"] < 0:
+                return Response(
+                    {"error": "since must be the X-Export-Watermark of an earlier export."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        with replica_reads(request):
+            queryset, watermark = export_queryset(
+                source=request.query_params.get("source"), **bounds
+            )
+        content_type, write = FORMATS[fmt]
+        response = StreamingHttpResponse(
+            write(iter_rows(queryset, EXPORT_CHUNK_SIZE)), content_type=content_type
+        )
+        response["Content-Disposition"] = f'attachment; filename="professionals.{fmt}"'
+        response["X-Export-Watermark"] = str(watermark)
+        return response
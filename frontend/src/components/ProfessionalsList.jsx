@@ -1,21 +1,61 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import api from "../api";
 
+const PAGE_SIZE = 100;
+const SOURCES = [
+  ["direct", "Direct"],
+  ["partner", "Partner"],
+  ["internal", "Internal"],
+];
+
 export default function ProfessionalsList({ refreshKey }) {
   const [professionals, setProfessionals] = useState([]);
   const [sourceFilter, setSourceFilter] = useState("");
   const [loading, setLoading] = useState(false);
+  const [nextUrl, setNextUrl] = useState(null);
+  const [stats, setStats] = useState(null);
+  const [error, setError] = useState(null);
+  // Numbers each list request; a response is applied only if no request
+  // started after it, so a slow page never lands in a newer list.
+  const latestRequest = useRef(0);
 
   const fetchData = async (source) => {
+    const request = ++latestRequest.current;
     setLoading(true);
+    setError(null);
     try {
-      const params = source ? { source } : {};
+      const params = { page_size: PAGE_SIZE };
+      if (source) params.source = source;
       const res = await api.get("/professionals/", { params });
-      setProfessionals(res.data);
+      if (request !== latestRequest.current) return;
+      setProfessionals(res.data.results);
+      setNextUrl(res.data.next);
     } catch {
+      if (request !== latestRequest.current) return;
       setProfessionals([]);
+      setNextUrl(null);
+      setError("Could not load professionals.");
+    } finally {
+      if (request === latestRequest.current) setLoading(false);
+    }
+  };
+
+  const loadMore = async () => {
+    if (!nextUrl) return;
+    const request = ++latestRequest.current;
+    setLoading(true);
+    setError(null);
+    try {
+      const res = await api.get(nextUrl);
+      if (request !== latestRequest.current) return;
+      setProfessionals((prev) => [...prev, ...res.data.results]);
+      setNextUrl(res.data.next);
+    } catch {
+      if (request !== latestRequest.current) return;
+      // Keep the rows and the next link, so "Load more" can retry.
+      setError("Could not load more professionals.");
     } finally {
-      setLoading(false);
+      if (request === latestRequest.current) setLoading(false);
     }
   };
 
@@ -23,7 +63,19 @@ export default function ProfessionalsList({ refreshKey }) {
     fetchData(sourceFilter);
   }, [sourceFilter, refreshKey]);
 
+  useEffect(() => {
+    api
+      .get("/professionals/stats/", { params: { days: 1 } })
+      .then((res) => setStats(res.data))
+      .catch(() => setStats(null));
+  }, [refreshKey]);
+
+  const withCount = (label, count) =>
+    stats ? `${label} (${count})` : label;
+
   const handleFilterChange = (e) => {
+    // The next link belongs to the old filter's list.
+    setNextUrl(null);
     setSourceFilter(e.target.value);
   };
 
@@ -34,15 +86,19 @@ export default function ProfessionalsList({ refreshKey }) {
         <label className="filter-label">
           Filter by source:
           <select value={sourceFilter} onChange={handleFilterChange}>
-            <option value="">All</option>
-            <option value="direct">Direct</option>
-            <option value="partner">Partner</option>
-            <option value="internal">Internal</option>
+            <option value="">{withCount("All", stats?.total)}</option>
+            {SOURCES.map(([value, label]) => (
+              <option key={value} value={value}>
+                {withCount(label, stats?.by_source[value])}
+              </option>
+            ))}
           </select>
         </label>
       </div>
 
-      {loading ? (
+      {error && <div className="error">{error}</div>}
+
+      {loading && professionals.length === 0 ? (
         <p className="loading">Loading…</p>
       ) : professionals.length === 0 ? (
         <p className="empty">No professionals found.</p>
@@ -78,6 +134,11 @@ export default function ProfessionalsList({ refreshKey }) {
               ))}
             </tbody>
           </table>
+          {nextUrl && (
+            <button className="load-more" onClick={loadMore} disabled={loading}>
+              {loading ? "Loading…" : "Load more"}
+            </button>
+          )}
         </div>
       )}
     </div>